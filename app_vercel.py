@@ -1,93 +1,11 @@
-from flask import Flask, render_template, request, redirect, url_for, session, flash, jsonify
-from authlib.integrations.flask_client import OAuth
-from dotenv import load_dotenv
-import requests
-import sqlite3
-import json
-import os
-from werkzeug.security import generate_password_hash, check_password_hash
-from datetime import datetime, timedelta
-import random
+"""
+Alternate Vercel entry point, kept for existing deployments
+Same app as index.py; schema setup is handled per worker by backend/db.py.
+"""
 
-# Load environment once
-load_dotenv()
+from backend.factory import create_app
 
-# Create Flask app with correct paths for Vercel
-app = Flask(__name__, 
-           template_folder="frontend/templates", 
-           static_folder="frontend/static")
-app.secret_key = os.environ.get('SECRET_KEY', 'your-secret-key-change-in-production')
-
-# OAuth configuration (Google)
-oauth = OAuth(app)
-app.config['GOOGLE_CLIENT_ID'] = os.environ.get('GOOGLE_CLIENT_ID', '')
-app.config['GOOGLE_CLIENT_SECRET'] = os.environ.get('GOOGLE_CLIENT_SECRET', '')
-GEMINI_API_KEY = os.environ.get('GEMINI_API_KEY', '')
-GEMINI_MODEL = os.environ.get('GEMINI_MODEL', 'gemini-2.0-flash')
-
-if app.config['GOOGLE_CLIENT_ID'] and app.config['GOOGLE_CLIENT_SECRET']:
-    oauth.register(
-        name='google',
-        client_id=app.config['GOOGLE_CLIENT_ID'],
-        client_secret=app.config['GOOGLE_CLIENT_SECRET'],
-        server_metadata_url='https://accounts.google.com/.well-known/openid-configuration',
-        client_kwargs={'scope': 'openid email profile'}
-    )
-
-# Database initialization
-def init_db():
-    """Initialize the SQLite database with required tables"""
-    conn = sqlite3.connect('interview_prep.db')
-    cursor = conn.cursor()
-    
-    # Users table
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS users (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            name TEXT NOT NULL,
-            email TEXT UNIQUE NOT NULL,
-            password_hash TEXT NOT NULL,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-        )
-    ''')
-    
-    # Attempts table for tracking user practice
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS attempts (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            user_id INTEGER NOT NULL,
-            question_id INTEGER NOT NULL,
-            correct BOOLEAN NOT NULL,
-            user_answer TEXT,
-            mock_session_id INTEGER,
-            timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            FOREIGN KEY (user_id) REFERENCES users (id)
-        )
-    ''')
-    
-    # Mock interview sessions
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS mock_sessions (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            user_id INTEGER NOT NULL,
-            start_time TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            end_time TIMESTAMP,
-            total_questions INTEGER DEFAULT 0,
-            correct_answers INTEGER DEFAULT 0,
-            FOREIGN KEY (user_id) REFERENCES users (id)
-        )
-    ''')
-    
-    conn.commit()
-    conn.close()
-
-# Initialize database on startup
-init_db()
-
-# Import all routes from the original app
-import sys
-sys.path.append('backend')
-from backend.app import *
+app = create_app()
 
 # For Vercel deployment
 if __name__ == '__main__':
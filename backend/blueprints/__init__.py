@@ -0,0 +1,21 @@
+"""
+Blueprints - one per feature area, registered by create_app()
+"""
+
+from . import ai_interview, auth, dashboard, main, mock, practice, resume, roadmap
+
+BLUEPRINTS = (
+    main.bp,
+    auth.bp,
+    dashboard.bp,
+    practice.bp,
+    mock.bp,
+    ai_interview.bp,
+    resume.bp,
+    roadmap.bp,
+)
+
+
+def register_blueprints(app):
+    for bp in BLUEPRINTS:
+        app.register_blueprint(bp)
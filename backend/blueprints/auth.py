@@ -0,0 +1,128 @@
+"""
+Auth blueprint - email/password and Google sign-in
+"""
+
+from flask import Blueprint, current_app, flash, redirect, render_template, request, session, url_for
+from ..db import users
+from ..services.password_hasher import HasherOverloaded
+
+bp = Blueprint('auth', __name__)
+
+
+def google_oauth():
+    """Google OAuth client, or None when not configured.
+
+    authlib is imported on first use so workers that never see a Google
+    sign-in don't pay for it at startup.
+    """
+    app = current_app._get_current_object()
+    if not (app.config['GOOGLE_CLIENT_ID'] and app.config['GOOGLE_CLIENT_SECRET']):
+        return None
+    oauth = app.extensions.get('authlib.integrations.flask_client')
+    if oauth is None:
+        from authlib.integrations.flask_client import OAuth
+        oauth = OAuth(app)
+        oauth.register(
+            name='google',
+            client_id=app.config['GOOGLE_CLIENT_ID'],
+            client_secret=app.config['GOOGLE_CLIENT_SECRET'],
+            server_metadata_url='https://accounts.google.com/.well-known/openid-configuration',
+            client_kwargs={'scope': 'openid email profile'}
+        )
+    return oauth.google
+
+def _busy(template):
+    """503 for a sign-in the password hashing pool has no room for"""
+    flash('We are handling a lot of sign-ins right now. Please try again in a moment.', 'error')
+    return render_template(template), 503, {'Retry-After': '2'}
+
+@bp.route('/login', methods=['GET', 'POST'])
+def login():
+    """Login page and authentication"""
+    if request.method == 'POST':
+        email = request.form['email']
+        password = request.form['password']
+
+        try:
+            user = users().authenticate_user(email, password)
+        except HasherOverloaded:
+            return _busy('login.html')
+
+        if user:
+            session['user_id'] = user['id']
+            session['user_name'] = user['name']
+            flash('Login successful!', 'success')
+            return redirect(url_for('dashboard.dashboard'))
+        else:
+            flash('Invalid email or password', 'error')
+
+    return render_template('login.html')
+
+@bp.route('/register', methods=['GET', 'POST'])
+def register():
+    """Registration page and user creation"""
+    if request.method == 'POST':
+        name = request.form['name']
+        email = request.form['email']
+        password = request.form['password']
+
+        # Hashes the password; None means the email is already registered
+        try:
+            user_id = users().create_user(name, email, password)
+        except HasherOverloaded:
+            return _busy('register.html')
+        if user_id:
+            flash('Registration successful! Please login.', 'success')
+            return redirect(url_for('auth.login'))
+        flash('Email already exists', 'error')
+
+    return render_template('register.html')
+
+@bp.route('/login/google')
+def login_google():
+    """Redirect user to Google OAuth"""
+    google = google_oauth()
+    if google is None:
+        flash('Google Sign-In not configured on server', 'error')
+        return redirect(url_for('auth.login'))
+    redirect_uri = url_for('auth.auth_google_callback', _external=True)
+    return google.authorize_redirect(redirect_uri)
+
+@bp.route('/auth/google/callback')
+def auth_google_callback():
+    """Google OAuth callback handler"""
+    google = google_oauth()
+    if google is None:
+        flash('Google Sign-In not configured on server', 'error')
+        return redirect(url_for('auth.login'))
+    # Handle error or missing code gracefully
+    if 'error' in request.args:
+        flash(request.args.get('error_description', request.args.get('error', 'Google sign-in cancelled')), 'error')
+        return redirect(url_for('auth.login'))
+    if 'code' not in request.args:
+        flash('Invalid OAuth response. Please try signing in again.', 'error')
+        return redirect(url_for('auth.login'))
+
+    token = google.authorize_access_token()
+    userinfo = token.get('userinfo') or google.parse_id_token(token)
+    if not userinfo:
+        flash('Failed to fetch profile from Google', 'error')
+        return redirect(url_for('auth.login'))
+
+    email = userinfo.get('email')
+    name = userinfo.get('name') or email.split('@')[0]
+
+    # Ensure local user exists
+    user_id, user_name = users().get_or_create(email, name, 'google-oauth')
+
+    session['user_id'] = user_id
+    session['user_name'] = user_name
+    flash('Logged in with Google', 'success')
+    return redirect(url_for('dashboard.dashboard'))
+
+@bp.route('/logout')
+def logout():
+    """Logout and clear session"""
+    session.clear()
+    flash('You have been logged out', 'info')
+    return redirect(url_for('main.home'))
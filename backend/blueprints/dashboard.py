@@ -0,0 +1,242 @@
+"""
+Dashboard blueprint - progress, feedback and stats
+"""
+
+import base64
+from datetime import date, datetime, timedelta
+
+from flask import Blueprint, current_app, flash, jsonify, redirect, render_template, request, session, url_for
+
+from ..db import attempts, mock_sessions, replica_reads
+from ..services.json_codec import loads
+from ..services.leaderboard import BOARDS
+
+bp = Blueprint('dashboard', __name__)
+
+
+def compute_streak(practice_dates, today=None):
+    """Consecutive practice days ending today, from DATE() strings sorted newest first"""
+    current_streak = 0
+    current_date = today or date.today()
+    for practice_date in practice_dates:
+        if datetime.strptime(practice_date, '%Y-%m-%d').date() != current_date:
+            break
+        current_streak += 1
+        current_date -= timedelta(days=1)
+    return current_streak
+
+@bp.route('/dashboard')
+@replica_reads
+def dashboard():
+    """User dashboard - requires authentication"""
+    if 'user_id' not in session:
+        flash('Please login to access dashboard', 'error')
+        return redirect(url_for('auth.login'))
+
+    # Get user statistics
+    user_id = session['user_id']
+    attempt_stats = attempts().get_user_stats(user_id)
+    total_attempted = attempt_stats['total_attempted']
+    correct_answers = attempt_stats['correct_answers']
+
+    # Total mock interviews taken
+    total_interviews = mock_sessions().count_for_user(user_id)
+
+    # Recent mock interview performance
+    recent_interviews = mock_sessions().recent(user_id, limit=5)
+
+    # Calculate total study time (approximate based on attempts)
+    total_study_time = total_attempted * 5  # Assume 5 minutes per question
+
+    # Get weak topics (topics with most incorrect answers)
+    weak_topics = [{'name': topic, 'count': count}
+                   for topic, count in attempts().get_weak_topics(user_id, limit=3)]
+
+    # Calculate accuracy
+    accuracy = attempt_stats['accuracy']
+
+    # Calculate score out of 10
+    score_out_of_10 = round((accuracy / 100) * 10, 1)
+
+    # Get streak information (consecutive days with practice)
+    current_streak = compute_streak(attempts().practice_dates(user_id))
+
+    stats = {
+        'total_attempted': total_attempted,
+        'correct_answers': correct_answers,
+        'accuracy': round(accuracy, 1),
+        'score_out_of_10': score_out_of_10,
+        'total_interviews': total_interviews,
+        'total_study_time': total_study_time,
+        'current_streak': current_streak,
+        'weak_topics': weak_topics,
+        'recent_interviews': recent_interviews
+    }
+
+    return render_template('dashboard.html', stats=stats)
+
+FEEDBACK_PAGE_SIZE = 20
+FEEDBACK_MAX_PAGE_SIZE = 100
+
+
+def encode_cursor(timestamp, attempt_id):
+    """Opaque page token for the (timestamp, id) of a page's last attempt"""
+    return base64.urlsafe_b64encode(f'{timestamp}|{attempt_id}'.encode()).decode().rstrip('=')
+
+
+def decode_cursor(cursor):
+    """(timestamp, id) from encode_cursor(); ValueError when malformed"""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4)).decode()
+        timestamp, attempt_id = raw.rsplit('|', 1)
+        return timestamp, int(attempt_id)
+    except (ValueError, UnicodeDecodeError) as e:
+        raise ValueError('invalid cursor') from e
+
+
+def _history_filters(args):
+    """Keyword arguments for Attempt.history() from ?correct=&topic=&from=&to= (ValueError when invalid)"""
+    filters = {}
+    correct = args.get('correct', '').lower()
+    if correct in ('true', '1', 'correct'):
+        filters['correct'] = True
+    elif correct in ('false', '0', 'incorrect'):
+        filters['correct'] = False
+    elif correct not in ('', 'all'):
+        raise ValueError('correct must be true or false')
+    if args.get('topic'):
+        filters['topic'] = args['topic']
+    # Timestamps are 'YYYY-MM-DD HH:MM:SS' text, so day bounds compare as strings
+    if args.get('from'):
+        filters['since'] = datetime.strptime(args['from'], '%Y-%m-%d').strftime('%Y-%m-%d')
+    if args.get('to'):
+        filters['until'] = (datetime.strptime(args['to'], '%Y-%m-%d') + timedelta(days=1)).strftime('%Y-%m-%d')
+    return filters
+
+
+def _feedback_item(row):
+    attempt_id, question_id, correct, user_answer, timestamp, qtype, difficulty, topic, text, answer, hints, tags = row
+    if text is not None:
+        question = {'id': question_id, 'type': qtype, 'difficulty': difficulty, 'topic': topic,
+                    'question': text, 'answer': answer or '', 'hints': hints, 'tags': loads(tags) if tags else []}
+    else:
+        # AI interview rounds store {"q", "a", "feedback"} in user_answer instead of a bank question
+        record = {}
+        if user_answer and user_answer.startswith('{'):
+            try:
+                record = loads(user_answer)
+            except ValueError:
+                record = {}
+        if record:
+            evaluation = record.get('feedback') or {}
+            question = {'id': question_id, 'type': 'interview', 'difficulty': 'n/a', 'topic': None,
+                        'question': record.get('q') or 'Interview question', 'answer': evaluation.get('ideal_answer') or '',
+                        'hints': '; '.join(evaluation.get('improvements') or []), 'tags': []}
+            user_answer = record.get('a', '')
+        else:
+            # Client-side practice problems are not in the bank
+            question = {'id': question_id, 'type': 'practice', 'difficulty': 'n/a', 'topic': None,
+                        'question': f'Practice question #{question_id}', 'answer': '', 'hints': None, 'tags': []}
+    return {
+        'attempt_id': attempt_id,
+        'question': question,
+        'correct': bool(correct),
+        'user_answer': user_answer,
+        'timestamp': timestamp
+    }
+
+
+def load_feedback(user_id, args, limit=FEEDBACK_PAGE_SIZE):
+    """(items, next_cursor) for one feedback page; ValueError on bad cursor or filters"""
+    filters = _history_filters(args)
+    before = decode_cursor(args['cursor']) if args.get('cursor') else None
+    rows = attempts().history(user_id, limit=limit + 1, before=before, **filters)
+    next_cursor = encode_cursor(rows[limit - 1][4], rows[limit - 1][0]) if len(rows) > limit else None
+    return [_feedback_item(row) for row in rows[:limit]], next_cursor
+
+
+@bp.route('/feedback')
+@replica_reads
+def feedback():
+    """Show detailed feedback for user attempts"""
+    if 'user_id' not in session:
+        flash('Please login to view feedback', 'error')
+        return redirect(url_for('auth.login'))
+
+    try:
+        feedback_data, next_cursor = load_feedback(session['user_id'], request.args)
+    except ValueError:
+        flash('Invalid feedback filter or page', 'error')
+        return redirect(url_for('dashboard.feedback'))
+
+    page_args = {k: v for k, v in request.args.items() if k != 'cursor' and v}
+    return render_template('feedback.html', feedback_data=feedback_data, next_cursor=next_cursor,
+                           page_args=page_args, is_first_page=not request.args.get('cursor'))
+
+
+@bp.route('/api/feedback')
+@replica_reads
+def api_feedback():
+    """Attempt history, newest first: ?cursor=&limit=&correct=&topic=&from=YYYY-MM-DD&to=YYYY-MM-DD"""
+    if 'user_id' not in session:
+        return jsonify({'error': 'Not authenticated'}), 401
+
+    limit = request.args.get('limit', FEEDBACK_PAGE_SIZE, type=int)
+    if not 1 <= limit <= FEEDBACK_MAX_PAGE_SIZE:
+        return jsonify({'error': f'limit must be between 1 and {FEEDBACK_MAX_PAGE_SIZE}'}), 400
+    try:
+        items, next_cursor = load_feedback(session['user_id'], request.args, limit=limit)
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    return jsonify({'items': items, 'next_cursor': next_cursor})
+
+ANALYTICS_DAYS = 30
+ANALYTICS_MAX_DAYS = 365
+
+
+@bp.route('/api/analytics')
+@replica_reads
+def api_analytics():
+    """Accuracy by topic, tag and difficulty with trends, and a daily series: ?days="""
+    if 'user_id' not in session:
+        return jsonify({'error': 'Not authenticated'}), 401
+
+    days = request.args.get('days', ANALYTICS_DAYS, type=int)
+    if not 1 <= days <= ANALYTICS_MAX_DAYS:
+        return jsonify({'error': f'days must be between 1 and {ANALYTICS_MAX_DAYS}'}), 400
+    return jsonify(current_app.extensions['analytics'].for_user(session['user_id'], days))
+
+LEADERBOARD_SIZE = 10
+LEADERBOARD_MAX_SIZE = 100
+
+
+@bp.route('/api/leaderboard')
+@replica_reads
+def api_leaderboard():
+    """Top users and the caller's rank/percentile: ?board=accuracy|streak&limit="""
+    if 'user_id' not in session:
+        return jsonify({'error': 'Not authenticated'}), 401
+
+    board = request.args.get('board', 'accuracy')
+    if board not in BOARDS:
+        return jsonify({'error': f"board must be one of: {', '.join(BOARDS)}"}), 400
+    limit = request.args.get('limit', LEADERBOARD_SIZE, type=int)
+    if not 1 <= limit <= LEADERBOARD_MAX_SIZE:
+        return jsonify({'error': f'limit must be between 1 and {LEADERBOARD_MAX_SIZE}'}), 400
+    return jsonify(current_app.extensions['leaderboard'].standings(board, session['user_id'], limit))
+
+@bp.route('/api/stats')
+@replica_reads
+def api_stats():
+    """API endpoint to get user statistics"""
+    if 'user_id' not in session:
+        return jsonify({'error': 'Not authenticated'}), 401
+
+    stats = attempts().get_user_stats(session['user_id'])
+
+    return jsonify({
+        'total_attempted': stats['total_attempted'],
+        'correct_answers': stats['correct_answers'],
+        'accuracy': round(stats['accuracy'], 1),
+        'weak_topics': []  # Will be populated later
+    })
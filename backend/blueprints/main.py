@@ -0,0 +1,99 @@
+"""
+Main blueprint - public pages and error handlers
+"""
+
+from flask import Blueprint, flash, redirect, render_template, session, url_for
+
+from ..services.page_cache import cached_page
+
+bp = Blueprint('main', __name__)
+
+# Learning resources catalog (the same for every visitor)
+RESOURCES = {
+    'technical': [
+        {
+            'title': 'LeetCode',
+            'description': 'Practice coding problems and algorithms',
+            'url': 'https://leetcode.com',
+            'type': 'Practice Platform'
+        },
+        {
+            'title': 'Cracking the Coding Interview',
+            'description': 'Comprehensive interview preparation book',
+            'url': 'https://www.crackingthecodinginterview.com',
+            'type': 'Book'
+        },
+        {
+            'title': 'System Design Primer',
+            'description': 'Learn system design concepts and patterns',
+            'url': 'https://github.com/donnemartin/system-design-primer',
+            'type': 'GitHub Repository'
+        }
+    ],
+    'behavioral': [
+        {
+            'title': 'STAR Method Guide',
+            'description': 'Structure your behavioral interview answers',
+            'url': 'https://www.indeed.com/career-advice/interviewing/how-to-use-the-star-interview-response-technique',
+            'type': 'Article'
+        },
+        {
+            'title': 'Common Behavioral Questions',
+            'description': 'Prepare for typical behavioral interview questions',
+            'url': 'https://www.glassdoor.com/blog/behavioral-interview-questions/',
+            'type': 'Article'
+        }
+    ],
+    'general': [
+        {
+            'title': 'Interview Tips and Strategies',
+            'description': 'General advice for interview success',
+            'url': 'https://www.indeed.com/career-advice/interviewing',
+            'type': 'Resource Hub'
+        },
+        {
+            'title': 'Salary Negotiation Guide',
+            'description': 'Learn how to negotiate your offer',
+            'url': 'https://www.kalzumeus.com/2012/01/23/salary-negotiation/',
+            'type': 'Article'
+        }
+    ]
+}
+
+
+@bp.route('/')
+@cached_page
+def home():
+    """Home page route"""
+    return render_template('home.html')
+
+@bp.route('/features')
+@cached_page
+def features():
+    """Features showcase page"""
+    return render_template('features.html')
+
+@bp.route('/resources')
+@cached_page
+def resources():
+    """Learning resources page"""
+    return render_template('resources.html', resources=RESOURCES)
+
+@bp.route('/calendar')
+def calendar():
+    """Interview calendar page"""
+    if 'user_id' not in session:
+        flash('Please login to access calendar', 'error')
+        return redirect(url_for('auth.login'))
+    return render_template('calendar.html')
+
+# Error handlers
+@bp.app_errorhandler(404)
+def not_found_error(error):
+    """Handle 404 errors"""
+    return render_template('errors/404.html'), 404
+
+@bp.app_errorhandler(500)
+def internal_error(error):
+    """Handle 500 errors"""
+    return render_template('errors/500.html'), 500
@@ -0,0 +1,163 @@
+"""
+Mock blueprint - timed mock interview sessions
+"""
+
+import random
+from datetime import datetime
+
+from flask import Blueprint, flash, jsonify, redirect, render_template, request, session, url_for
+
+from ..db import attempt_writer, attempts, mock_sessions, record_attempt, replica_reads, reviews
+from ..services.question_bank import load_questions
+
+bp = Blueprint('mock', __name__)
+
+
+def parse_sqlite_ts(ts):
+    """Parse SQLite's "YYYY-MM-DD HH:MM:SS" timestamps, falling back to ISO 8601"""
+    if not ts:
+        return None
+    try:
+        return datetime.strptime(ts, '%Y-%m-%d %H:%M:%S')
+    except Exception:
+        try:
+            return datetime.fromisoformat(ts.replace('Z', '+00:00'))
+        except Exception:
+            return None
+
+@bp.route('/mock')
+def mock_interview():
+    """Start mock interview session"""
+    if 'user_id' not in session:
+        flash('Please login to access mock interview', 'error')
+        return redirect(url_for('auth.login'))
+
+    # Create new mock session
+    mock_session_id = mock_sessions().create(session['user_id'])
+
+    session['mock_session_id'] = mock_session_id
+    session['mock_start_time'] = datetime.now().isoformat()
+    session['mock_questions_answered'] = 0
+
+    return render_template('mock_interview.html', session_id=mock_session_id)
+
+@bp.route('/mock/question')
+def mock_question():
+    """Get next question for mock interview"""
+    if 'user_id' not in session or 'mock_session_id' not in session:
+        return jsonify({'error': 'No active mock session'}), 400
+
+    questions = load_questions()
+    if not questions:
+        return jsonify({'error': 'No questions available'}), 404
+
+    # The most overdue spaced-repetition review first; a random question when nothing is due
+    by_id = {q['id']: q for q in questions}
+    for row in reviews().due(session['user_id'], limit=5):
+        if row[0] in by_id:
+            return jsonify({'question': by_id[row[0]], 'review': True})
+    question = random.choice(questions)
+    return jsonify({'question': question, 'review': False})
+
+@bp.route('/mock/submit', methods=['POST'])
+def mock_submit_answer():
+    """Submit answer during mock interview"""
+    if 'user_id' not in session or 'mock_session_id' not in session:
+        return jsonify({'error': 'No active mock session'}), 400
+
+    data = request.get_json()
+    question_id = data.get('question_id')
+    user_answer = data.get('user_answer', '')
+    time_taken = data.get('time_taken', 0)
+    if (isinstance(question_id, bool) or not isinstance(question_id, int)
+            or question_id not in attempts().bank_question_ids([question_id])):
+        return jsonify({'error': 'question_id must be a question from the bank'}), 400
+
+    # For simplicity, we'll mark as correct if user provided an answer
+    correct = len(user_answer.strip()) > 10  # Basic check for substantial answer
+
+    # Save attempt
+    record_attempt(session['user_id'], question_id, correct, user_answer,
+                   mock_session_id=session['mock_session_id'])
+
+    # Update session counter
+    session['mock_questions_answered'] = session.get('mock_questions_answered', 0) + 1
+
+    return jsonify({
+        'success': True,
+        'correct': correct,
+        'questions_answered': session['mock_questions_answered']
+    })
+
+@bp.route('/mock/end', methods=['POST'])
+def end_mock_interview():
+    """End mock interview session"""
+    if 'user_id' not in session or 'mock_session_id' not in session:
+        return jsonify({'error': 'No active mock session'}), 400
+
+    mock_session_id = session['mock_session_id']
+    questions_answered = session.get('mock_questions_answered', 0)
+
+    # Answers still in the write-behind queue (ATTEMPT_WRITE_MODE=async) must be counted too
+    attempt_writer().flush()
+
+    # Prefer counting correct answers tied to this mock session; fallback to old time-window if none
+    correct_answers = attempts().count_correct_in_session(session['user_id'], mock_session_id)
+
+    if correct_answers == 0 and questions_answered == 0:
+        # Fallback (legacy behavior): approximate by recent attempts in last 30 minutes
+        recent_answered, correct_answers = attempts().counts_since(session['user_id'], minutes=30)
+        # Attempt to infer questions_answered if none set
+        questions_answered = session.get('mock_questions_answered', 0) or recent_answered
+
+    # Update mock session
+    mock_sessions().end(mock_session_id, questions_answered, correct_answers)
+
+    # Clear session variables
+    session.pop('mock_session_id', None)
+    session.pop('mock_start_time', None)
+    session.pop('mock_questions_answered', None)
+
+    score_pct = round((correct_answers / questions_answered * 100) if questions_answered > 0 else 0, 1)
+    return jsonify({
+        'success': True,
+        'total_questions': questions_answered,
+        'correct_answers': correct_answers,
+        'score': score_pct
+    })
+
+@bp.route('/mock/results')
+@replica_reads
+def mock_results():
+    """Show mock interview results"""
+    if 'user_id' not in session:
+        flash('Please login to view results', 'error')
+        return redirect(url_for('auth.login'))
+
+    # Get latest mock session
+    result = mock_sessions().latest(session['user_id'])
+
+    if not result:
+        flash('No mock interview session found', 'error')
+        return redirect(url_for('dashboard.dashboard'))
+
+    total_questions, correct_answers, start_time, end_time = result
+    score = round((correct_answers / total_questions * 100) if total_questions > 0 else 0, 1)
+
+    # Calculate duration
+    start_dt = parse_sqlite_ts(start_time)
+    end_dt = parse_sqlite_ts(end_time)
+
+    if start_dt and end_dt:
+        duration = str(end_dt - start_dt).split('.')[0]  # Remove microseconds
+    else:
+        duration = "Unknown"
+
+    results = {
+        'total_questions': total_questions,
+        'correct_answers': correct_answers,
+        'score': score,
+        'duration': duration
+    }
+
+    return render_template('mock_results.html', results=results)
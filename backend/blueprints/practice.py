@@ -0,0 +1,234 @@
+"""
+Practice blueprint - question practice, answer submission and AI helpers
+"""
+
+from datetime import datetime, timezone
+
+from flask import Blueprint, current_app, flash, jsonify, redirect, render_template, request, session, url_for
+
+from ..db import attempts, record_attempt, replica_reads, reviews
+from ..services.gemini_client import ask_gemini, gemini_post, gemini_text
+from ..services.json_codec import parse_llm_json
+from ..services.metrics import track_gemini
+
+bp = Blueprint('practice', __name__)
+
+
+@bp.route("/practice")
+def practice_page():
+    if "user_id" not in session:
+        return redirect(url_for("auth.login"))
+    return render_template("practice.html")
+
+@bp.route('/custom')
+def custom_practice():
+    """Custom practice session"""
+    if 'user_id' not in session:
+        flash('Please login to access custom practice', 'error')
+        return redirect(url_for('auth.login'))
+
+    return render_template('custom_practice.html')
+
+# Old practice API endpoint removed - now using client-side DSA questions
+
+@bp.route('/submit-answer', methods=['POST'])
+def submit_answer():
+    """Submit answer for a question"""
+    if 'user_id' not in session:
+        return jsonify({'error': 'Not authenticated'}), 401
+
+    data = request.get_json()
+    question_id = data.get('question_id')
+    correct = data.get('correct', False)
+    user_answer = data.get('user_answer', '')
+    if (isinstance(question_id, bool) or not isinstance(question_id, int)
+            or question_id not in attempts().bank_question_ids([question_id])):
+        return jsonify({'error': 'question_id must be a question from the bank'}), 400
+
+    # Save attempt to database (no mock session in this path)
+    record_attempt(session['user_id'], question_id, correct, user_answer)
+
+    return jsonify({'success': True, 'message': 'Answer submitted successfully'})
+
+MAX_ANSWER_CHARS = 20000
+
+
+def _attempt_timestamp(value, now):
+    """answered_at (epoch milliseconds from the browser) as UTC text; None for now or the future"""
+    if value is None:
+        return None
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        raise ValueError('answered_at must be epoch milliseconds')
+    answered = datetime.fromtimestamp(value / 1000.0, timezone.utc)
+    return None if answered >= now else answered.strftime('%Y-%m-%d %H:%M:%S')
+
+
+def parse_attempt_batch(items, user_id, limit, bank_question_ids=None):
+    """Validate a whole batch in one pass: (rows for Attempt.insert_many, [{index, error}]).
+
+    `bank_question_ids(ids)` returns the ids that exist in the question bank
+    (Attempt.bank_question_ids); other non-zero ids are rejected. 0 is an
+    answer without a bank question (AI interview).
+    """
+    if not isinstance(items, list) or not items:
+        return [], [{'index': None, 'error': 'attempts must be a non-empty array'}]
+    if len(items) > limit:
+        return [], [{'index': None, 'error': f'at most {limit} attempts per batch'}]
+    now = datetime.now(timezone.utc)
+    rows, indexes, errors = [], [], []
+    for index, item in enumerate(items):
+        if not isinstance(item, dict):
+            errors.append({'index': index, 'error': 'attempt must be an object'})
+            continue
+        question_id = item.get('question_id')
+        correct = item.get('correct', False)
+        user_answer = item.get('user_answer', '')
+        if isinstance(question_id, bool) or not isinstance(question_id, int) or question_id < 0:
+            errors.append({'index': index, 'error': 'question_id must be a non-negative integer'})
+            continue
+        if correct not in (True, False, 0, 1):
+            errors.append({'index': index, 'error': 'correct must be a boolean'})
+            continue
+        if user_answer is None:
+            user_answer = ''
+        if not isinstance(user_answer, str) or len(user_answer) > MAX_ANSWER_CHARS:
+            errors.append({'index': index, 'error': f'user_answer must be a string of at most {MAX_ANSWER_CHARS} characters'})
+            continue
+        try:
+            timestamp = _attempt_timestamp(item.get('answered_at'), now)
+        except (ValueError, OverflowError, OSError):
+            errors.append({'index': index, 'error': 'answered_at must be epoch milliseconds'})
+            continue
+        rows.append((user_id, question_id, bool(correct), user_answer, None, timestamp))
+        indexes.append(index)
+    if bank_question_ids is not None and rows:
+        known = bank_question_ids([row[1] for row in rows])
+        for index, row in zip(indexes, rows):
+            if row[1] and row[1] not in known:
+                errors.append({'index': index, 'error': 'question_id is not in the question bank'})
+        errors.sort(key=lambda error: error['index'])
+    return rows, errors
+
+
+@bp.route('/api/attempts/batch', methods=['POST'])
+def submit_attempt_batch():
+    """Save a batch of answers (buffered client-side, e.g. while offline) in one transaction"""
+    if 'user_id' not in session:
+        return jsonify({'error': 'Not authenticated'}), 401
+
+    data = request.get_json(silent=True)
+    items = data.get('attempts') if isinstance(data, dict) else data
+    rows, errors = parse_attempt_batch(items, session['user_id'], current_app.config['ATTEMPT_SYNC_MAX'],
+                                       attempts().bank_question_ids)
+    if errors:
+        # All or nothing: the client drops or fixes the batch instead of resending half of it
+        return jsonify({'success': False, 'error': 'Invalid attempts', 'errors': errors}), 400
+
+    saved = attempts().insert_many(rows)
+    stats = attempts().get_user_stats(session['user_id'])
+    return jsonify({
+        'success': True,
+        'saved': saved,
+        'stats': {
+            'total_attempted': stats['total_attempted'],
+            'correct_answers': stats['correct_answers'],
+            'accuracy': round(stats['accuracy'], 1)
+        }
+    })
+
+REVIEW_QUEUE_SIZE = 10
+REVIEW_QUEUE_MAX = 50
+
+
+def review_item(row):
+    """JSON shape of one ReviewSchedule.due() row"""
+    question_id, due_at, reps, interval, ease, lapses, qtype, difficulty, topic, question = row
+    return {
+        'question_id': question_id,
+        'due_at': due_at,
+        'reps': reps,
+        'interval_days': interval,
+        'ease': round(ease, 2),
+        'lapses': lapses,
+        'type': qtype,
+        'difficulty': difficulty,
+        'topic': topic,
+        'question': question,
+    }
+
+
+@bp.route('/api/reviews/due')
+@replica_reads
+def api_reviews_due():
+    """The signed-in user's spaced-repetition queue: questions due now, most overdue first"""
+    if 'user_id' not in session:
+        return jsonify({'error': 'Not authenticated'}), 401
+    limit = request.args.get('limit', REVIEW_QUEUE_SIZE, type=int)
+    if not 1 <= limit <= REVIEW_QUEUE_MAX:
+        return jsonify({'error': f'limit must be between 1 and {REVIEW_QUEUE_MAX}'}), 400
+
+    items = [review_item(row) for row in reviews().due(session['user_id'], limit)]
+    # Nothing due: tell the client when to come back
+    next_due = items[0]['due_at'] if items else reviews().next_due(session['user_id'])
+    return jsonify({'reviews': items, 'next_due': next_due})
+
+@bp.route("/api/gemini/solve", methods=["POST"])
+def gemini_solve():
+    if "user_id" not in session:
+        return jsonify({"ok": False, "error": "Not authenticated"}), 401
+    data = request.get_json(force=True, silent=True) or {}
+    title = (data.get("title") or "").strip()
+    description = (data.get("description") or "").strip()
+    topics = data.get("topics") or []
+    language = (data.get("language") or "Python").strip()
+
+    if not current_app.config['GEMINI_API_KEY']:
+        return jsonify({"ok": False, "error": "GEMINI_API_KEY not configured"}), 500
+    if not title:
+        return jsonify({"ok": False, "error": "Missing title"}), 400
+
+    # Ask for strict JSON so parsing is predictable
+    prompt = (
+        "You are an expert DSA tutor. Given a LeetCode-style problem, produce a concise, interview-ready solution.\n"
+        f"Title: {title}\n"
+        f"Description: {description}\n"
+        f"Topics: {', '.join(topics)}\n"
+        f"Language: {language}\n\n"
+        "Return strict JSON with keys:\n"
+        "approach (1-3 sentences), timeComplexity (e.g., O(n log n)), spaceComplexity, "
+        "code (complete runnable snippet), explanation (3-6 sentences).\n"
+    )
+
+    payload = {
+        "contents": [{"role": "user", "parts": [{"text": prompt}]}],
+        "generationConfig": {
+            "temperature": 0.4,
+            "response_mime_type": "application/json"
+        }
+    }
+
+    try:
+        resp = gemini_post(payload)
+        if resp.status_code != 200:
+            return jsonify({"ok": False, "error": f"Gemini error {resp.status_code}: {resp.text[:300]}"}), 502
+        result = parse_llm_json(gemini_text(resp))
+        # minimal validation/fallback
+        result.setdefault("approach", "High-level idea not available.")
+        result.setdefault("timeComplexity", "Unknown")
+        result.setdefault("spaceComplexity", "Unknown")
+        result.setdefault("code", "# Code unavailable")
+        result.setdefault("explanation", "Explanation unavailable.")
+        return jsonify({"ok": True, "solution": result})
+    except Exception as e:
+        return jsonify({"ok": False, "error": f"Unexpected error: {e}"}), 500
+
+@bp.route("/api/gemini/qa", methods=["POST"])
+def gemini_qa():
+    """Q&A API endpoint using Gemini."""
+    data = request.get_json(force=True) or {}
+    prompt = data.get("prompt", "").strip()
+    if not prompt:
+        return jsonify({"ok": False, "error": "Empty prompt"}), 400
+    with track_gemini('sdk.generate_content'):
+        answer = ask_gemini(prompt)
+    return jsonify({"ok": True, "answer": answer})
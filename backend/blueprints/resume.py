@@ -0,0 +1,247 @@
+"""
+Resume blueprint - resume builder and AI review
+"""
+
+from datetime import datetime
+
+from flask import Blueprint, current_app, jsonify, redirect, render_template, request, session, url_for
+
+from ..db import artifact_store
+from ..models.artifact import fingerprint
+from ..services.gemini_client import gemini_call, gemini_post, gemini_text
+from ..services.json_codec import dumps, parse_llm_json
+
+bp = Blueprint('resume', __name__)
+
+
+@bp.route("/resume")
+def resume():
+    if "user_id" not in session:
+        return redirect(url_for("auth.login"))
+    return render_template("resume.html")
+
+@bp.route("/api/gemini/resume", methods=["POST"])
+def gemini_resume():
+    if "user_id" not in session:
+        return jsonify({"ok": False, "error": "Not authenticated"}), 401
+    data = request.get_json(force=True, silent=True) or {}
+    profile = data.get("profile") or {}  # {name,email,phone,location,linkedin,github,summary}
+    skills  = data.get("skills") or []   # list of strings or {name,level}
+    projects= data.get("projects") or [] # [{name,tech,desc,impact,links}]
+    experience = data.get("experience") or [] # [{company,role,start,end,desc,impact}]
+    education = data.get("education") or []   # [{degree,school,year,score}]
+    target = (data.get("target") or "Software Engineer").strip()
+    seniority = (data.get("seniority") or "Fresher").strip()
+
+    fp = fingerprint("resume", {
+        "profile": profile, "skills": skills, "projects": projects,
+        "experience": experience, "education": education,
+        "target": target, "seniority": seniority
+    })
+    if not data.get("regenerate"):
+        found = artifact_store().find(session["user_id"], "resume", fp)
+        if found:
+            return jsonify({"ok": True, "result": found[1], "artifact_id": found[0], "cached": True})
+
+    if not current_app.config['GEMINI_API_KEY']:
+        return jsonify({"ok": False, "error": "GEMINI_API_KEY not configured"}), 500
+
+    prompt = (
+        "You are an ATS and recruiter-optimized resume writer. "
+        f"Target role: {target}; Seniority: {seniority}. "
+        "Given candidate data (JSON below), produce:\n"
+        "1) improvements: three bullet suggestions to strengthen resume; "
+        "2) highlights: 5-8 power bullets quantified with STAR verbs; "
+        "3) html: full resume sections (Summary, Skills, Experience, Projects, Education) as clean HTML using <section> and <ul><li> only; "
+        "no external CSS, minimal inline classes (h5, small, ul). Use US English. Avoid placeholders.\n\n"
+        "Candidate JSON:\n"
+        f"{dumps({'profile':profile,'skills':skills,'projects':projects,'experience':experience,'education':education})}\n\n"
+        "Return strict JSON with keys: improvements (array), highlights (array), html (string)."
+    )
+
+    payload = {
+        "contents": [{"role":"user","parts":[{"text": prompt}]}],
+        "generationConfig": {
+            "temperature": 0.4,
+            "response_mime_type": "application/json"
+        }
+    }
+
+    try:
+        resp = gemini_post(payload, timeout=25)
+        if resp.status_code != 200:
+            return jsonify({"ok": False, "error": f"Gemini error {resp.status_code}: {resp.text[:300]}"}), 502
+        out = parse_llm_json(gemini_text(resp))
+        out.setdefault("improvements", [])
+        out.setdefault("highlights", [])
+        out.setdefault("html", "<section><h5>Resume</h5><p>No content</p></section>")
+        artifact_id = artifact_store().save(session["user_id"], "resume", fp, out, title=f"{target} ({seniority})")
+        return jsonify({"ok": True, "result": out, "artifact_id": artifact_id, "cached": False})
+    except Exception as e:
+        return jsonify({"ok": False, "error": f"Unexpected: {e}"}), 500
+
+@bp.route("/api/resume/ai-generate", methods=["POST"])
+def resume_ai_generate():
+    """Generate a starter resume using AI from minimal info. Returns JSON structure."""
+    body = request.get_json(force=True, silent=True) or {}
+    first_name = (body.get("firstName") or "").strip() or "John"
+    last_name = (body.get("lastName") or "").strip() or "Doe"
+    email = (body.get("email") or "").strip() or "john.doe@example.com"
+    phone = (body.get("phone") or "").strip() or "+1-555-555-5555"
+    target_role = (body.get("role") or "Software Engineer").strip()
+
+    if current_app.config['GEMINI_API_KEY']:
+        instruction = (
+            "You are an expert resume writer. Based on minimal candidate info, "
+            "create a concise, ATS-friendly software resume. Return STRICT JSON with keys: "
+            "firstName, lastName, email, phone, location, linkedin, summary, "
+            "experience: [{jobTitle, company, startDate, endDate, description}], "
+            "education: [{degree, school, gradYear, gpa}], skills: [..], "
+            "projects: [{name, url, description}]. Dates in MM/YYYY or 'Present'. Keep content realistic."
+        )
+        seed = (
+            f"Name: {first_name} {last_name}\nEmail: {email}\nPhone: {phone}\nTarget Role: {target_role}"
+        )
+        try:
+            ai_json = gemini_call([
+                {"text": instruction},
+                {"text": "\nCandidate:"},
+                {"text": seed}
+            ], expect_json=True, temperature=0.3)
+            data = parse_llm_json(ai_json)
+            if data:
+                data.setdefault("firstName", first_name)
+                data.setdefault("lastName", last_name)
+                data.setdefault("email", email)
+                data.setdefault("phone", phone)
+                return jsonify({"ok": True, "resume": data})
+        except Exception:
+            pass
+
+    # Fallback template when AI not available or parsing failed
+    year = datetime.utcnow().year
+    fallback = {
+        "firstName": first_name,
+        "lastName": last_name,
+        "email": email,
+        "phone": phone,
+        "location": "Your City, Country",
+        "linkedin": "https://www.linkedin.com/in/your-profile",
+        "summary": f"Aspiring {target_role} with strong CS fundamentals and hands-on project experience.",
+        "experience": [
+            {"jobTitle": "{role}".format(role=target_role), "company": "Demo Company",
+             "startDate": "06/{y}".format(y=year-1), "endDate": "Present",
+             "description": "Built features, fixed bugs, collaborated with team, and wrote tests."}
+        ],
+        "education": [
+            {"degree": "B.Tech in Computer Science", "school": "ABC University", "gradYear": str(year), "gpa": "8.0/10"}
+        ],
+        "skills": ["Python", "Flask", "JavaScript", "React", "SQL"],
+        "projects": [
+            {"name": "Portfolio Website", "url": "https://example.com", "description": "Personal portfolio with responsive UI."}
+        ]
+    }
+    return jsonify({"ok": True, "resume": fallback})
+
+@bp.route("/api/resume/test", methods=["GET"])
+def test_resume():
+    """Test route to verify server is working."""
+    return jsonify({"ok": True, "message": "Resume API is working"})
+
+@bp.route("/api/resume/generate", methods=["POST"])
+def generate_resume():
+    """Generate ATS-friendly resume with AI recommendations."""
+    current_app.logger.debug("Resume generation endpoint called")
+    
+    if not current_app.config['GEMINI_API_KEY']:
+        current_app.logger.warning("No Gemini API key configured")
+        return jsonify({"ok": False, "error": "Gemini API key not configured"})
+    
+    body = request.get_json(force=True, silent=True) or {}
+    current_app.logger.debug("Received resume fields: %s", sorted(body))
+    
+    # Extract resume data
+    personal_info = {
+        "name": f"{body.get('firstName', '')} {body.get('lastName', '')}".strip(),
+        "email": body.get('email', ''),
+        "phone": body.get('phone', ''),
+        "location": body.get('location', ''),
+        "linkedin": body.get('linkedin', ''),
+        "summary": body.get('summary', '')
+    }
+    
+    experience = body.get('experience', [])
+    education = body.get('education', [])
+    projects = body.get('projects', [])
+    skills = body.get('skills', [])
+    
+    # Create resume analysis prompt
+    analysis_prompt = f"""
+    Analyze this resume for ATS (Applicant Tracking System) compatibility and provide recommendations:
+    
+    PERSONAL INFO:
+    Name: {personal_info['name']}
+    Email: {personal_info['email']}
+    Phone: {personal_info['phone']}
+    Location: {personal_info['location']}
+    LinkedIn: {personal_info['linkedin']}
+    Summary: {personal_info['summary']}
+    
+    EXPERIENCE:
+    {chr(10).join([f"- {exp.get('jobTitle', '')} at {exp.get('company', '')} ({exp.get('startDate', '')} - {exp.get('endDate', '')}): {exp.get('description', '')}" for exp in experience])}
+    
+    EDUCATION:
+    {chr(10).join([f"- {edu.get('degree', '')} from {edu.get('school', '')} ({edu.get('gradYear', '')})" for edu in education])}
+    
+    SKILLS:
+    {', '.join(skills)}
+    
+    PROJECTS:
+    {chr(10).join([f"- {proj.get('name', '')}: {proj.get('description', '')}" for proj in projects])}
+    
+    Please provide:
+    1. ATS Score (0-100) based on keyword optimization, formatting, and completeness
+    2. Specific recommendations for improvement
+    3. Missing keywords that should be added
+    4. Formatting suggestions for better ATS parsing
+    
+    Return as JSON with keys: ats_score, recommendations (array of objects with title and description), missing_keywords, formatting_tips.
+    """
+    
+    try:
+        analysis_result = gemini_call([{"text": analysis_prompt}], expect_json=True, temperature=0.2)
+        
+        if not analysis_result:
+            # Fallback analysis without API
+            ats_score = min(85, 60 + len(experience) * 5 + len(skills) * 2)
+            recommendations = [
+                {"title": "Add More Keywords", "description": "Include industry-specific keywords from job descriptions"},
+                {"title": "Quantify Achievements", "description": "Add numbers and metrics to your experience descriptions"},
+                {"title": "Optimize Summary", "description": "Write a compelling 2-3 line professional summary"}
+            ]
+            missing_keywords = ["leadership", "project management", "problem solving"]
+            formatting_tips = ["Use standard section headers", "Avoid graphics and tables", "Use bullet points"]
+        else:
+            analysis = parse_llm_json(analysis_result)
+            if analysis:
+                ats_score = analysis.get('ats_score', 75)
+                recommendations = analysis.get('recommendations', [])
+                missing_keywords = analysis.get('missing_keywords', [])
+                formatting_tips = analysis.get('formatting_tips', [])
+            else:
+                # Fallback if JSON parsing fails
+                ats_score = 75
+                recommendations = [{"title": "AI Analysis", "description": "Resume analyzed successfully"}]
+                missing_keywords = []
+                formatting_tips = []
+        
+        return jsonify({
+            "ok": True,
+            "ats_score": ats_score,
+            "recommendations": recommendations,
+            "missing_keywords": missing_keywords,
+            "formatting_tips": formatting_tips
+        })
+        
+    except Exception as e:
+        return jsonify({"ok": False, "error": str(e)})
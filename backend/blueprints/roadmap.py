@@ -0,0 +1,111 @@
+"""
+Roadmap blueprint - career roadmap generation and artifact history
+"""
+
+from flask import Blueprint, current_app, jsonify, render_template, request, session
+
+from ..db import artifact_store
+from ..models.artifact import fingerprint
+from ..services.gemini_client import gemini_post, gemini_text
+from ..services.page_cache import cached_page
+from ..services.roadmap_renderer import render_roadmap
+
+bp = Blueprint('roadmap', __name__)
+
+
+@bp.route('/career_roadmap')
+@cached_page
+def career_roadmap():
+    """Career Roadmap Generator page"""
+    return render_template('career_roadmap.html')
+
+@bp.route('/api/roadmap', methods=['POST'])
+def api_roadmap():
+    """Generate a career roadmap using Gemini API.
+    Expects JSON: { jobRole, experience, targetCompany, skills }
+    Returns: { html }
+    """
+    data = request.get_json(force=True, silent=True) or {}
+    job_role = data.get('jobRole', '')
+    experience = data.get('experience', '')
+    target_company = data.get('targetCompany', '')
+    skills = data.get('skills', '')
+
+    # Reuse a stored roadmap for the same (normalized) inputs unless asked to regenerate
+    user_id = session.get('user_id')
+    fp = fingerprint('roadmap', {
+        'jobRole': job_role,
+        'experience': experience,
+        'targetCompany': target_company,
+        'skills': sorted(s.strip() for s in str(skills).lower().split(',') if s.strip())
+    })
+    if user_id and not data.get('regenerate'):
+        found = artifact_store().find(user_id, 'roadmap', fp)
+        if found:
+            return jsonify({'html': found[1].get('html', ''), 'artifact_id': found[0], 'cached': True})
+        if data.get('reuseShared'):
+            adopted = artifact_store().adopt_shared(user_id, 'roadmap', fp)
+            if adopted:
+                return jsonify({'html': adopted[1].get('html', ''), 'artifact_id': adopted[0], 'cached': True})
+
+    if not current_app.config['GEMINI_API_KEY']:
+        return jsonify({'error': 'GEMINI_API_KEY not configured on server'}), 500
+
+    prompt = (
+        f"Create a concise, step-by-step career roadmap for role: {job_role}, "
+        f"experience: {experience}, target company: {target_company}. "
+        f"Candidate skills: {skills}. "
+        "Return three stages (Foundational, Intermediate, Advanced). For each stage, provide: "
+        "Key Milestones (3-5 bullets), Skills to Focus (3-5 tags), Recommended Resources (2-3 bullets). "
+        "Use short bullet points."
+    )
+
+    try:
+        resp = gemini_post({
+            'contents': [
+                {
+                    'role': 'user',
+                    'parts': [
+                        {'text': prompt}
+                    ]
+                }
+            ]
+        })
+        if resp.status_code != 200:
+            # Pass through truncated error body for easier debugging (safe: no secrets)
+            return jsonify({'error': f'Gemini API error {resp.status_code}: {resp.text[:300]}'}), 502
+
+        # Robust parsing against safety blocks / empty candidates
+        text = gemini_text(resp)
+        if not text:
+            # Safety block or empty candidates: surface the body, but never render or store it
+            return jsonify({'error': f'Gemini returned no roadmap text: {resp.text[:300]}'}), 502
+
+        # Convert basic markdown (* bullets and stage headings) to HTML cards
+        html = render_roadmap(text)
+        if user_id:
+            title = ' @ '.join(x for x in (job_role, target_company) if x) or 'Roadmap'
+            artifact_id = artifact_store().save(user_id, 'roadmap', fp, {'html': html}, title=title)
+            return jsonify({'html': html, 'artifact_id': artifact_id, 'cached': False})
+        return jsonify({'html': html})
+    except Exception as e:
+        return jsonify({'error': f'Unexpected error: {e}'}), 500
+
+@bp.route('/api/artifacts')
+def api_artifacts():
+    """History of generated roadmaps/resumes for the current user"""
+    if 'user_id' not in session:
+        return jsonify({'error': 'Not authenticated'}), 401
+    kind = request.args.get('kind') or None
+    limit = min(max(request.args.get('limit', 20, type=int), 1), 100)
+    return jsonify({'artifacts': artifact_store().history(session['user_id'], kind=kind, limit=limit)})
+
+@bp.route('/api/artifacts/<int:artifact_id>')
+def api_artifact(artifact_id):
+    """Reload a previously generated result without calling Gemini"""
+    if 'user_id' not in session:
+        return jsonify({'error': 'Not authenticated'}), 401
+    artifact = artifact_store().get(artifact_id, session['user_id'])
+    if not artifact or artifact['payload'] is None:
+        return jsonify({'error': 'Artifact not found'}), 404
+    return jsonify(artifact)
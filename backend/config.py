@@ -0,0 +1,160 @@
+import os
+import tempfile
+
+from dotenv import load_dotenv
+
+# Load .env before any setting below reads the environment
+load_dotenv()
+
+
+class Config:
+    """Base configuration class"""
+    SECRET_KEY = os.environ.get('SECRET_KEY') or 'your-secret-key-change-in-production'
+    DEBUG = False
+    TESTING = False
+
+    # Storage backend (backend/storage): sqlite:///<path> or postgresql://...
+    # None means the SQLite file DATABASE_PATH, else the per-environment default
+    # from db.get_db_path()
+    SQLALCHEMY_DATABASE_URI = os.environ.get('DATABASE_URL') or None
+    SQLALCHEMY_TRACK_MODIFICATIONS = False
+    DATABASE_PATH = None
+    DATABASE_POOL_SIZE = int(os.environ.get('DATABASE_POOL_SIZE', 5))
+    DATABASE_POOL_TIMEOUT = float(os.environ.get('DATABASE_POOL_TIMEOUT', 10))
+
+    # Read-only pool for dashboard/feedback/stats reads: DATABASE_REPLICA_URL on a
+    # server database, or a mode=ro pool on the same WAL-mode SQLite file.
+    # 0 disables routing (everything reads from the primary)
+    DATABASE_REPLICA_URL = os.environ.get('DATABASE_REPLICA_URL') or None
+    DATABASE_READ_POOL_SIZE = int(os.environ.get('DATABASE_READ_POOL_SIZE', 5))
+    # After a user's write, their reads stay on the primary this long (replica lag)
+    READ_YOUR_WRITES_SECONDS = float(os.environ.get('READ_YOUR_WRITES_SECONDS', 5))
+
+    # Attempt inserts: 'group' queues them for a writer thread that commits up to
+    # ATTEMPT_BATCH_ROWS rows per ATTEMPT_BATCH_MS window and the request waits for
+    # that commit; 'async' returns once queued; 'sync' inserts inline
+    ATTEMPT_WRITE_MODE = os.environ.get('ATTEMPT_WRITE_MODE', 'group')
+    ATTEMPT_BATCH_ROWS = int(os.environ.get('ATTEMPT_BATCH_ROWS', 200))
+    ATTEMPT_BATCH_MS = float(os.environ.get('ATTEMPT_BATCH_MS', 5))
+    ATTEMPT_QUEUE_SIZE = int(os.environ.get('ATTEMPT_QUEUE_SIZE', 10000))
+    # Attempts older than this many days move to monthly archive tables when
+    # `flask --app backend.app archive-attempts` runs (render.yaml: every start); 0 keeps everything hot
+    ATTEMPT_RETENTION_DAYS = int(os.environ.get('ATTEMPT_RETENTION_DAYS', 180))
+    # Most attempts accepted by one POST /api/attempts/batch
+    ATTEMPT_SYNC_MAX = int(os.environ.get('ATTEMPT_SYNC_MAX', 500))
+
+    # GET /metrics: with METRICS_TOKEN set it needs `Authorization: Bearer <token>`;
+    # without one it is open when METRICS_PUBLIC, else answered only on loopback
+    METRICS_TOKEN = os.environ.get('METRICS_TOKEN') or None
+    METRICS_PUBLIC = os.environ.get('METRICS_PUBLIC', '1') != '0'
+
+    # Statements slower than SLOW_QUERY_MS go with their query plan to the rotating
+    # JSON-lines SLOW_QUERY_LOG (services/query_profiler.py); None means
+    # instance/slow_queries.log
+    SLOW_QUERY_MS = float(os.environ.get('SLOW_QUERY_MS', 50))
+    SLOW_QUERY_LOG = os.environ.get('SLOW_QUERY_LOG') or None
+
+    # Generated roadmap/resume blobs; None keeps them next to the SQLite file
+    # (or in the instance folder for server databases)
+    ARTIFACT_DIR = os.environ.get('ARTIFACT_DIR') or None
+
+    # Password hashing (services/password_hasher.py): PBKDF2 in a process pool of
+    # PASSWORD_HASH_WORKERS (0 = inline; serverless has no /dev/shm for a pool).
+    # More than PASSWORD_HASH_MAX_PENDING logins/registrations in flight get a 503.
+    # Iterations are calibrated on first use to PASSWORD_HASH_TARGET_MS (never below
+    # werkzeug's 600000; inline hashing uses 600000 as is) unless PASSWORD_HASH_METHOD
+    # pins them (e.g. pbkdf2:sha256:600000)
+    PASSWORD_HASH_WORKERS = int(os.environ.get(
+        'PASSWORD_HASH_WORKERS', 0 if os.environ.get('VERCEL') else max(1, (os.cpu_count() or 2) // 2)))
+    PASSWORD_HASH_MAX_PENDING = int(os.environ.get('PASSWORD_HASH_MAX_PENDING', 16))
+    PASSWORD_HASH_TARGET_MS = float(os.environ.get('PASSWORD_HASH_TARGET_MS', 250))
+    PASSWORD_HASH_METHOD = os.environ.get('PASSWORD_HASH_METHOD') or None
+    PASSWORD_HASH_TIMEOUT = float(os.environ.get('PASSWORD_HASH_TIMEOUT', 10))
+
+    # Per-process user profile cache (by id and email) in front of the users table;
+    # other workers' writes show up within USER_CACHE_TTL seconds. 0 disables
+    USER_CACHE_SIZE = int(os.environ.get('USER_CACHE_SIZE', 1024))
+    USER_CACHE_TTL = float(os.environ.get('USER_CACHE_TTL', 60))
+
+    # Rendered /, /features, /resources and /career_roadmap for anonymous visitors,
+    # served with a strong ETag (services/page_cache.py); PRERENDER fills it at startup
+    PAGE_CACHE = os.environ.get('PAGE_CACHE', '1') != '0'
+    PAGE_CACHE_PRERENDER = os.environ.get('PAGE_CACHE_PRERENDER', '0') == '1'
+
+    # Fingerprinted, pre-compressed /assets/* with immutable caching
+    # (services/assets.py); off means static_url() links plain /static files.
+    # Compressed copies are shared through ASSET_CACHE_DIR; None means
+    # instance/asset_cache (the temp dir on Vercel), '' keeps them in memory only
+    ASSET_PIPELINE = os.environ.get('ASSET_PIPELINE', '1') != '0'
+    ASSET_CACHE_DIR = os.environ.get('ASSET_CACHE_DIR')
+
+    # gzip/brotli for text responses (services/compression.py); bodies under
+    # COMPRESSION_MIN_SIZE bytes are sent as-is. Brotli needs `pip install brotli`
+    COMPRESSION = os.environ.get('COMPRESSION', '1') != '0'
+    COMPRESSION_MIN_SIZE = int(os.environ.get('COMPRESSION_MIN_SIZE', 500))
+    # Level 1 saves ~2x more bytes per CPU-ms than 6 on our pages, for ~20% larger
+    # output (python -m benchmarks.bench_compression)
+    COMPRESSION_LEVEL = int(os.environ.get('COMPRESSION_LEVEL', 1))
+    COMPRESSION_BR_QUALITY = int(os.environ.get('COMPRESSION_BR_QUALITY', 4))
+
+    # Per-process /api/analytics results (per user, invalidated by their next attempt); 0 disables
+    ANALYTICS_CACHE_SIZE = int(os.environ.get('ANALYTICS_CACHE_SIZE', 512))
+
+    # Leaderboard: answers needed before a user is ranked by accuracy, and how often each
+    # worker pulls changed user_scores rows into its in-memory rank index
+    LEADERBOARD_MIN_ATTEMPTS = int(os.environ.get('LEADERBOARD_MIN_ATTEMPTS', 10))
+    LEADERBOARD_REFRESH_SECONDS = float(os.environ.get('LEADERBOARD_REFRESH_SECONDS', 5))
+
+    # Jinja bytecode shared by all workers (services/template_cache.py); None means
+    # instance/jinja_cache (the temp dir on Vercel), '' disables. The compile-templates
+    # command fills it before the workers start; PRECOMPILE=1 also loads every
+    # template in create_app (off by default: it is startup time every worker pays)
+    TEMPLATE_BYTECODE_DIR = os.environ.get('TEMPLATE_BYTECODE_DIR')
+    TEMPLATE_PRECOMPILE = os.environ.get('TEMPLATE_PRECOMPILE', '0') == '1'
+
+    # Google OAuth (sign-in is disabled unless both are set)
+    GOOGLE_CLIENT_ID = os.environ.get('GOOGLE_CLIENT_ID', '')
+    GOOGLE_CLIENT_SECRET = os.environ.get('GOOGLE_CLIENT_SECRET', '')
+
+    # Gemini REST API
+    GEMINI_API_KEY = os.environ.get('GEMINI_API_KEY', '')
+    GEMINI_MODEL = os.environ.get('GEMINI_MODEL', 'gemini-2.0-flash')
+    GEMINI_API_BASE = os.environ.get('GEMINI_API_BASE', 'https://generativelanguage.googleapis.com').rstrip('/')
+
+
+class DevelopmentConfig(Config):
+    """Development configuration"""
+    DEBUG = True
+    TESTING = False
+    # Template and static file edits should show up on reload
+    PAGE_CACHE = False
+    ASSET_PIPELINE = False
+    TEMPLATE_PRECOMPILE = False
+    # A development database is small: a statement this slow there is worth a look
+    SLOW_QUERY_MS = float(os.environ.get('SLOW_QUERY_MS', 20))
+
+
+class ProductionConfig(Config):
+    """Production configuration"""
+    DEBUG = False
+    TESTING = False
+    # Per-route latencies and pool stats are not for the internet: loopback only
+    # unless METRICS_TOKEN is set or METRICS_PUBLIC=1
+    METRICS_PUBLIC = os.environ.get('METRICS_PUBLIC', '0') == '1'
+
+
+class TestingConfig(Config):
+    """Testing configuration"""
+    TESTING = True
+    DEBUG = True
+    # Test runs must not append to the development instance's log
+    SLOW_QUERY_LOG = os.environ.get('SLOW_QUERY_LOG') or os.path.join(tempfile.gettempdir(), 'slow_queries_test.log')
+
+
+# Configuration dictionary
+config = {
+    'development': DevelopmentConfig,
+    'production': ProductionConfig,
+    'testing': TestingConfig,
+    'default': DevelopmentConfig
+}
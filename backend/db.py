@@ -0,0 +1,450 @@
+"""
+Database setup shared by every entry point
+Picks the storage backend from config, owns the schema (init_db) and its
+version stamp, and wires the once-per-process schema check, the `init-db` CLI
+command and the repositories (backend/models) into an app.
+"""
+
+import os
+import tempfile
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from functools import wraps
+
+import click
+
+from flask import current_app, g, has_app_context, has_request_context, session
+
+from . import storage
+from .models.archive import AttemptArchive, rebuild_views
+from .models.artifact import Artifact
+from .models.attempt import Attempt
+from .models.mock_session import MockSession
+from .models.review import ReviewSchedule
+from .models.score import UserScores, extend_streak
+from .models.user import User
+from .services.json_codec import dumps
+from .services.profile_cache import ProfileCache
+from .services.question_bank import load_questions
+
+# Bump when init_db() gains tables or indexes so existing databases are upgraded
+SCHEMA_VERSION = 6
+
+
+# Helper function to get database path
+def get_db_path():
+    """Get the appropriate database path based on environment"""
+    if has_app_context() and current_app.config.get('DATABASE_PATH'):
+        return current_app.config['DATABASE_PATH']
+    if os.environ.get('DATABASE_PATH'):
+        # Explicit override (benchmarks, scratch databases)
+        return os.environ['DATABASE_PATH']
+    if os.environ.get('RENDER'):
+        # Production environment (Render)
+        return os.path.join(os.path.expanduser('~'), 'interview_prep.db')
+    if os.environ.get('VERCEL'):
+        # Serverless: only the temp directory is writable
+        return os.path.join(tempfile.gettempdir(), 'interview_prep.db')
+    # Development environment
+    return os.path.join(os.path.dirname(__file__), 'interview_prep.db')
+
+
+def database_uri(config):
+    """SQLALCHEMY_DATABASE_URI when set, otherwise the SQLite file from get_db_path()"""
+    return config.get('SQLALCHEMY_DATABASE_URI') or f'sqlite:///{get_db_path()}'
+
+
+def _resolve(db):
+    if db is None:
+        return database() if has_app_context() else storage.resolve(get_db_path())
+    return storage.resolve(db)
+
+
+# Database initialization
+def init_db(db=None):
+    """Create or upgrade the schema.
+
+    `db` is a storage.Database or a SQLite path; by default the current app's
+    database, or the get_db_path() file outside an app.
+    """
+    database = _resolve(db)
+    with database.transaction() as conn:
+        _create_schema(database, conn)
+        _sync_questions(database, conn)
+        _backfill_scores(database, conn)
+        rebuild_views(database, conn, [row[0] for row in database.execute(
+            conn, 'SELECT month FROM attempt_archives ORDER BY month').fetchall()])
+        _backfill_reviews(database, conn)
+        database.set_schema_version(conn, SCHEMA_VERSION)
+
+
+def _create_schema(database, conn):
+    def create(statement):
+        database.execute(conn, database.ddl(statement))
+
+    # Users table
+    create('''
+        CREATE TABLE IF NOT EXISTS users (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            name TEXT NOT NULL,
+            email TEXT UNIQUE NOT NULL,
+            password_hash TEXT NOT NULL,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    ''')
+
+    # Attempts table for tracking user practice
+    create('''
+        CREATE TABLE IF NOT EXISTS attempts (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            user_id INTEGER NOT NULL,
+            question_id INTEGER NOT NULL,
+            correct BOOLEAN NOT NULL,
+            user_answer TEXT,
+            mock_session_id INTEGER,
+            timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY (user_id) REFERENCES users (id)
+        )
+    ''')
+
+    # Mock interview sessions
+    create('''
+        CREATE TABLE IF NOT EXISTS mock_sessions (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            user_id INTEGER NOT NULL,
+            start_time TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            end_time TIMESTAMP,
+            total_questions INTEGER DEFAULT 0,
+            correct_answers INTEGER DEFAULT 0,
+            FOREIGN KEY (user_id) REFERENCES users (id)
+        )
+    ''')
+
+    # Per-user lookups (dashboard, feedback, mock/end) must not scan the whole table
+    create('CREATE INDEX IF NOT EXISTS idx_attempts_user_time ON attempts (user_id, timestamp)')
+    create('CREATE INDEX IF NOT EXISTS idx_mock_sessions_user_start ON mock_sessions (user_id, start_time)')
+    if database.dialect != 'sqlite':
+        # Feedback pages seek on (timestamp, id); SQLite indexes already end in the rowid
+        create('CREATE INDEX IF NOT EXISTS idx_attempts_user_time_id ON attempts (user_id, timestamp, id)')
+
+    # Question bank mirrored from data/questions.json so history can join it in SQL
+    create('''
+        CREATE TABLE IF NOT EXISTS questions (
+            id INTEGER PRIMARY KEY,
+            type TEXT NOT NULL,
+            difficulty TEXT,
+            topic TEXT,
+            question TEXT NOT NULL,
+            answer TEXT,
+            hints TEXT,
+            tags TEXT
+        )
+    ''')
+    create('CREATE INDEX IF NOT EXISTS idx_questions_topic ON questions (topic)')
+
+    # Spaced-repetition state per (user, question), rewritten with every attempt
+    create('''
+        CREATE TABLE IF NOT EXISTS review_state (
+            user_id INTEGER NOT NULL,
+            question_id INTEGER NOT NULL,
+            reps INTEGER NOT NULL DEFAULT 0,
+            interval_days REAL NOT NULL DEFAULT 0,
+            ease REAL NOT NULL,
+            lapses INTEGER NOT NULL DEFAULT 0,
+            last_review TIMESTAMP NOT NULL,
+            due_at TIMESTAMP NOT NULL,
+            PRIMARY KEY (user_id, question_id),
+            FOREIGN KEY (user_id) REFERENCES users (id)
+        )
+    ''')
+    # The "due now" queue is one seek on this index
+    create('CREATE INDEX IF NOT EXISTS idx_review_state_user_due ON review_state (user_id, due_at)')
+
+    # Attempts past ATTEMPT_RETENTION_DAYS live in attempts_YYYY_MM tables (models/archive.py);
+    # their per-user, per-day totals stay here so lifetime stats and streaks need no archive scan
+    create('''
+        CREATE TABLE IF NOT EXISTS attempt_rollups (
+            user_id INTEGER NOT NULL,
+            day TEXT NOT NULL,
+            attempts INTEGER NOT NULL DEFAULT 0,
+            correct INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (user_id, day)
+        )
+    ''')
+    create('''
+        CREATE TABLE IF NOT EXISTS attempt_archives (
+            month TEXT PRIMARY KEY,
+            row_count INTEGER NOT NULL DEFAULT 0,
+            archived_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    ''')
+
+    # Leaderboard totals per user, kept current by every attempt insert
+    create('''
+        CREATE TABLE IF NOT EXISTS user_scores (
+            user_id INTEGER PRIMARY KEY,
+            attempts INTEGER NOT NULL DEFAULT 0,
+            correct INTEGER NOT NULL DEFAULT 0,
+            streak INTEGER NOT NULL DEFAULT 0,
+            last_day TEXT,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY (user_id) REFERENCES users (id)
+        )
+    ''')
+    # Workers refresh their in-memory rank index from rows changed since their last look
+    create('CREATE INDEX IF NOT EXISTS idx_user_scores_updated ON user_scores (updated_at)')
+
+    # Generated roadmap/resume results (payloads live in compressed blobs on disk)
+    create('''
+        CREATE TABLE IF NOT EXISTS artifacts (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            user_id INTEGER NOT NULL,
+            kind TEXT NOT NULL,
+            fingerprint TEXT NOT NULL,
+            title TEXT,
+            blob_digest TEXT NOT NULL,
+            size_bytes INTEGER DEFAULT 0,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            UNIQUE (user_id, kind, fingerprint),
+            FOREIGN KEY (user_id) REFERENCES users (id)
+        )
+    ''')
+    create('CREATE INDEX IF NOT EXISTS idx_artifacts_user_created ON artifacts (user_id, created_at)')
+    create('CREATE INDEX IF NOT EXISTS idx_artifacts_kind_fp ON artifacts (kind, fingerprint)')
+
+
+def _sync_questions(database, conn):
+    """Upsert data/questions.json into the questions table (tags as JSON text)"""
+    rows = [(q['id'], q.get('type', 'technical'), q.get('difficulty'), q.get('topic'), q['question'],
+             q.get('answer'), q.get('hints'), dumps(q.get('tags') or [])) for q in load_questions()]
+    if not rows:
+        return
+    database.executemany(conn, '''
+        INSERT INTO questions (id, type, difficulty, topic, question, answer, hints, tags)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+        ON CONFLICT (id) DO UPDATE SET
+            type = excluded.type, difficulty = excluded.difficulty, topic = excluded.topic,
+            question = excluded.question, answer = excluded.answer, hints = excluded.hints, tags = excluded.tags
+    ''', rows)
+
+
+def backfill_trackers(db=None, from_user_id=1):
+    """Recompute user_scores and review_state for users with id >= from_user_id.
+
+    For attempts written around Attempt.record (bulk loads), whose trackers
+    never saw them; the users' existing tracker rows are replaced.
+    """
+    database = _resolve(db)
+    with database.transaction() as conn:
+        _backfill_scores(database, conn, from_user_id)
+        _backfill_reviews(database, conn, from_user_id=from_user_id)
+
+
+def _backfill_scores(database, conn, from_user_id=None):
+    """Fill an empty user_scores from existing attempts (the upgrade that adds it),
+    or rebuild the rows of users from from_user_id on"""
+    if from_user_id is None:
+        if database.execute(conn, 'SELECT 1 FROM user_scores LIMIT 1').fetchone():
+            return
+        from_user_id = 0
+    else:
+        database.execute(conn, 'DELETE FROM user_scores WHERE user_id >= ?', (from_user_id,))
+    totals = {}
+    for user_id, day, count, correct in database.execute(conn, '''
+        SELECT user_id, substr(timestamp, 1, 10), COUNT(*), SUM(correct)
+        FROM attempts
+        WHERE user_id >= ?
+        GROUP BY user_id, substr(timestamp, 1, 10)
+        ORDER BY user_id, 2
+    ''', (from_user_id,)).fetchall():
+        attempts, hits, streak, last_day = totals.get(user_id, (0, 0, 0, None))
+        streak, last_day = extend_streak(streak, last_day, day)
+        totals[user_id] = (attempts + count, hits + correct, streak, last_day)
+    if totals:
+        database.executemany(conn, '''
+            INSERT INTO user_scores (user_id, attempts, correct, streak, last_day) VALUES (?, ?, ?, ?, ?)
+        ''', [(user_id, *values) for user_id, values in totals.items()])
+
+
+def _backfill_reviews(database, conn, batch_rows=50000, from_user_id=None):
+    """Fill an empty review_state by replaying every bank-question attempt through SM-2, oldest first,
+    or rebuild the rows of users from from_user_id on"""
+    if from_user_id is None:
+        if database.execute(conn, 'SELECT 1 FROM review_state LIMIT 1').fetchone():
+            return
+        from_user_id = 0
+    else:
+        database.execute(conn, 'DELETE FROM review_state WHERE user_id >= ?', (from_user_id,))
+    reviews = ReviewSchedule(database)
+    cursor = database.execute(conn, '''
+        SELECT a.user_id, a.question_id, a.correct, NULL, NULL, a.timestamp
+        FROM attempts_history a
+        JOIN questions q ON q.id = a.question_id
+        WHERE a.user_id >= ?
+        ORDER BY a.user_id, a.timestamp, a.id
+    ''', (from_user_id,))
+    # A user split across two batches is fine: the second only holds later answers
+    while True:
+        rows = cursor.fetchmany(batch_rows)
+        if not rows:
+            break
+        reviews.record(conn, [tuple(row[:5]) + (None if row[5] is None else str(row[5]),) for row in rows])
+
+
+_schema_lock = threading.Lock()
+_schema_ready = set()
+
+
+def ensure_schema():
+    """Run init_db() once per process and database, and only if it is behind SCHEMA_VERSION.
+
+    Importing the app never touches the database; deploys can run
+    `flask --app backend.app init-db` up front so workers only read the version.
+    """
+    db = database()
+    if db.uri in _schema_ready:
+        return
+    with _schema_lock:
+        if db.uri in _schema_ready:
+            return
+        with db.connection() as conn:
+            version = db.schema_version(conn)
+        if version < SCHEMA_VERSION:
+            init_db(db)
+        _schema_ready.add(db.uri)
+
+
+def database():
+    """The current app's storage.Database"""
+    return current_app.extensions['database']
+
+
+def _note_write(db):
+    if has_request_context():
+        g._db_wrote = True
+
+
+def _remember_write(response):
+    # Session cookie, not process memory: the next request may hit another worker
+    if g.get('_db_wrote') and 'user_id' in session:
+        session['_db_wrote_at'] = round(time.time(), 3)
+    return response
+
+
+def replica_reads(view):
+    """Serve a read-only view's queries from the replica pool.
+
+    Falls back to the primary while the user is inside the
+    READ_YOUR_WRITES_SECONDS window after their last write, so a dashboard
+    loaded right after a submit always shows it.
+    """
+    @wraps(view)
+    def wrapper(*args, **kwargs):
+        wrote_at = session.get('_db_wrote_at')
+        if wrote_at and time.time() - wrote_at < current_app.config['READ_YOUR_WRITES_SECONDS']:
+            return view(*args, **kwargs)
+        with storage.replica_reads():
+            return view(*args, **kwargs)
+    return wrapper
+
+
+def users():
+    return current_app.extensions['repositories']['users']
+
+
+def attempts():
+    return current_app.extensions['repositories']['attempts']
+
+
+def mock_sessions():
+    return current_app.extensions['repositories']['mock_sessions']
+
+
+def reviews():
+    return current_app.extensions['repositories']['reviews']
+
+
+def scores():
+    return current_app.extensions['repositories']['scores']
+
+
+def artifact_store():
+    """The current app's Artifact store"""
+    return current_app.extensions['repositories']['artifacts']
+
+
+def attempt_writer():
+    """The current app's storage.WriteBehind queue for attempt inserts"""
+    return current_app.extensions['attempt_writer']
+
+
+def record_attempt(user_id, question_id, correct, user_answer, mock_session_id=None):
+    """Save an attempt through the write-behind queue (see ATTEMPT_WRITE_MODE)"""
+    attempt_writer().add((user_id, question_id, correct, user_answer, mock_session_id))
+    # The commit happens on the writer thread, outside this request's commit listener
+    _note_write(None)
+
+
+def init_app(app):
+    """Create the configured database and repositories; register the schema check and init-db"""
+    with app.app_context():
+        db = storage.create_database(
+            database_uri(app.config),
+            pool_size=app.config['DATABASE_POOL_SIZE'],
+            pool_timeout=app.config['DATABASE_POOL_TIMEOUT'],
+            replica_uri=app.config['DATABASE_REPLICA_URL'],
+            read_pool_size=app.config['DATABASE_READ_POOL_SIZE']
+        )
+    db.add_commit_listener(_note_write)
+    blob_dir = app.config.get('ARTIFACT_DIR')
+    if blob_dir is None and db.dialect != 'sqlite':
+        blob_dir = os.path.join(app.instance_path, 'artifacts')
+    app.extensions['database'] = db
+    review_schedule, user_scores = ReviewSchedule(db), UserScores(db)
+    app.extensions['repositories'] = {
+        'users': User(db, hasher=app.extensions.get('password_hasher'),
+                      cache=ProfileCache(app.config['USER_CACHE_SIZE'], app.config['USER_CACHE_TTL'])),
+        'attempts': Attempt(db, trackers=(review_schedule, user_scores)),
+        'reviews': review_schedule,
+        'scores': user_scores,
+        'mock_sessions': MockSession(db),
+        'artifacts': Artifact(db, blob_dir=blob_dir),
+    }
+
+    mode = app.config['ATTEMPT_WRITE_MODE']
+    if mode not in ('group', 'async', 'sync'):
+        raise ValueError(f"ATTEMPT_WRITE_MODE must be 'group', 'async' or 'sync', not {mode!r}")
+    app.extensions['attempt_writer'] = storage.WriteBehind(
+        app.extensions['repositories']['attempts'].insert_many,
+        max_rows=app.config['ATTEMPT_BATCH_ROWS'],
+        max_delay=app.config['ATTEMPT_BATCH_MS'] / 1000.0,
+        max_queue=app.config['ATTEMPT_QUEUE_SIZE'],
+        wait=mode != 'async',
+        inline=mode == 'sync',
+        name='attempt-writer'
+    )
+
+    app.before_request(ensure_schema)
+    app.after_request(_remember_write)
+
+    @app.cli.command('init-db')
+    def init_db_command():
+        """Create or upgrade the database schema"""
+        init_db()
+        print(f'Initialized database at {database().display_uri} (schema version {SCHEMA_VERSION})')
+
+    @app.cli.command('archive-attempts')
+    @click.option('--days', type=int, default=None, help='retention horizon (default ATTEMPT_RETENTION_DAYS)')
+    def archive_attempts_command(days):
+        """Move attempts older than the retention horizon into monthly archive tables"""
+        days = app.config['ATTEMPT_RETENTION_DAYS'] if days is None else days
+        if days <= 0:
+            print('Attempt archival is disabled (ATTEMPT_RETENTION_DAYS=0)')
+            return
+        ensure_schema()
+        before = (datetime.now(timezone.utc) - timedelta(days=days)).strftime('%Y-%m-%d')
+        moved = AttemptArchive(database()).archive(before)
+        for month, rows in moved.items():
+            print(f'{month}: {rows} attempts archived')
+        print(f'Archived {sum(moved.values())} attempts older than {before}')
@@ -0,0 +1,57 @@
+"""
+Application factory - the one place an app is built and configured
+Every entry point (backend.app, index.py, app_vercel.py, app_production.py,
+wsgi.py) calls create_app(), so JSON, metrics, the query profiler, the
+database hooks and the blueprints are wired identically everywhere.
+"""
+
+import os
+
+from flask import Flask
+
+from . import db
+from .blueprints import register_blueprints
+from .config import config as config_by_name
+from .services import (analytics, assets, compression, leaderboard, metrics, page_cache, password_hasher,
+                       query_profiler, template_cache)
+from .services.json_codec import FastJSONProvider
+
+_FRONTEND = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'frontend')
+
+
+def create_app(config=None):
+    """Build the Flask app.
+
+    `config` may be a name from backend.config.config ('development',
+    'production', 'testing'), a config class, or a dict of overrides applied on
+    top of the FLASK_ENV config (default 'production').
+    """
+    overrides = {}
+    if isinstance(config, dict):
+        overrides, config = config, None
+    if config is None:
+        config = os.environ.get('FLASK_ENV') or 'production'
+    if isinstance(config, str):
+        config = config_by_name.get(config, config_by_name['default'])
+
+    app = Flask(__name__.split('.')[0],
+                template_folder=os.path.join(_FRONTEND, 'templates'),
+                static_folder=os.path.join(_FRONTEND, 'static'))
+    app.config.from_object(config)
+    app.config.update(overrides)
+
+    template_cache.init_app(app)
+    app.json = FastJSONProvider(app)
+    assets.init_app(app)
+    metrics.init_app(app)
+    query_profiler.init_app(app)
+    password_hasher.init_app(app)
+    db.init_app(app)
+    analytics.init_app(app)
+    leaderboard.init_app(app)
+    register_blueprints(app)
+    if app.config['TEMPLATE_PRECOMPILE']:
+        template_cache.precompile(app)
+    page_cache.init_app(app)
+    compression.init_app(app)
+    return app
@@ -0,0 +1,118 @@
+"""
+Attempt Archive Model - Data Access Layer
+Moves attempts older than the retention horizon out of the hot `attempts`
+table into one table per month (attempts_YYYY_MM), adds them to the per-user,
+per-day totals in attempt_rollups, and keeps two views over the result:
+attempts_archived (every monthly table) and attempts_history (hot + archived).
+"""
+
+import re
+from datetime import date
+
+from .. import storage
+
+ATTEMPT_COLUMNS = 'id, user_id, question_id, correct, user_answer, mock_session_id, timestamp'
+_MONTH = re.compile(r'^\d{4}-\d{2}$')
+
+
+def month_table(month):
+    """'YYYY-MM' -> the archive table name 'attempts_YYYY_MM'"""
+    if not _MONTH.match(month):
+        raise ValueError(f'Not a YYYY-MM month: {month!r}')
+    return 'attempts_' + month.replace('-', '_')
+
+
+def next_month(month):
+    """'YYYY-MM' -> the following 'YYYY-MM'"""
+    year, number = int(month[:4]), int(month[5:7])
+    return f'{year + number // 12:04d}-{number % 12 + 1:02d}'
+
+
+def rebuild_views(database, conn, months):
+    """(Re)create attempts_archived over the given months' tables and attempts_history over everything"""
+    database.execute(conn, 'DROP VIEW IF EXISTS attempts_history')
+    database.execute(conn, 'DROP VIEW IF EXISTS attempts_archived')
+    selects = [f'SELECT {ATTEMPT_COLUMNS} FROM {month_table(month)}' for month in months]
+    # No archive yet: an empty view with the same columns, so queries need no special case
+    archived = ' UNION ALL '.join(selects) or f'SELECT {ATTEMPT_COLUMNS} FROM attempts WHERE 0 = 1'
+    database.execute(conn, f'CREATE VIEW attempts_archived AS {archived}')
+    database.execute(conn, f'''
+        CREATE VIEW attempts_history AS
+        SELECT {ATTEMPT_COLUMNS} FROM attempts UNION ALL SELECT {ATTEMPT_COLUMNS} FROM attempts_archived
+    ''')
+
+
+class AttemptArchive:
+    def __init__(self, db='interview_prep.db'):
+        # A storage.Database, or a SQLite file path for standalone use
+        self.db = storage.resolve(db)
+
+    def months(self):
+        """Archived months ('YYYY-MM'), oldest first"""
+        return [row[0] for row in self.db.fetchall('SELECT month FROM attempt_archives ORDER BY month')]
+
+    def archive(self, before):
+        """Move attempts with timestamp < `before` ('YYYY-MM-DD') into monthly tables.
+
+        Each month is moved in its own transaction (copy, roll up, delete,
+        register), so an interrupted run never counts a row twice. Returns
+        {month: rows moved}.
+        """
+        date.fromisoformat(before)
+        oldest = self.db.scalar('SELECT MIN(timestamp) FROM attempts WHERE timestamp < ?', (before,))
+        moved = {}
+        month = oldest[:7] if oldest else None
+        while month is not None and f'{month}-01' < before:
+            end = min(f'{next_month(month)}-01', before)
+            with self.db.transaction() as conn:
+                rows = self._move(conn, month, f'{month}-01', end)
+            if rows:
+                moved[month] = rows
+            month = next_month(month)
+        if moved:
+            with self.db.transaction() as conn:
+                rebuild_views(self.db, conn, [row[0] for row in self.db.execute(
+                    conn, 'SELECT month FROM attempt_archives ORDER BY month').fetchall()])
+        return moved
+
+    def _move(self, conn, month, start, end):
+        table = month_table(month)
+        self.db.execute(conn, self.db.ddl(f'''
+            CREATE TABLE IF NOT EXISTS {table} (
+                id INTEGER PRIMARY KEY,
+                user_id INTEGER NOT NULL,
+                question_id INTEGER NOT NULL,
+                correct BOOLEAN NOT NULL,
+                user_answer TEXT,
+                mock_session_id INTEGER,
+                timestamp TIMESTAMP
+            )
+        '''))
+        self.db.execute(conn, f'CREATE INDEX IF NOT EXISTS idx_{table}_user_time ON {table} (user_id, timestamp)')
+        if self.db.dialect != 'sqlite':
+            # Copy, roll-up and delete must see the same rows: hold off concurrent inserts (reads
+            # continue). SQLite's write lock, taken by the copy, already does this
+            self.db.execute(conn, 'LOCK TABLE attempts IN EXCLUSIVE MODE')
+        rows = self.db.execute(conn, f'''
+            INSERT INTO {table} ({ATTEMPT_COLUMNS})
+            SELECT {ATTEMPT_COLUMNS} FROM attempts WHERE timestamp >= ? AND timestamp < ?
+        ''', (start, end)).rowcount
+        if not rows:
+            return 0
+        self.db.execute(conn, '''
+            INSERT INTO attempt_rollups (user_id, day, attempts, correct)
+            SELECT user_id, substr(timestamp, 1, 10), COUNT(*), SUM(correct)
+            FROM attempts
+            WHERE timestamp >= ? AND timestamp < ?
+            GROUP BY user_id, substr(timestamp, 1, 10)
+            ON CONFLICT (user_id, day) DO UPDATE SET
+                attempts = attempt_rollups.attempts + excluded.attempts,
+                correct = attempt_rollups.correct + excluded.correct
+        ''', (start, end))
+        self.db.execute(conn, 'DELETE FROM attempts WHERE timestamp >= ? AND timestamp < ?', (start, end))
+        self.db.execute(conn, '''
+            INSERT INTO attempt_archives (month, row_count, archived_at) VALUES (?, ?, CURRENT_TIMESTAMP)
+            ON CONFLICT (month) DO UPDATE SET
+                row_count = attempt_archives.row_count + excluded.row_count, archived_at = excluded.archived_at
+        ''', (month, rows))
+        return rows
@@ -0,0 +1,147 @@
+"""
+Artifact Model - Data Access Layer
+Persists generated roadmap/resume results: metadata rows in the database and
+gzip-compressed JSON blobs on disk, deduplicated by input fingerprint.
+"""
+
+import gzip
+import hashlib
+import os
+
+from .. import storage
+from ..services.json_codec import dumps_bytes, loads
+
+
+def normalize_inputs(value):
+    """Canonical form of form inputs: case/whitespace-insensitive, sorted keys"""
+    if isinstance(value, dict):
+        return {str(k): normalize_inputs(v) for k, v in sorted(value.items())}
+    if isinstance(value, (list, tuple)):
+        return [normalize_inputs(v) for v in value]
+    if isinstance(value, str):
+        return ' '.join(value.split()).casefold()
+    return value
+
+
+def fingerprint(kind, inputs):
+    """Stable SHA-256 fingerprint of normalized inputs for an artifact kind"""
+    canonical = dumps_bytes({'kind': kind, 'inputs': normalize_inputs(inputs)})
+    return hashlib.sha256(canonical).hexdigest()
+
+
+class Artifact:
+    def __init__(self, db='interview_prep.db', blob_dir=None):
+        # A storage.Database, or a SQLite file path for standalone use
+        self.db = storage.resolve(db)
+        if blob_dir is None:
+            # Next to the SQLite file; server databases must be given a directory
+            blob_dir = os.path.join(os.path.dirname(os.path.abspath(self.db.path)), 'artifacts')
+        self.blob_dir = blob_dir
+
+    def _blob_path(self, digest):
+        return os.path.join(self.blob_dir, digest[:2], digest + '.json.gz')
+
+    def _write_blob(self, payload):
+        """Write payload as a content-addressed blob; identical payloads share a file"""
+        raw = dumps_bytes(payload)
+        digest = hashlib.sha256(raw).hexdigest()
+        path = self._blob_path(digest)
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp = f'{path}.{os.getpid()}.tmp'
+            with open(tmp, 'wb') as f:
+                f.write(gzip.compress(raw, compresslevel=6))
+            os.replace(tmp, path)
+        return digest, len(raw)
+
+    def _read_blob(self, digest):
+        try:
+            with open(self._blob_path(digest), 'rb') as f:
+                return loads(gzip.decompress(f.read()))
+        except (OSError, ValueError):
+            return None
+
+    def _row_to_dict(self, row):
+        return {
+            'id': row[0],
+            'kind': row[1],
+            'title': row[2],
+            'size_bytes': row[3],
+            'created_at': row[4]
+        }
+
+    def save(self, user_id, kind, fp, payload, title=None):
+        """Store payload for (user, kind, fingerprint), replacing any previous result"""
+        digest, size = self._write_blob(payload)
+        with self.db.transaction() as conn:
+            self.db.execute(conn, '''
+                INSERT INTO artifacts (user_id, kind, fingerprint, title, blob_digest, size_bytes)
+                VALUES (?, ?, ?, ?, ?, ?)
+                ON CONFLICT (user_id, kind, fingerprint) DO UPDATE SET
+                    title = excluded.title,
+                    blob_digest = excluded.blob_digest,
+                    size_bytes = excluded.size_bytes,
+                    created_at = CURRENT_TIMESTAMP
+            ''', (user_id, kind, fp, title, digest, size))
+            return self.db.execute(
+                conn,
+                'SELECT id FROM artifacts WHERE user_id = ? AND kind = ? AND fingerprint = ?',
+                (user_id, kind, fp)
+            ).fetchone()[0]
+
+    def find(self, user_id, kind, fp):
+        """Return (artifact_id, payload) for the user's previous result, or None"""
+        row = self.db.fetchone(
+            'SELECT id, blob_digest FROM artifacts WHERE user_id = ? AND kind = ? AND fingerprint = ?',
+            (user_id, kind, fp)
+        )
+        if not row:
+            return None
+        payload = self._read_blob(row[1])
+        return (row[0], payload) if payload is not None else None
+
+    def find_shared(self, kind, fp):
+        """Return the newest (blob_digest, title) any user stored for this fingerprint"""
+        return self.db.fetchone('''
+            SELECT blob_digest, title FROM artifacts
+            WHERE kind = ? AND fingerprint = ?
+            ORDER BY created_at DESC LIMIT 1
+        ''', (kind, fp))
+
+    def adopt_shared(self, user_id, kind, fp):
+        """Link another user's result for the same fingerprint into this user's history"""
+        shared = self.find_shared(kind, fp)
+        if not shared:
+            return None
+        payload = self._read_blob(shared[0])
+        if payload is None:
+            return None
+        return self.save(user_id, kind, fp, payload, title=shared[1]), payload
+
+    def get(self, artifact_id, user_id):
+        """Load one artifact owned by user_id"""
+        row = self.db.fetchone('''
+            SELECT id, kind, title, size_bytes, created_at, blob_digest
+            FROM artifacts WHERE id = ? AND user_id = ?
+        ''', (artifact_id, user_id))
+        if not row:
+            return None
+        artifact = self._row_to_dict(row)
+        artifact['payload'] = self._read_blob(row[5])
+        return artifact
+
+    def history(self, user_id, kind=None, limit=20):
+        """List a user's artifacts, newest first (metadata only)"""
+        if kind:
+            rows = self.db.fetchall('''
+                SELECT id, kind, title, size_bytes, created_at FROM artifacts
+                WHERE user_id = ? AND kind = ?
+                ORDER BY created_at DESC, id DESC LIMIT ?
+            ''', (user_id, kind, limit))
+        else:
+            rows = self.db.fetchall('''
+                SELECT id, kind, title, size_bytes, created_at FROM artifacts
+                WHERE user_id = ?
+                ORDER BY created_at DESC, id DESC LIMIT ?
+            ''', (user_id, limit))
+        return [self._row_to_dict(row) for row in rows]
@@ -3,74 +3,204 @@ Attempt Model - Data Access Layer
 Handles all practice attempt-related database operations
 """
 
-import sqlite3
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
+
+from .. import storage
+from .archive import next_month
+
 
 class Attempt:
-    def __init__(self, db_path='interview_prep.db'):
-        self.db_path = db_path
-    
-    def create_attempt(self, user_id, question_id, correct, user_answer):
+    def __init__(self, db='interview_prep.db', trackers=()):
+        # A storage.Database, or a SQLite file path for standalone use
+        self.db = storage.resolve(db)
+        # Derived tables (ReviewSchedule, UserScores) whose record(conn, rows) runs
+        # in the same transaction as every insert
+        self.trackers = tuple(trackers)
+
+    def create_attempt(self, user_id, question_id, correct, user_answer, mock_session_id=None):
         """Create a new practice attempt"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        cursor.execute(
-            'INSERT INTO attempts (user_id, question_id, correct, user_answer) VALUES (?, ?, ?, ?)',
-            (user_id, question_id, correct, user_answer)
-        )
-        attempt_id = cursor.lastrowid
-        conn.commit()
-        conn.close()
+        with self.db.transaction() as conn:
+            attempt_id = self.db.insert(
+                conn,
+                'INSERT INTO attempts (user_id, question_id, correct, user_answer, mock_session_id) '
+                'VALUES (?, ?, ?, ?, ?)',
+                (user_id, question_id, 1 if correct else 0, user_answer, mock_session_id)
+            )
+            row = (user_id, question_id, 1 if correct else 0, user_answer, mock_session_id, None)
+            for tracker in self.trackers:
+                tracker.record(conn, [row])
         return attempt_id
-    
+
+    def insert_many(self, rows):
+        """Insert (user_id, question_id, correct, user_answer, mock_session_id[, timestamp]) rows in one transaction.
+
+        timestamp is a UTC 'YYYY-MM-DD HH:MM:SS' string (answers recorded
+        offline); omitted or None means now.
+        """
+        rows = [(row[0], row[1], 1 if row[2] else 0, row[3], row[4], row[5] if len(row) > 5 else None)
+                for row in rows]
+        with self.db.transaction() as conn:
+            self.db.executemany(
+                conn,
+                'INSERT INTO attempts (user_id, question_id, correct, user_answer, mock_session_id, timestamp) '
+                'VALUES (?, ?, ?, ?, ?, COALESCE(?, CURRENT_TIMESTAMP))',
+                rows
+            )
+            for tracker in self.trackers:
+                tracker.record(conn, rows)
+        return len(rows)
+
+    def bank_question_ids(self, question_ids):
+        """The subset of question_ids that exist in the questions table"""
+        question_ids = sorted({question_id for question_id in question_ids if question_id})
+        if not question_ids:
+            return set()
+        return {row[0] for row in self.db.fetchall(
+            f'SELECT id FROM questions WHERE id IN ({", ".join("?" * len(question_ids))})', question_ids
+        )}
+
     def get_user_attempts(self, user_id):
-        """Get all attempts for a user"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        cursor.execute(
-            'SELECT * FROM attempts WHERE user_id = ? ORDER BY timestamp DESC',
+        """Get all attempts for a user, archived months included"""
+        return self.db.fetchall(
+            'SELECT * FROM attempts_history WHERE user_id = ? ORDER BY timestamp DESC',
             (user_id,)
         )
-        attempts = cursor.fetchall()
-        conn.close()
-        return attempts
-    
+
+    def recent(self, user_id, limit=20):
+        """(id, question_id, correct, user_answer, timestamp) rows, newest first"""
+        return self.db.fetchall('''
+            SELECT a.id, a.question_id, a.correct, a.user_answer, a.timestamp
+            FROM attempts a
+            WHERE a.user_id = ?
+            ORDER BY a.timestamp DESC
+            LIMIT ?
+        ''', (user_id, limit))
+
+    def history(self, user_id, limit=20, before=None, correct=None, topic=None, since=None, until=None):
+        """One page of attempts joined with their question, newest first.
+
+        Keyset pagination: `before` is the (timestamp, id) of the last row of
+        the previous page, so any page is one index seek. `since`/`until` are
+        timestamp bounds (inclusive/exclusive). Attempts without a bank
+        question (AI interview, question_id 0) come back with NULL question
+        columns. Rows: (id, question_id, correct, user_answer, timestamp,
+        type, difficulty, topic, question, answer, hints, tags).
+
+        Pages read the hot table. The archived months are read too only
+        when the page could hold archived rows, i.e. it came up short or
+        reaches back past the newest archived month; the two are then merged
+        by (timestamp, id), since the hot table can hold answers older than
+        the archive (offline answers synced late).
+        """
+        rows = self._history_page('attempts', user_id, limit, before, correct, topic, since, until)
+        archived_until = self._archived_until()
+        if archived_until is not None and (len(rows) < limit or str(rows[-1][4]) < archived_until):
+            rows += self._history_page('attempts_archived', user_id, limit, before, correct, topic, since, until)
+            rows = sorted(rows, key=lambda row: (str(row[4]), row[0]), reverse=True)[:limit]
+        return rows
+
+    def _archived_until(self):
+        """'YYYY-MM-01' after the newest archived month (every archived row is older), or None"""
+        month = self.db.scalar('SELECT MAX(month) FROM attempt_archives')
+        return None if month is None else f'{next_month(month)}-01'
+
+    def _history_page(self, source, user_id, limit, before, correct, topic, since, until):
+        conditions, params = ['a.user_id = ?'], [user_id]
+        if before is not None:
+            conditions.append('(a.timestamp, a.id) < (?, ?)')
+            params.extend(before)
+        if correct is not None:
+            conditions.append('a.correct = ?')
+            params.append(1 if correct else 0)
+        if topic is not None:
+            conditions.append('q.topic = ?')
+            params.append(topic)
+        if since is not None:
+            conditions.append('a.timestamp >= ?')
+            params.append(since)
+        if until is not None:
+            conditions.append('a.timestamp < ?')
+            params.append(until)
+        params.append(limit)
+        return self.db.fetchall(f'''
+            SELECT a.id, a.question_id, a.correct, a.user_answer, a.timestamp,
+                   q.type, q.difficulty, q.topic, q.question, q.answer, q.hints, q.tags
+            FROM {source} a
+            LEFT JOIN questions q ON q.id = a.question_id
+            WHERE {' AND '.join(conditions)}
+            ORDER BY a.timestamp DESC, a.id DESC
+            LIMIT ?
+        ''', params)
+
     def get_user_stats(self, user_id):
         """Get user statistics"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        # Total questions attempted
-        cursor.execute('SELECT COUNT(*) FROM attempts WHERE user_id = ?', (user_id,))
-        total_attempted = cursor.fetchone()[0]
-        
-        # Correct answers
-        cursor.execute('SELECT COUNT(*) FROM attempts WHERE user_id = ? AND correct = 1', (user_id,))
-        correct_answers = cursor.fetchone()[0]
-        
+        # Lifetime totals: hot attempts plus the daily rollups of archived ones, in one statement
+        total_attempted, correct_answers = self.db.fetchone('''
+            SELECT hot.attempts + archived.attempts, hot.correct + archived.correct
+            FROM (SELECT COUNT(*) AS attempts, COALESCE(SUM(correct), 0) AS correct
+                  FROM attempts WHERE user_id = ?) hot,
+                 (SELECT COALESCE(SUM(attempts), 0) AS attempts, COALESCE(SUM(correct), 0) AS correct
+                  FROM attempt_rollups WHERE user_id = ?) archived
+        ''', (user_id, user_id))
+
         # Calculate accuracy
         accuracy = (correct_answers / total_attempted * 100) if total_attempted > 0 else 0
-        
-        conn.close()
-        
+
         return {
             'total_attempted': total_attempted,
             'correct_answers': correct_answers,
             'accuracy': accuracy
         }
-    
+
     def get_weak_topics(self, user_id, limit=3):
-        """Get user's weak topics"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        cursor.execute('''
-            SELECT question_id, COUNT(*) as incorrect_count
-            FROM attempts 
-            WHERE user_id = ? AND correct = 0
-            GROUP BY question_id 
-            ORDER BY incorrect_count DESC 
+        """(topic, incorrect_count) of the bank topics the user missed most, archived months included"""
+        return self.db.fetchall('''
+            SELECT q.topic, COUNT(*) as incorrect_count
+            FROM attempts_history a
+            JOIN questions q ON q.id = a.question_id
+            WHERE a.user_id = ? AND a.correct = 0 AND q.topic IS NOT NULL
+            GROUP BY q.topic
+            ORDER BY incorrect_count DESC
             LIMIT ?
         ''', (user_id, limit))
-        weak_topics = cursor.fetchall()
-        conn.close()
-        return weak_topics
+
+    def columns(self, user_id):
+        """(timestamp, correct, topic, difficulty, tags JSON) of every bank-question attempt, oldest first.
+
+        Archived months included, so analytics cover the same lifetime as get_user_stats.
+        """
+        return self.db.fetchall('''
+            SELECT a.timestamp, a.correct, COALESCE(q.topic, 'unknown'), COALESCE(q.difficulty, 'unknown'),
+                   COALESCE(q.tags, '[]')
+            FROM attempts_history a
+            JOIN questions q ON q.id = a.question_id
+            WHERE a.user_id = ?
+            ORDER BY a.timestamp
+        ''', (user_id,))
+
+    def practice_dates(self, user_id):
+        """Distinct 'YYYY-MM-DD' days with at least one attempt, newest first (archived days from the rollups)"""
+        rows = self.db.fetchall('''
+            SELECT substr(timestamp, 1, 10) as practice_date
+            FROM attempts
+            WHERE user_id = ?
+            UNION
+            SELECT day FROM attempt_rollups WHERE user_id = ?
+            ORDER BY practice_date DESC
+        ''', (user_id, user_id))
+        return [row[0] for row in rows]
+
+    def count_correct_in_session(self, user_id, mock_session_id):
+        return self.db.scalar('''
+            SELECT COUNT(*) FROM attempts
+            WHERE user_id = ? AND correct = 1 AND mock_session_id = ?
+        ''', (user_id, mock_session_id))
+
+    def counts_since(self, user_id, minutes):
+        """(attempted, correct) in the last `minutes` minutes"""
+        since = (datetime.now(timezone.utc) - timedelta(minutes=minutes)).strftime('%Y-%m-%d %H:%M:%S')
+        row = self.db.fetchone('''
+            SELECT COUNT(*), COALESCE(SUM(correct), 0) FROM attempts
+            WHERE user_id = ? AND timestamp >= ?
+        ''', (user_id, since))
+        return row[0], row[1]
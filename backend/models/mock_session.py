@@ -0,0 +1,45 @@
+"""
+Mock Session Model - Data Access Layer
+Handles mock and AI interview session rows
+"""
+
+from .. import storage
+
+
+class MockSession:
+    def __init__(self, db='interview_prep.db'):
+        # A storage.Database, or a SQLite file path for standalone use
+        self.db = storage.resolve(db)
+
+    def create(self, user_id):
+        """Open a session; returns its id"""
+        return self.db.insert_one('INSERT INTO mock_sessions (user_id) VALUES (?)', (user_id,))
+
+    def end(self, mock_session_id, total_questions, correct_answers):
+        self.db.write('''
+            UPDATE mock_sessions
+            SET end_time = CURRENT_TIMESTAMP, total_questions = ?, correct_answers = ?
+            WHERE id = ?
+        ''', (total_questions, correct_answers, mock_session_id))
+
+    def count_for_user(self, user_id):
+        return self.db.scalar('SELECT COUNT(*) FROM mock_sessions WHERE user_id = ?', (user_id,))
+
+    def recent(self, user_id, limit=5):
+        """(total_questions, correct_answers, start_time) of finished sessions, newest first"""
+        return self.db.fetchall('''
+            SELECT total_questions, correct_answers, start_time
+            FROM mock_sessions
+            WHERE user_id = ? AND total_questions > 0
+            ORDER BY start_time DESC
+            LIMIT ?
+        ''', (user_id, limit))
+
+    def latest(self, user_id):
+        """(total_questions, correct_answers, start_time, end_time) of the newest session, or None"""
+        return self.db.fetchone('''
+            SELECT total_questions, correct_answers, start_time, end_time
+            FROM mock_sessions
+            WHERE user_id = ?
+            ORDER BY start_time DESC LIMIT 1
+        ''', (user_id,))
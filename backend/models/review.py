@@ -0,0 +1,83 @@
+"""
+Review Model - Data Access Layer
+Spaced-repetition state per (user, question), updated with every attempt
+"""
+
+from collections import defaultdict
+from datetime import datetime, timezone
+
+from .. import storage
+from ..services.spaced_repetition import INITIAL_EASE, TIMESTAMP_FORMAT, due_at, schedule
+
+
+class ReviewSchedule:
+    def __init__(self, db='interview_prep.db'):
+        # A storage.Database, or a SQLite file path for standalone use
+        self.db = storage.resolve(db)
+
+    def record(self, conn, rows):
+        """Reschedule the questions answered in `rows` inside the caller's transaction.
+
+        rows are Attempt.insert_many rows: (user_id, question_id, correct,
+        user_answer, mock_session_id, timestamp or None). Attempts without a
+        bank question (question_id 0 or missing) are ignored, and so is an
+        attempt older than the question's last review (an offline answer synced
+        late), which the schedule has already moved past.
+        """
+        now = datetime.now(timezone.utc).strftime(TIMESTAMP_FORMAT)
+        by_user = defaultdict(list)
+        for user_id, question_id, correct, _, _, timestamp in rows:
+            if isinstance(question_id, int) and not isinstance(question_id, bool) and question_id > 0:
+                by_user[user_id].append((timestamp or now, question_id, bool(correct)))
+
+        updates = []
+        for user_id, answers in by_user.items():
+            question_ids = sorted({question_id for _, question_id, _ in answers})
+            states = {row[0]: list(row[1:]) for row in self.db.execute(conn, f'''
+                SELECT question_id, reps, interval_days, ease, lapses, last_review
+                FROM review_state
+                WHERE user_id = ? AND question_id IN ({', '.join('?' * len(question_ids))})
+            ''', [user_id, *question_ids]).fetchall()}
+            changed = set()
+            for reviewed_at, question_id, correct in sorted(answers):
+                reps, interval, ease, lapses, last_review = states.get(question_id, (0, 0.0, INITIAL_EASE, 0, None))
+                if last_review is not None and reviewed_at < last_review:
+                    continue
+                reps, interval, ease = schedule(reps, interval, ease, correct)
+                states[question_id] = [reps, interval, ease, lapses + (not correct), reviewed_at]
+                changed.add(question_id)
+            for question_id in sorted(changed):
+                reps, interval, ease, lapses, reviewed_at = states[question_id]
+                updates.append((user_id, question_id, reps, interval, ease, lapses, reviewed_at,
+                                due_at(reviewed_at, interval)))
+        if updates:
+            self.db.executemany(conn, '''
+                INSERT INTO review_state (user_id, question_id, reps, interval_days, ease, lapses, last_review, due_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT (user_id, question_id) DO UPDATE SET
+                    reps = excluded.reps, interval_days = excluded.interval_days, ease = excluded.ease,
+                    lapses = excluded.lapses, last_review = excluded.last_review, due_at = excluded.due_at
+            ''', updates)
+        return len(updates)
+
+    def due(self, user_id, limit=10, now=None):
+        """Questions due for review by `now` (default: now), most overdue first.
+
+        One seek on (user_id, due_at). Rows: (question_id, due_at, reps,
+        interval_days, ease, lapses, type, difficulty, topic, question);
+        questions no longer in the bank are left out.
+        """
+        now = now or datetime.now(timezone.utc).strftime(TIMESTAMP_FORMAT)
+        return self.db.fetchall('''
+            SELECT r.question_id, r.due_at, r.reps, r.interval_days, r.ease, r.lapses,
+                   q.type, q.difficulty, q.topic, q.question
+            FROM review_state r
+            JOIN questions q ON q.id = r.question_id
+            WHERE r.user_id = ? AND r.due_at <= ?
+            ORDER BY r.due_at
+            LIMIT ?
+        ''', (user_id, now, limit))
+
+    def next_due(self, user_id):
+        """Earliest due_at of any of the user's questions, or None"""
+        return self.db.scalar('SELECT MIN(due_at) FROM review_state WHERE user_id = ?', (user_id,))
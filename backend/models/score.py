@@ -0,0 +1,77 @@
+"""
+Score Model - Data Access Layer
+Per-user lifetime totals and practice streak for the leaderboard, updated with
+every attempt so rankings never aggregate the attempts table
+"""
+
+from collections import defaultdict
+from datetime import date, datetime, timedelta, timezone
+
+from .. import storage
+
+
+def extend_streak(streak, last_day, day):
+    """(streak, last_day) after practising on `day` ('YYYY-MM-DD'); older days change nothing"""
+    if last_day is None or day > last_day:
+        next_day = (date.fromisoformat(last_day) + timedelta(days=1)).isoformat() if last_day else None
+        return (streak + 1 if day == next_day else 1), day
+    return streak, last_day
+
+
+class UserScores:
+    def __init__(self, db='interview_prep.db'):
+        # A storage.Database, or a SQLite file path for standalone use
+        self.db = storage.resolve(db)
+
+    def record(self, conn, rows):
+        """Add Attempt.insert_many rows to their users' totals inside the caller's transaction"""
+        today = datetime.now(timezone.utc).strftime('%Y-%m-%d')
+        by_user = defaultdict(list)
+        for user_id, _, correct, _, _, timestamp in rows:
+            by_user[user_id].append((timestamp[:10] if timestamp else today, 1 if correct else 0))
+        if not by_user:
+            return 0
+
+        user_ids = sorted(by_user)
+        current = {row[0]: row[1:] for row in self.db.execute(conn, f'''
+            SELECT user_id, streak, last_day FROM user_scores
+            WHERE user_id IN ({', '.join('?' * len(user_ids))})
+        ''', user_ids).fetchall()}
+        updates = []
+        for user_id in user_ids:
+            answers = by_user[user_id]
+            streak, last_day = current.get(user_id, (0, None))
+            for day in sorted({day for day, _ in answers}):
+                streak, last_day = extend_streak(streak, last_day, day)
+            updates.append((user_id, len(answers), sum(correct for _, correct in answers), streak, last_day))
+        self.db.executemany(conn, '''
+            INSERT INTO user_scores (user_id, attempts, correct, streak, last_day, updated_at)
+            VALUES (?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
+            ON CONFLICT (user_id) DO UPDATE SET
+                attempts = user_scores.attempts + excluded.attempts,
+                correct = user_scores.correct + excluded.correct,
+                streak = excluded.streak, last_day = excluded.last_day, updated_at = excluded.updated_at
+        ''', updates)
+        return len(updates)
+
+    def version(self, user_id):
+        """(attempts, updated_at) of the user's row, one primary-key lookup; changes with every attempt"""
+        row = self.db.fetchone('SELECT attempts, updated_at FROM user_scores WHERE user_id = ?', (user_id,))
+        return tuple(row) if row else (0, None)
+
+    def all(self):
+        """(user_id, name, attempts, correct, streak, last_day, updated_at) for every user with attempts"""
+        return self.db.fetchall('''
+            SELECT s.user_id, u.name, s.attempts, s.correct, s.streak, s.last_day, s.updated_at
+            FROM user_scores s
+            JOIN users u ON u.id = s.user_id
+        ''')
+
+    def changed_since(self, updated_at):
+        """Rows like all() updated at or after `updated_at` (one range seek on updated_at)"""
+        return self.db.fetchall('''
+            SELECT s.user_id, u.name, s.attempts, s.correct, s.streak, s.last_day, s.updated_at
+            FROM user_scores s
+            JOIN users u ON u.id = s.user_id
+            WHERE s.updated_at >= ?
+        ''', (updated_at,))
@@ -3,67 +3,128 @@ User Model - Data Access Layer
 Handles all user-related database operations
 """
 
-import sqlite3
+import logging
+
 from werkzeug.security import generate_password_hash, check_password_hash
-from datetime import datetime
+
+from .. import storage
+from ..services.password_hasher import HasherOverloaded
+
+logger = logging.getLogger(__name__)
+
 
 class User:
-    def __init__(self, db_path='interview_prep.db'):
-        self.db_path = db_path
-    
+    def __init__(self, db='interview_prep.db', hasher=None, cache=None):
+        # A storage.Database, or a SQLite file path for standalone use
+        self.db = storage.resolve(db)
+        # services.password_hasher.PasswordHasher; None hashes inline with werkzeug defaults
+        self.hasher = hasher
+        # services.profile_cache.ProfileCache for id/email profile lookups; None always queries
+        self.cache = cache
+
     def create_user(self, name, email, password):
-        """Create a new user"""
-        password_hash = generate_password_hash(password)
-        
+        """Create a new user; returns the id, or None if the email is taken.
+
+        Raises HasherOverloaded when the hashing pool is saturated.
+        """
+        pwhash = self.hasher.hash(password) if self.hasher else generate_password_hash(password)
+        return self.create_with_hash(name, email, pwhash)
+
+    def create_with_hash(self, name, email, password_hash):
+        """Insert a user row as-is; returns the id, or None if the email is taken"""
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            cursor.execute(
+            user_id = self.db.insert_one(
                 'INSERT INTO users (name, email, password_hash) VALUES (?, ?, ?)',
                 (name, email, password_hash)
             )
-            user_id = cursor.lastrowid
-            conn.commit()
-            conn.close()
-            return user_id
-        except sqlite3.IntegrityError:
+        except self.db.integrity_errors:
             return None
-    
-    def authenticate_user(self, email, password):
-        """Authenticate user login"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        cursor.execute(
-            'SELECT id, name, password_hash FROM users WHERE email = ?', 
+        if self.cache is not None:
+            # Drop anything cached for a previous owner of this email
+            self.cache.invalidate(email=email)
+        return user_id
+
+    def get_by_email(self, email):
+        """(id, name, password_hash) for an email, or None"""
+        return self.db.fetchone(
+            'SELECT id, name, password_hash FROM users WHERE email = ?',
             (email,)
         )
-        user = cursor.fetchone()
-        conn.close()
-        
-        if user and check_password_hash(user[2], password):
-            return {
-                'id': user[0],
-                'name': user[1],
-                'email': email
-            }
-        return None
-    
+
+    def authenticate_user(self, email, password):
+        """Authenticate user login; a matching hash with outdated parameters is upgraded in place.
+
+        Raises HasherOverloaded when the hashing pool is saturated.
+        """
+        user = self.get_by_email(email)
+        if not user:
+            return None
+        if self.hasher is None:
+            if not check_password_hash(user[2], password):
+                return None
+        elif not self.hasher.verify(user[2], password):
+            return None
+        elif self.hasher.needs_rehash(user[2]):
+            self._rehash(user[0], user[2], password)
+
+        return {
+            'id': user[0],
+            'name': user[1],
+            'email': email
+        }
+
+    def _rehash(self, user_id, old_hash, password):
+        try:
+            new_hash = self.hasher.hash(password)
+        except HasherOverloaded:
+            # The login itself succeeded; the next one retries the upgrade
+            return
+        # Compare-and-set so a concurrent password change is never overwritten
+        self.db.write(
+            'UPDATE users SET password_hash = ? WHERE id = ? AND password_hash = ?',
+            (new_hash, user_id, old_hash)
+        )
+        logger.info('Upgraded password hash for user %s to %s', user_id, self.hasher.method)
+
+    def get_or_create(self, email, name, password_hash):
+        """(id, name) of the user with this email, creating the row if needed (OAuth sign-in).
+
+        One atomic upsert, so concurrent first sign-ins for an email cannot
+        race; the no-op DO UPDATE makes RETURNING yield the existing row too.
+        """
+        profile = self.cache.get_by_email(email) if self.cache else None
+        if profile is None:
+            with self.db.transaction() as conn:
+                # fetchall: SQLite must finish the RETURNING statement before the commit
+                row = self.db.execute(
+                    conn,
+                    'INSERT INTO users (name, email, password_hash) VALUES (?, ?, ?) '
+                    'ON CONFLICT (email) DO UPDATE SET email = excluded.email '
+                    'RETURNING id, name, email, created_at',
+                    (name, email, password_hash)
+                ).fetchall()[0]
+            profile = self._profile(row)
+        return profile['id'], profile['name']
+
     def get_user_by_id(self, user_id):
         """Get user by ID"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        cursor.execute(
-            'SELECT id, name, email, created_at FROM users WHERE id = ?', 
+        if self.cache is not None:
+            profile = self.cache.get(user_id)
+            if profile is not None:
+                return profile
+        user = self.db.fetchone(
+            'SELECT id, name, email, created_at FROM users WHERE id = ?',
             (user_id,)
         )
-        user = cursor.fetchone()
-        conn.close()
-        
-        if user:
-            return {
-                'id': user[0],
-                'name': user[1],
-                'email': user[2],
-                'created_at': user[3]
-            }
-        return None
+        return self._profile(user) if user else None
+
+    def _profile(self, row):
+        profile = {
+            'id': row[0],
+            'name': row[1],
+            'email': row[2],
+            'created_at': row[3]
+        }
+        if self.cache is not None:
+            self.cache.put(profile)
+        return profile
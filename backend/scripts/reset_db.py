@@ -3,10 +3,11 @@ import sys
 
 
 def main() -> None:
-    # Ensure we can import app.py from backend package root
-    backend_root = os.path.dirname(os.path.dirname(__file__))
-    if backend_root not in sys.path:
-        sys.path.insert(0, backend_root)
+    # Ensure the repo root is importable so backend.db resolves
+    backend_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    repo_root = os.path.dirname(backend_root)
+    if repo_root not in sys.path:
+        sys.path.insert(0, repo_root)
 
     # Delete existing SQLite file if present
     db_path = os.path.join(backend_root, "interview_prep.db")
@@ -18,15 +19,15 @@ def main() -> None:
             print(f"Failed to delete {db_path}: {exc}")
             sys.exit(1)
 
-    # Import and run init_db from app.py (development path only)
+    # Import and run init_db from backend.db (development path only)
     try:
-        from app import init_db  # type: ignore
+        from backend.db import init_db  # type: ignore
     except Exception as exc:
-        print(f"Failed to import init_db from app.py: {exc}")
+        print(f"Failed to import init_db from backend.db: {exc}")
         sys.exit(1)
 
     try:
-        init_db()
+        init_db(db_path)
         print("Database schema recreated successfully.")
     except Exception as exc:
         print(f"Failed to initialize database: {exc}")
@@ -0,0 +1,208 @@
+"""
+Topic Analytics - accuracy per topic, tag and difficulty from attempt history
+compute() takes one user's bank-question attempts as columns and aggregates
+them with NumPy instead of row by row: group codes from np.unique, counts and
+hits from np.bincount, tags through a tag-set x tag incidence matrix, and the
+daily series' rolling accuracy from a moving-window convolution. Every group gets its
+accuracy with a 95% Wilson interval, plus its accuracy over the last
+TREND_DAYS days and the change against the days before.
+
+Analytics caches results per user and window, keyed by the user's
+user_scores row (attempt count and updated_at, kept current by every insert),
+so the next attempt (saved by any worker) invalidates them on the following
+request and a cache hit costs one primary-key lookup.
+"""
+
+import threading
+from collections import OrderedDict
+from datetime import datetime, timezone
+
+from .json_codec import loads
+
+Z_95 = 1.959964
+# "Recent" window for the per-group trend
+TREND_DAYS = 14
+# Window of the daily series' rolling accuracy
+ROLLING_DAYS = 7
+
+_np = None
+
+
+def _numpy():
+    """Import NumPy on first use; it adds ~100 ms to worker startup"""
+    global _np
+    if _np is None:
+        import numpy
+        _np = numpy
+    return _np
+
+
+def _pct(value):
+    """Fraction as a rounded percentage; NaN (no attempts) as None"""
+    return None if value != value else round(value * 100, 1)
+
+
+def wilson_interval(hits, attempts, z=Z_95):
+    """(low, high) arrays: Wilson score interval of hits/attempts, NaN where attempts is 0"""
+    np = _numpy()
+    n = np.asarray(attempts, dtype=np.float64)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        p = hits / n
+        z2 = z * z
+        denominator = 1 + z2 / n
+        center = (p + z2 / (2 * n)) / denominator
+        half = z * np.sqrt(p * (1 - p) / n + z2 / (4 * n * n)) / denominator
+    return np.clip(center - half, 0, 1), np.clip(center + half, 0, 1)
+
+
+def _tally(codes, size, correct, recent):
+    """(size, 4) matrix of attempts, hits, recent attempts, recent hits per group code"""
+    np = _numpy()
+    return np.stack([
+        np.bincount(codes, minlength=size),
+        np.bincount(codes, weights=correct, minlength=size),
+        np.bincount(codes[recent], minlength=size),
+        np.bincount(codes[recent], weights=correct[recent], minlength=size),
+    ], axis=1).astype(np.float64)
+
+
+def _summaries(names, tally):
+    """One dict per group, weakest (lowest accuracy, then most attempts) first"""
+    np = _numpy()
+    attempts, hits, recent_attempts, recent_hits = tally.T
+    earlier_attempts, earlier_hits = attempts - recent_attempts, hits - recent_hits
+    with np.errstate(divide='ignore', invalid='ignore'):
+        accuracy = hits / attempts
+        recent = recent_hits / recent_attempts
+        trend = recent - earlier_hits / earlier_attempts
+    low, high = wilson_interval(hits, attempts)
+    order = np.lexsort((-attempts, accuracy))
+    columns = [c.tolist() for c in (attempts, hits, accuracy, low, high, recent_attempts, recent, trend)]
+    return [{
+        'name': names[i],
+        'attempts': int(columns[0][i]),
+        'correct': int(columns[1][i]),
+        'accuracy': _pct(columns[2][i]),
+        'ci_low': _pct(columns[3][i]),
+        'ci_high': _pct(columns[4][i]),
+        'recent_attempts': int(columns[5][i]),
+        'recent_accuracy': _pct(columns[6][i]),
+        'trend': _pct(columns[7][i]),
+    } for i in order.tolist() if columns[0][i]]
+
+
+def _by_label(labels, correct, recent):
+    np = _numpy()
+    names, codes = np.unique(np.asarray(labels, dtype=str), return_inverse=True)
+    return _summaries(names.tolist(), _tally(codes, len(names), correct, recent))
+
+
+def _by_tag(tag_lists, correct, recent):
+    """Tag totals: tally each distinct tag set once, then spread it over its tags"""
+    np = _numpy()
+    tag_sets, codes = np.unique(np.asarray(tag_lists, dtype=str), return_inverse=True)
+    parsed = [loads(tag_set) or [] for tag_set in tag_sets.tolist()]
+    names = sorted({tag for tags in parsed for tag in tags})
+    if not names:
+        return []
+    column = {tag: j for j, tag in enumerate(names)}
+    incidence = np.zeros((len(tag_sets), len(names)))
+    for i, tags in enumerate(parsed):
+        incidence[i, [column[tag] for tag in set(tags)]] = 1
+    return _summaries(names, incidence.T @ _tally(codes, len(tag_sets), correct, recent))
+
+
+def _daily(day, correct, today, days):
+    """Attempts, accuracy and trailing ROLLING_DAYS accuracy for each of the last `days` days"""
+    np = _numpy()
+    first = today - np.timedelta64(days + ROLLING_DAYS - 2, 'D')
+    offsets = (day - first).astype(np.int64)
+    keep = offsets >= 0
+    size = days + ROLLING_DAYS - 1
+    attempts = np.bincount(offsets[keep], minlength=size)[:size].astype(np.float64)
+    hits = np.bincount(offsets[keep], weights=correct[keep], minlength=size)[:size]
+    window_attempts = np.convolve(attempts, np.ones(ROLLING_DAYS), 'valid')
+    window_hits = np.convolve(hits, np.ones(ROLLING_DAYS), 'valid')
+    attempts, hits = attempts[ROLLING_DAYS - 1:], hits[ROLLING_DAYS - 1:]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        accuracy = (hits / attempts).tolist()
+        rolling = (window_hits / window_attempts).tolist()
+    dates = np.arange(first + ROLLING_DAYS - 1, today + 1).astype(str).tolist()
+    return [{
+        'date': dates[i],
+        'attempts': int(attempts[i]),
+        'accuracy': _pct(accuracy[i]),
+        'rolling_accuracy': _pct(rolling[i]),
+    } for i in range(days)]
+
+
+def compute(rows, today=None, days=30):
+    """Analytics for (timestamp, correct, topic, difficulty, tags JSON) rows from Attempt.columns().
+
+    `today` is a UTC 'YYYY-MM-DD' (default today); the daily series covers
+    the `days` days ending on it.
+    """
+    np = _numpy()
+    today = np.datetime64(today or datetime.now(timezone.utc).strftime('%Y-%m-%d'), 'D')
+    if not rows:
+        return {'overall': None, 'topics': [], 'tags': [], 'difficulties': [],
+                'daily': _daily(np.array([], dtype='datetime64[D]'), np.array([]), today, days)}
+    timestamps, correct, topics, difficulties, tags = zip(*rows)
+    correct = np.asarray(correct, dtype=np.float64)
+    day = np.asarray(timestamps, dtype=str).astype('U10').astype('datetime64[D]')
+    recent = day > today - np.timedelta64(TREND_DAYS, 'D')
+    return {
+        'overall': _summaries(['all'], _tally(np.zeros(len(correct), dtype=np.int64), 1, correct, recent))[0],
+        'topics': _by_label(topics, correct, recent),
+        'tags': _by_tag(tags, correct, recent),
+        'difficulties': _by_label(difficulties, correct, recent),
+        'daily': _daily(day, correct, today, days),
+    }
+
+
+class Analytics:
+    """Per-process LRU of compute() results for the attempts repository, versioned by the scores repository"""
+
+    def __init__(self, attempts, scores, maxsize=512):
+        self.attempts = attempts
+        self.scores = scores
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def for_user(self, user_id, days=30):
+        today = datetime.now(timezone.utc).strftime('%Y-%m-%d')
+        # A new attempt changes the count and updated_at; a new day moves the windows
+        version = (*self.scores.version(user_id), today)
+        key = (user_id, days)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == version:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+        result = compute(self.attempts.columns(user_id), today=today, days=days)
+        if self.maxsize > 0:
+            with self._lock:
+                self._entries[key] = (version, result)
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.maxsize:
+                    self._entries.popitem(last=False)
+        return result
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+
+def init_app(app):
+    """Create app.extensions['analytics'] over the attempts and scores repositories (after db.init_app)"""
+    repositories = app.extensions['repositories']
+    app.extensions['analytics'] = Analytics(repositories['attempts'], repositories['scores'],
+                                            maxsize=app.config['ANALYTICS_CACHE_SIZE'])
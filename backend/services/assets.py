@@ -0,0 +1,216 @@
+"""
+Static Assets - fingerprinted, pre-compressed files
+init_app() reads every file under the static folder once and names it after
+a hash of its content (css/style.css -> css/style.<hash>.css).
+/assets/<fingerprinted name> serves them with `Cache-Control: immutable`: a
+changed file gets a new URL, so browsers never need to revalidate.
+
+The gzip and, when the optional `brotli` package is installed, brotli copies
+are made on an asset's first request, not at startup, and kept in memory and
+in ASSET_CACHE_DIR (shared by all workers, named by content hash).
+`flask --app backend.app build-assets` compresses everything into that
+directory ahead of time, so no worker pays for gzip -9 / brotli q11.
+
+Templates link assets with `static_url('css/style.css')`, which falls back to
+the plain /static URL when the pipeline is off (DevelopmentConfig, so edits
+show up without a restart).
+"""
+
+import gzip
+import hashlib
+import logging
+import mimetypes
+import os
+import re
+import tempfile
+
+from flask import abort, current_app, request, url_for
+
+logger = logging.getLogger(__name__)
+
+COMPRESSIBLE = {'.css', '.js', '.json', '.map', '.svg', '.txt', '.html', '.ico'}
+# Below this the encoding headers cost about what compression saves
+MIN_COMPRESS_BYTES = 256
+IMMUTABLE = 'public, max-age=31536000, immutable'
+_FINGERPRINT = re.compile(r'^(?P<stem>.+)\.(?P<digest>[0-9a-f]{10})(?P<ext>\.[^./]+)$')
+
+
+def _brotli():
+    try:
+        import brotli
+    except ImportError:
+        return None
+    return brotli
+
+
+class Asset:
+    __slots__ = ('source', 'url_path', 'digest', 'mimetype', 'compressible', 'cache_dir', 'variants')
+
+    def __init__(self, source, data, cache_dir=None):
+        self.source = source
+        self.digest = hashlib.sha256(data).hexdigest()[:10]
+        stem, ext = os.path.splitext(source)
+        self.url_path = f'{stem}.{self.digest}{ext}'
+        self.mimetype = mimetypes.guess_type(source)[0] or 'application/octet-stream'
+        if ext == '.js':
+            self.mimetype = 'text/javascript'
+        self.compressible = ext in COMPRESSIBLE and len(data) >= MIN_COMPRESS_BYTES
+        self.cache_dir = cache_dir
+        # encoding -> bytes, or None when that encoding is unavailable or not smaller
+        self.variants = {'identity': data}
+
+    def variant(self, encoding):
+        """Bytes of the 'gzip' or 'br' copy (None if it would not be smaller), compressed on first use"""
+        if encoding not in self.variants:
+            self.variants[encoding] = self._compressed(encoding) if self.compressible else None
+        return self.variants[encoding]
+
+    def _compressed(self, encoding):
+        brotli = _brotli() if encoding == 'br' else None
+        if encoding == 'br' and brotli is None:
+            return None
+        path = os.path.join(self.cache_dir, f'{self.digest}.{encoding}') if self.cache_dir else None
+        if path is not None:
+            try:
+                with open(path, 'rb') as f:
+                    # An empty file records "not smaller than the original"
+                    return f.read() or None
+            except OSError:
+                pass
+        data = self.variants['identity']
+        if brotli is not None:
+            compressed = brotli.compress(data, quality=11)
+        else:
+            compressed = gzip.compress(data, compresslevel=9, mtime=0)
+        compressed = compressed if len(compressed) < len(data) else None
+        if path is not None:
+            try:
+                # Write-then-rename: another worker never reads half a file
+                fd, tmp = tempfile.mkstemp(dir=self.cache_dir)
+                with os.fdopen(fd, 'wb') as f:
+                    f.write(compressed or b'')
+                os.replace(tmp, path)
+            except OSError as e:
+                logger.debug('Could not write %s: %s', path, e)
+        return compressed
+
+    def negotiate(self, accept_encodings):
+        """(encoding, bytes) of the smallest variant the client accepts"""
+        for encoding in ('br', 'gzip'):
+            if accept_encodings[encoding]:
+                data = self.variant(encoding)
+                if data is not None:
+                    return encoding, data
+        return 'identity', self.variants['identity']
+
+
+class AssetManifest:
+    def __init__(self, root, cache_dir=None):
+        self.root = root
+        self.cache_dir = cache_dir
+        self.by_source = {}
+        self.by_url = {}
+
+    def build(self):
+        for directory, _, files in os.walk(self.root):
+            for name in sorted(files):
+                path = os.path.join(directory, name)
+                source = os.path.relpath(path, self.root).replace(os.sep, '/')
+                with open(path, 'rb') as f:
+                    asset = Asset(source, f.read(), self.cache_dir)
+                self.by_source[source] = asset
+                self.by_url[asset.url_path] = asset
+        return self
+
+    def url_path(self, source):
+        asset = self.by_source.get(source)
+        return asset.url_path if asset else None
+
+    def lookup(self, url_path):
+        """(asset, fresh): fresh is False for an older fingerprint of a known file"""
+        asset = self.by_url.get(url_path)
+        if asset is not None:
+            return asset, True
+        match = _FINGERPRINT.match(url_path)
+        if match:
+            # HTML from a previous deploy still links the old hash; serve today's bytes uncached
+            asset = self.by_source.get(match['stem'] + match['ext'])
+            if asset is not None:
+                return asset, False
+        return None, False
+
+    def sizes(self):
+        """{encoding: total bytes} over all assets; compresses every asset not compressed yet"""
+        totals = {'identity': 0, 'gzip': 0, 'br': 0}
+        for asset in self.by_source.values():
+            for encoding in ('identity', 'gzip', 'br'):
+                data = asset.variant(encoding) if encoding != 'identity' else None
+                totals[encoding] += len(data if data is not None else asset.variants['identity'])
+        return totals
+
+
+def cache_dir(app):
+    """ASSET_CACHE_DIR, else instance/asset_cache (the temp dir on Vercel); None disables"""
+    directory = app.config['ASSET_CACHE_DIR']
+    if directory is None:
+        base = tempfile.gettempdir() if os.environ.get('VERCEL') else app.instance_path
+        directory = os.path.join(base, 'asset_cache')
+    if not directory:
+        return None
+    try:
+        os.makedirs(directory, exist_ok=True)
+    except OSError as e:
+        logger.warning('Asset cache directory disabled (%s): %s', directory, e)
+        return None
+    return directory
+
+
+def static_url(filename):
+    """Fingerprinted /assets URL for a static file, or the plain /static URL"""
+    manifest = current_app.extensions.get('assets')
+    url_path = manifest.url_path(filename) if manifest is not None else None
+    if url_path is None:
+        return url_for('static', filename=filename)
+    return url_for('assets', filename=url_path)
+
+
+def serve_asset(filename):
+    asset, fresh = current_app.extensions['assets'].lookup(filename)
+    if asset is None:
+        abort(404)
+    encoding, data = asset.negotiate(request.accept_encodings)
+    etag = f'{asset.digest}-{encoding}'
+    # services/compression.py strips "-gzip"/"-br" from If-None-Match, leaving the bare digest;
+    # every variant decodes to the same bytes, so either form revalidates
+    if request.if_none_match.contains(etag) or request.if_none_match.contains(asset.digest):
+        response = current_app.response_class(status=304)
+    else:
+        response = current_app.response_class(data, mimetype=asset.mimetype)
+        if encoding != 'identity':
+            response.headers['Content-Encoding'] = encoding
+    response.vary.add('Accept-Encoding')
+    response.set_etag(etag)
+    response.headers['Cache-Control'] = IMMUTABLE if fresh else 'no-cache'
+    return response
+
+
+def init_app(app):
+    """Register the static_url() template helper and, with ASSET_PIPELINE, fingerprint and serve /assets"""
+    app.add_template_global(static_url)
+
+    @app.cli.command('build-assets')
+    def build_assets_command():
+        """Compress every static file into the asset cache directory"""
+        directory = cache_dir(app)
+        manifest = AssetManifest(app.static_folder, directory).build()
+        sizes = manifest.sizes()
+        print(f"Compressed {len(manifest.by_source)} static assets into {directory or '(no asset cache)'}: "
+              f"{sizes['identity']} bytes, gzip {sizes['gzip']}, "
+              + (f"br {sizes['br']}" if _brotli() else 'no br (pip install brotli)'))
+
+    if not app.config['ASSET_PIPELINE'] or not app.static_folder:
+        return
+    manifest = AssetManifest(app.static_folder, cache_dir(app)).build()
+    app.extensions['assets'] = manifest
+    app.add_url_rule('/assets/<path:filename>', 'assets', serve_asset)
+    logger.info('Fingerprinted %d static assets', len(manifest.by_source))
@@ -1,27 +1,92 @@
 # services/gemini_client.py
 import os
-import google.generativeai as genai
-from dotenv import load_dotenv
 
-# Ensure .env is loaded even if this module is imported first
-load_dotenv()
+from flask import current_app
 
-API_KEY = os.getenv("GEMINI_API_KEY")
-if not API_KEY:
-    raise RuntimeError("GEMINI_API_KEY missing. Put it in .env and restart the app.")
-
-genai.configure(api_key=API_KEY)
+from .json_codec import dumps_bytes, loads
+from .metrics import track_gemini
 
 DEFAULT_MODEL = "gemini-1.5-flash"   # or "gemini-1.5-flash" for cheaper/faster
 
+_genai = None
+
+
+def _client():
+    """Import and configure the SDK on first use; it is too heavy to load at startup"""
+    global _genai
+    if _genai is None:
+        # Ensure .env is loaded even if this module is used first
+        from dotenv import load_dotenv
+        load_dotenv()
+
+        api_key = os.getenv("GEMINI_API_KEY")
+        if not api_key:
+            raise RuntimeError("GEMINI_API_KEY missing. Put it in .env and restart the app.")
+
+        import google.generativeai as genai
+        genai.configure(api_key=api_key)
+        _genai = genai
+    return _genai
+
+
 def ask_gemini(prompt: str, model: str = DEFAULT_MODEL) -> str:
     """
     Send a simple prompt to Gemini and return plain text.
     """
     try:
-        m = genai.GenerativeModel(model_name=model)
+        m = _client().GenerativeModel(model_name=model)
         resp = m.generate_content(prompt)
         return (resp.text or "").strip()
     except Exception as e:
         # Return a short error; upstream can format it
         return f"[Gemini error: {e}]"
+
+
+# --- REST API (generateContent), configured from the current app ---
+
+def gemini_post(payload, timeout=20):
+    """POST a generateContent payload to Gemini. Returns the requests response."""
+    import requests  # deferred: adds ~60ms to worker startup
+    config = current_app.config
+    with track_gemini():
+        return requests.post(
+            f"{config['GEMINI_API_BASE']}/v1beta/models/{config['GEMINI_MODEL']}:generateContent",
+            headers={"Content-Type": "application/json", "X-goog-api-key": config['GEMINI_API_KEY']},
+            data=dumps_bytes(payload), timeout=timeout
+        )
+
+
+def gemini_text(resp):
+    """Join the text parts of the first candidate in a Gemini response; "" for a malformed body."""
+    try:
+        data = loads(resp.content)
+    except ValueError:
+        return ""
+    candidates = data.get("candidates") if isinstance(data, dict) else None
+    if not isinstance(candidates, list) or not candidates or not isinstance(candidates[0], dict):
+        return ""
+    content = candidates[0].get("content")
+    parts = content.get("parts") if isinstance(content, dict) else None
+    if not isinstance(parts, list):
+        return ""
+    return "\n".join([p["text"] for p in parts if isinstance(p, dict) and isinstance(p.get("text"), str)]).strip()
+
+
+def gemini_call(parts, expect_json=False, temperature=0.6):
+    """Call Gemini generateContent with given parts. Returns text."""
+    if not current_app.config['GEMINI_API_KEY']:
+        current_app.logger.warning("GEMINI_API_KEY not configured, using fallback responses")
+        return ""
+    payload = {
+        "contents": [{"role": "user", "parts": parts}],
+        "generationConfig": {"temperature": temperature}
+    }
+    if expect_json:
+        # Ask Gemini to return JSON text; route still parses it on our side
+        payload["generationConfig"]["response_mime_type"] = "application/json"
+
+    resp = gemini_post(payload)
+    if resp.status_code != 200:
+        # Return truncated body for UI error handling
+        return ""
+    return gemini_text(resp)
@@ -0,0 +1,94 @@
+"""
+JSON Codec - shared serialization helpers
+Uses orjson when it is installed and falls back to the stdlib json module.
+Flask responses keep Flask's own encoding of dates (HTTP-date strings,
+e.g. "Mon, 19 Oct 2026 00:00:00 GMT") whichever backend is in use.
+"""
+
+import json
+import re
+
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson as _orjson
+except ImportError:  # optional dependency
+    _orjson = None
+
+BACKEND = 'orjson' if _orjson is not None else 'json'
+
+# ```json ... ``` wrappers that Gemini sometimes adds even in JSON mode
+_FENCE_RE = re.compile(r'^\s*```[a-zA-Z0-9_-]*\s*\n?(.*?)\n?\s*```\s*$', re.DOTALL)
+
+
+def dumps(obj) -> str:
+    """Serialize obj to a compact JSON string"""
+    if _orjson is not None:
+        return _orjson.dumps(obj, option=_orjson.OPT_NON_STR_KEYS).decode('utf-8')
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':'))
+
+
+def dumps_bytes(obj) -> bytes:
+    """Serialize obj to UTF-8 JSON bytes (request bodies, blobs)"""
+    if _orjson is not None:
+        return _orjson.dumps(obj, option=_orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def loads(data):
+    """Parse a JSON str/bytes document"""
+    if _orjson is not None:
+        return _orjson.loads(data)
+    return json.loads(data)
+
+
+def parse_llm_json(text, default=None):
+    """Parse JSON returned by an LLM.
+
+    Tolerates markdown code fences and leading/trailing prose around a single
+    object. A one-element list wrapping an object is unwrapped. Returns
+    ``default`` (an empty dict unless given) when nothing usable is found.
+    """
+    if default is None:
+        default = {}
+    if not text:
+        return default
+    text = text.strip()
+    match = _FENCE_RE.match(text)
+    if match:
+        text = match.group(1).strip()
+    try:
+        value = loads(text)
+    except ValueError:
+        # Fall back to the outermost {...} span
+        start, end = text.find('{'), text.rfind('}')
+        if start == -1 or end <= start:
+            return default
+        try:
+            value = loads(text[start:end + 1])
+        except ValueError:
+            return default
+    if isinstance(value, list) and len(value) == 1 and isinstance(value[0], dict):
+        value = value[0]
+    return value if isinstance(value, dict) else default
+
+
+class FastJSONProvider(DefaultJSONProvider):
+    """Flask JSON provider backed by orjson when available"""
+
+    def dumps(self, obj, **kwargs):
+        indent = kwargs.get('indent')
+        if _orjson is None or indent not in (None, 2) or kwargs.get('cls'):
+            return super().dumps(obj, **kwargs)
+        # Dates go through Flask's default (http_date) instead of orjson's ISO-8601
+        option = _orjson.OPT_NON_STR_KEYS | _orjson.OPT_PASSTHROUGH_DATETIME
+        if kwargs.get('sort_keys', self.sort_keys):
+            option |= _orjson.OPT_SORT_KEYS
+        if indent:
+            option |= _orjson.OPT_INDENT_2
+        return _orjson.dumps(obj, default=self.default, option=option).decode('utf-8')
+
+    def loads(self, s, **kwargs):
+        if _orjson is None or kwargs:
+            return super().loads(s, **kwargs)
+        return _orjson.loads(s)
@@ -0,0 +1,165 @@
+"""
+Leaderboard - accuracy and streak rankings served from memory
+Each worker keeps one RankIndex per board over the user_scores rows
+(models/score.py): a list of users sorted best first, so rank and percentile
+are a binary search and the top N is a slice. Nothing aggregates the
+attempts table at request time.
+
+The index refreshes incrementally: at most every `refresh_seconds` it reads
+only the user_scores rows updated since its last look (one seek on
+updated_at) and re-positions those users. A new UTC day triggers a full
+rebuild, since every streak not yet extended on the new day stops counting.
+"""
+
+import threading
+import time
+from bisect import bisect_left, bisect_right, insort
+from datetime import datetime, timedelta, timezone
+
+BOARDS = ('accuracy', 'streak')
+# updated_at is stamped before commit: re-read this far behind the newest stamp seen
+# so a row committed late with an older stamp is still picked up
+REFRESH_OVERLAP = timedelta(seconds=10)
+TIMESTAMP_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+
+class RankIndex:
+    """Users ordered by (primary, secondary) score, best first.
+
+    Lookups are O(log n) bisects; an update is a bisect plus one list
+    insert/delete, which shifts pointers with memmove (microseconds for
+    100k users).
+    """
+
+    def __init__(self):
+        self._keys = []
+        self._by_user = {}
+
+    def update(self, user_id, primary, secondary=0):
+        self.remove(user_id)
+        key = (-primary, -secondary, user_id)
+        insort(self._keys, key)
+        self._by_user[user_id] = key
+
+    def remove(self, user_id):
+        key = self._by_user.pop(user_id, None)
+        if key is not None:
+            del self._keys[bisect_left(self._keys, key)]
+
+    def top(self, n):
+        """[(user_id, primary, secondary)] of the best n"""
+        return [(key[2], -key[0], -key[1]) for key in self._keys[:n]]
+
+    def rank(self, user_id):
+        """1 + the number of users with a strictly better score; None if unranked"""
+        key = self._by_user.get(user_id)
+        if key is None:
+            return None
+        return bisect_left(self._keys, key[:2]) + 1
+
+    def percentile(self, user_id):
+        """Share of the other ranked users with a strictly lower score, 0-100; None if unranked"""
+        key = self._by_user.get(user_id)
+        if key is None:
+            return None
+        if len(self._keys) == 1:
+            return 100.0
+        below = len(self._keys) - bisect_right(self._keys, (key[0], key[1], float('inf')))
+        return round(100 * below / (len(self._keys) - 1), 1)
+
+    def __contains__(self, user_id):
+        return user_id in self._by_user
+
+    def __len__(self):
+        return len(self._keys)
+
+
+class Leaderboard:
+    def __init__(self, scores, min_attempts=10, refresh_seconds=5.0, clock=time.monotonic):
+        self.scores = scores
+        # Fewer answers than this make accuracy noise; such users only appear on the streak board
+        self.min_attempts = min_attempts
+        self.refresh_seconds = refresh_seconds
+        self.clock = clock
+        self.boards = {board: RankIndex() for board in BOARDS}
+        self._users = {}
+        self._lock = threading.Lock()
+        self._day = None
+        self._since = None
+        self._checked_at = None
+
+    def refresh(self, force=False):
+        """Apply user_scores changes if `refresh_seconds` have passed; rebuild on a new day"""
+        today = datetime.now(timezone.utc).strftime('%Y-%m-%d')
+        with self._lock:
+            now = self.clock()
+            if (not force and self._day == today and self._checked_at is not None
+                    and now - self._checked_at < self.refresh_seconds):
+                return
+            if self._day != today:
+                self.boards = {board: RankIndex() for board in BOARDS}
+                self._users = {}
+                rows = self.scores.all()
+            else:
+                # Rows seen before are re-applied harmlessly: they carry absolute totals
+                since = datetime.strptime(self._since, TIMESTAMP_FORMAT) - REFRESH_OVERLAP
+                rows = self.scores.changed_since(since.strftime(TIMESTAMP_FORMAT))
+            for row in rows:
+                self._apply(row, today)
+                if self._since is None or row[6] > self._since:
+                    self._since = row[6]
+            self._since = self._since or '2000-01-01 00:00:00'
+            self._day = today
+            self._checked_at = now
+
+    def _apply(self, row, today):
+        user_id, name, attempts, correct, streak, last_day, _ = row
+        self._users[user_id] = {'name': name, 'attempts': attempts, 'correct': correct}
+        accuracy = correct / attempts if attempts else 0.0
+        if attempts >= self.min_attempts:
+            self.boards['accuracy'].update(user_id, accuracy, correct)
+        else:
+            self.boards['accuracy'].remove(user_id)
+        # Same rule as the dashboard: only a streak that reaches today counts
+        current = streak if last_day == today else 0
+        self._users[user_id]['streak'] = current
+        if current:
+            self.boards['streak'].update(user_id, current, attempts)
+        else:
+            self.boards['streak'].remove(user_id)
+
+    def _entry(self, user_id, rank):
+        user = self._users[user_id]
+        return {
+            'rank': rank,
+            'user_id': user_id,
+            'name': user['name'],
+            'accuracy': round(user['correct'] / user['attempts'] * 100, 1) if user['attempts'] else 0.0,
+            'attempts': user['attempts'],
+            'streak': user['streak'],
+        }
+
+    def standings(self, board, user_id=None, limit=10):
+        """{board, total, top: [...], me: {..., percentile} or None} for one board"""
+        self.refresh()
+        with self._lock:
+            index = self.boards[board]
+            top, rank = [], 0
+            previous = None
+            for position, (uid, primary, secondary) in enumerate(index.top(limit), start=1):
+                if (primary, secondary) != previous:
+                    rank, previous = position, (primary, secondary)
+                top.append(self._entry(uid, rank))
+            me = None
+            if user_id is not None and user_id in index:
+                me = dict(self._entry(user_id, index.rank(user_id)), percentile=index.percentile(user_id))
+            return {'board': board, 'total': len(index), 'top': top, 'me': me}
+
+
+def init_app(app):
+    """Create app.extensions['leaderboard'] over the user_scores repository (after db.init_app)"""
+    app.extensions['leaderboard'] = Leaderboard(
+        app.extensions['repositories']['scores'],
+        min_attempts=app.config['LEADERBOARD_MIN_ATTEMPTS'],
+        refresh_seconds=app.config['LEADERBOARD_REFRESH_SECONDS']
+    )
@@ -0,0 +1,239 @@
+"""
+Metrics - request, database and Gemini timing
+Per-process histograms exposed in Prometheus text format at /metrics, plus a
+Server-Timing header on every response. Under gunicorn each worker keeps its
+own registry, so scrape workers individually or aggregate in Prometheus.
+"""
+
+import ipaddress
+import sqlite3
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+
+from flask import Response, abort, g, has_request_context, request
+
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+COUNT_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100)
+
+_registry = []
+_query_listeners = []
+
+
+def _format_value(value):
+    if value == float('inf'):
+        return '+Inf'
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+def _escape_label(value):
+    return str(value).replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+
+class Histogram:
+    """Cumulative-bucket histogram with fixed label names"""
+
+    def __init__(self, name, help_text, labelnames=(), buckets=LATENCY_BUCKETS):
+        self.name = name
+        self.help_text = help_text
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(buckets)
+        self._series = {}
+        self._lock = threading.Lock()
+        _registry.append(self)
+
+    def observe(self, value, **labels):
+        key = tuple(str(labels.get(n, '')) for n in self.labelnames)
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                # [per-bucket counts..., +Inf count, sum]
+                series = self._series[key] = [0] * (len(self.buckets) + 1) + [0.0]
+            series[index] += 1
+            series[-1] += value
+
+    def render(self):
+        lines = [f'# HELP {self.name} {self.help_text}', f'# TYPE {self.name} histogram']
+        with self._lock:
+            items = [(key, list(series)) for key, series in self._series.items()]
+        for key, series in sorted(items):
+            labels = ','.join(f'{n}="{_escape_label(v)}"' for n, v in zip(self.labelnames, key))
+            prefix = labels + ',' if labels else ''
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float('inf'),), series[:-1]):
+                cumulative += count
+                lines.append(f'{self.name}_bucket{{{prefix}le="{_format_value(bound)}"}} {cumulative}')
+            suffix = f'{{{labels}}}' if labels else ''
+            lines.append(f'{self.name}_sum{suffix} {_format_value(series[-1])}')
+            lines.append(f'{self.name}_count{suffix} {cumulative}')
+        return lines
+
+
+REQUEST_SECONDS = Histogram(
+    'http_request_duration_seconds', 'Flask request latency by endpoint.',
+    ('endpoint', 'method', 'status'))
+REQUEST_DB_SECONDS = Histogram(
+    'http_request_db_seconds', 'Time spent in SQLite per request.', ('endpoint',))
+REQUEST_DB_QUERIES = Histogram(
+    'http_request_db_queries', 'SQL statements executed per request.', ('endpoint',), COUNT_BUCKETS)
+DB_QUERY_SECONDS = Histogram(
+    'db_query_duration_seconds', 'Latency of individual SQLite statements.', ('operation',))
+GEMINI_SECONDS = Histogram(
+    'gemini_request_duration_seconds', 'Latency of Gemini API calls.', ('call',))
+
+
+def render_latest():
+    """All registered metrics in Prometheus text exposition format"""
+    lines = []
+    for metric in _registry:
+        lines.extend(metric.render())
+    return '\n'.join(lines) + '\n'
+
+
+# --- Per-request accumulation -------------------------------------------------
+
+def _add_request_time(key, elapsed, queries=0):
+    if not has_request_context():
+        return
+    timings = g.get('_timings')
+    if timings is None:
+        return
+    timings[key] = timings.get(key, 0.0) + elapsed
+    if queries:
+        timings['db_queries'] = timings.get('db_queries', 0) + queries
+
+
+def add_query_listener(listener):
+    """Call listener(connection, sql, parameters, elapsed, many) after every statement"""
+    if listener not in _query_listeners:
+        _query_listeners.append(listener)
+
+
+def remove_query_listener(listener):
+    if listener in _query_listeners:
+        _query_listeners.remove(listener)
+
+
+def record_query(cursor, sql, parameters, elapsed, many=False):
+    """Record one executed statement (used by the instrumented cursors of every backend)"""
+    operation = sql.lstrip().split(None, 1)[0].upper() if sql and sql.strip() else 'UNKNOWN'
+    DB_QUERY_SECONDS.observe(elapsed, operation=operation)
+    _add_request_time('db', elapsed, queries=1)
+    for listener in list(_query_listeners):
+        listener(cursor.connection, sql, parameters, elapsed, many)
+
+
+@contextmanager
+def track_gemini(call='generateContent'):
+    """Time a Gemini call into the histogram and the current request"""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - start
+        GEMINI_SECONDS.observe(elapsed, call=call)
+        _add_request_time('gemini', elapsed)
+
+
+# --- Instrumented SQLite connection ---------------------------------------------
+
+class InstrumentedCursor(sqlite3.Cursor):
+    def execute(self, sql, parameters=()):
+        start = time.perf_counter()
+        try:
+            return super().execute(sql, parameters)
+        finally:
+            record_query(self, sql, parameters, time.perf_counter() - start)
+
+    def executemany(self, sql, seq_of_parameters):
+        if not isinstance(seq_of_parameters, (list, tuple)):
+            seq_of_parameters = list(seq_of_parameters)
+        start = time.perf_counter()
+        try:
+            return super().executemany(sql, seq_of_parameters)
+        finally:
+            record_query(self, sql, seq_of_parameters, time.perf_counter() - start, many=True)
+
+    def executescript(self, sql_script):
+        start = time.perf_counter()
+        try:
+            return super().executescript(sql_script)
+        finally:
+            record_query(self, sql_script, (), time.perf_counter() - start)
+
+
+class InstrumentedConnection(sqlite3.Connection):
+    def cursor(self, factory=InstrumentedCursor):
+        return super().cursor(factory)
+
+    def execute(self, sql, parameters=()):
+        return self.cursor().execute(sql, parameters)
+
+    def executemany(self, sql, seq_of_parameters):
+        return self.cursor().executemany(sql, seq_of_parameters)
+
+    def executescript(self, sql_script):
+        return self.cursor().executescript(sql_script)
+
+    def commit(self):
+        start = time.perf_counter()
+        try:
+            super().commit()
+        finally:
+            _add_request_time('db', time.perf_counter() - start)
+
+
+def connect(db_path, **kwargs):
+    """sqlite3.connect() returning a connection that records query timings"""
+    kwargs.setdefault('factory', InstrumentedConnection)
+    return sqlite3.connect(db_path, **kwargs)
+
+
+# --- Flask wiring ---------------------------------------------------------------
+
+def _is_loopback(addr):
+    try:
+        return ipaddress.ip_address(addr or '').is_loopback
+    except ValueError:
+        return False
+
+
+def init_app(app):
+    """Register request timers, the Server-Timing header and /metrics"""
+
+    @app.before_request
+    def _start_timer():
+        g._timings = {'start': time.perf_counter()}
+
+    @app.after_request
+    def _stop_timer(response):
+        timings = g.pop('_timings', None)
+        if timings is None:
+            return response
+        elapsed = time.perf_counter() - timings['start']
+        endpoint = request.endpoint or 'unmatched'
+        db_seconds = timings.get('db', 0.0)
+        db_queries = timings.get('db_queries', 0)
+        REQUEST_SECONDS.observe(elapsed, endpoint=endpoint, method=request.method, status=response.status_code)
+        REQUEST_DB_SECONDS.observe(db_seconds, endpoint=endpoint)
+        REQUEST_DB_QUERIES.observe(db_queries, endpoint=endpoint)
+
+        parts = [f'app;dur={elapsed * 1000:.2f}', f'db;dur={db_seconds * 1000:.2f};desc="{db_queries} queries"']
+        if 'gemini' in timings:
+            parts.append(f'gemini;dur={timings["gemini"] * 1000:.2f}')
+        response.headers.add('Server-Timing', ', '.join(parts))
+        return response
+
+    def metrics_endpoint():
+        """Prometheus scrape endpoint; guarded by METRICS_TOKEN when set, else by METRICS_PUBLIC"""
+        token = app.config['METRICS_TOKEN']
+        if token:
+            if request.headers.get('Authorization') != f'Bearer {token}':
+                abort(404)
+        elif not app.config['METRICS_PUBLIC'] and not _is_loopback(request.remote_addr):
+            abort(404)
+        return Response(render_latest(), mimetype='text/plain; version=0.0.4')
+
+    app.add_url_rule('/metrics', 'metrics', metrics_endpoint)
@@ -0,0 +1,115 @@
+"""
+Page Cache - rendered bytes for pages that are the same for every visitor
+Views decorated with @cached_page are rendered once per process for anonymous
+visitors (no user in the session, no pending flash messages, no query
+string); later requests get the stored bytes with a strong ETag and a
+matching If-None-Match is answered 304. Signed-in visitors see their name in
+the navbar, so they always get a fresh render.
+
+Each page is also gzipped once (level 9) when it is stored, so the
+compression middleware never recompresses a cached page. PAGE_CACHE_PRERENDER
+fills the cache at startup so even a worker's first visitor skips template
+rendering.
+"""
+
+import gzip
+import hashlib
+import logging
+import threading
+from functools import wraps
+
+from flask import current_app, request, session
+
+logger = logging.getLogger(__name__)
+
+
+class CachedPage:
+    __slots__ = ('body', 'gzip', 'etag', 'mimetype')
+
+    def __init__(self, body, mimetype):
+        self.body = body
+        self.gzip = gzip.compress(body, compresslevel=9, mtime=0)
+        self.etag = hashlib.sha256(body).hexdigest()[:32]
+        self.mimetype = mimetype
+
+
+class PageCache:
+    def __init__(self):
+        self._pages = {}
+        self._lock = threading.Lock()
+
+    def get(self, path):
+        return self._pages.get(path)
+
+    def put(self, path, body, mimetype):
+        page = CachedPage(body, mimetype)
+        with self._lock:
+            self._pages[path] = page
+        return page
+
+    def clear(self):
+        with self._lock:
+            self._pages.clear()
+
+    def __len__(self):
+        return len(self._pages)
+
+
+def _shareable():
+    return not request.query_string and 'user_id' not in session and '_flashes' not in session
+
+
+def cached_page(view):
+    """Serve an argument-free GET view from the app's PageCache for anonymous visitors"""
+    @wraps(view)
+    def wrapper(*args, **kwargs):
+        cache = current_app.extensions.get('page_cache')
+        if cache is None or not _shareable():
+            return view(*args, **kwargs)
+        page = cache.get(request.path)
+        state = 'hit'
+        if page is None:
+            response = current_app.make_response(view(*args, **kwargs))
+            if response.status_code != 200 or response.is_streamed:
+                return response
+            page = cache.put(request.path, response.get_data(), response.mimetype)
+            state = 'miss'
+        gzipped = bool(request.accept_encodings['gzip'])
+        # Same "-gzip" ETag suffix as services/compression.py, which may already have stripped it
+        etag = f'{page.etag}-gzip' if gzipped else page.etag
+        if request.if_none_match.contains(etag) or request.if_none_match.contains(page.etag):
+            response = current_app.response_class(status=304)
+        else:
+            response = current_app.response_class(page.gzip if gzipped else page.body, mimetype=page.mimetype)
+            if gzipped:
+                response.headers['Content-Encoding'] = 'gzip'
+        response.set_etag(etag)
+        # Revalidate every time: a deploy changes the bytes, and the ETag with them
+        response.headers['Cache-Control'] = 'no-cache'
+        # Signed-in visitors get different bytes for the same URL
+        response.vary.add('Cookie')
+        response.vary.add('Accept-Encoding')
+        response.headers['X-Page-Cache'] = state
+        return response
+    wrapper.page_cached = True
+    return wrapper
+
+
+def prerender(app):
+    """Render every @cached_page route into the cache; returns the number of pages"""
+    for rule in app.url_map.iter_rules():
+        view = app.view_functions.get(rule.endpoint)
+        if not getattr(view, 'page_cached', False) or rule.arguments or 'GET' not in rule.methods:
+            continue
+        with app.test_request_context(rule.rule):
+            view()
+    return len(app.extensions['page_cache'])
+
+
+def init_app(app):
+    """Create app.extensions['page_cache'] (PAGE_CACHE) and pre-render it (PAGE_CACHE_PRERENDER)"""
+    if not app.config['PAGE_CACHE']:
+        return
+    app.extensions['page_cache'] = PageCache()
+    if app.config['PAGE_CACHE_PRERENDER']:
+        logger.info('Pre-rendered %d cached pages', prerender(app))
@@ -0,0 +1,183 @@
+"""
+Password Hasher - PBKDF2 off the request threads
+Hashes and verifies run in a small process pool so a burst of logins cannot
+pin every CPU (and, under threads, the GIL) that the other routes need.
+Admission is bounded: once `max_pending` operations are queued or running,
+further calls raise HasherOverloaded and the route answers 503. A job that
+times out keeps its slot until the pool finishes it, and a crashed pool is
+replaced on the next call rather than hashing on the request thread.
+
+The PBKDF2 iteration count is calibrated on first use to take about
+`target_ms` on this machine, never below werkzeug's default (MIN_ITERATIONS);
+inline hashers (no pool) use that default without calibrating. Stored hashes
+with another algorithm or fewer iterations are upgraded by the login that
+next verifies them; a stronger hash is never rewritten weaker.
+"""
+
+import functools
+import hashlib
+import logging
+import os
+import threading
+import time
+from werkzeug.security import DEFAULT_PBKDF2_ITERATIONS, check_password_hash, generate_password_hash
+
+from .metrics import Histogram
+
+logger = logging.getLogger(__name__)
+
+# Floor for slow or throttled hosts: never weaker than werkzeug's own default
+MIN_ITERATIONS = DEFAULT_PBKDF2_ITERATIONS
+# Restarts re-calibrate with some noise; only hashes this far below the target are redone
+REHASH_TOLERANCE = 0.25
+
+PASSWORD_HASH_SECONDS = Histogram(
+    'password_hash_duration_seconds', 'Queue wait plus PBKDF2 time per password operation.',
+    ('operation', 'outcome'))
+
+
+class HasherOverloaded(RuntimeError):
+    """Too many password operations pending; retry later (HTTP 503)"""
+
+
+@functools.lru_cache(maxsize=None)
+def calibrate(target_ms, floor=MIN_ITERATIONS, sample=20000):
+    """PBKDF2-SHA256 iterations that take about target_ms here (best of three timings, once per process)"""
+    best = None
+    for _ in range(3):
+        start = time.perf_counter()
+        hashlib.pbkdf2_hmac('sha256', b'calibration', b'0123456789abcdef', sample)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    iterations = int(sample * (target_ms / 1000.0) / best) // 1000 * 1000
+    return max(floor, iterations)
+
+
+def parse_method(pwhash):
+    """(algorithm, iterations) of a werkzeug pbkdf2 hash, else (prefix, None)"""
+    method = pwhash.split('$', 1)[0]
+    parts = method.split(':')
+    if parts[0] == 'pbkdf2' and len(parts) == 3 and parts[2].isdigit():
+        return f'pbkdf2:{parts[1]}', int(parts[2])
+    return method, None
+
+
+class PasswordHasher:
+    def __init__(self, method=None, target_ms=250, workers=1, max_pending=16, timeout=10.0):
+        """workers=0 hashes inline on the calling thread (serverless, scripts)"""
+        if method is None and not workers:
+            # Inline hashing is a cold-start cost per instance: skip the timing runs
+            method = f'pbkdf2:sha256:{MIN_ITERATIONS}'
+        self._method = method
+        self.target_ms = target_ms
+        self.workers = workers
+        self.max_pending = max_pending
+        self.timeout = timeout
+        self._slots = threading.BoundedSemaphore(max_pending)
+        self._lock = threading.Lock()
+        self._pool = None
+        self._pid = None
+
+    @property
+    def method(self):
+        """werkzeug method string for new hashes, calibrating on first access"""
+        if self._method is None:
+            self._method = f'pbkdf2:sha256:{calibrate(self.target_ms)}'
+            logger.info('Password hashing calibrated to %s', self._method)
+        return self._method
+
+    def _executor(self):
+        # Per process: a forked worker must not reuse its parent's pool
+        if self._pool is None or self._pid != os.getpid():
+            with self._lock:
+                if self._pool is None or self._pid != os.getpid():
+                    # Imported here: multiprocessing costs ~5 ms of startup that inline hashers never need
+                    from concurrent.futures import ProcessPoolExecutor
+                    self._pool = ProcessPoolExecutor(max_workers=self.workers)
+                    self._pid = os.getpid()
+        return self._pool
+
+    def _run(self, operation, fn, *args):
+        if not self._slots.acquire(blocking=False):
+            PASSWORD_HASH_SECONDS.observe(0.0, operation=operation, outcome='rejected')
+            raise HasherOverloaded(f'more than {self.max_pending} password operations pending')
+        start = time.perf_counter()
+        outcome = 'error'
+        if not self.workers:
+            try:
+                result = fn(*args)
+                outcome = 'ok'
+                return result
+            finally:
+                self._slots.release()
+                PASSWORD_HASH_SECONDS.observe(time.perf_counter() - start, operation=operation, outcome=outcome)
+
+        from concurrent.futures import TimeoutError as FutureTimeout
+        from concurrent.futures.process import BrokenProcessPool
+        try:
+            try:
+                future = self._executor().submit(fn, *args)
+            except BrokenProcessPool:
+                self._slots.release()
+                raise
+            # The slot is held until the job itself ends, not until this request stops
+            # waiting: a timed-out PBKDF2 run still occupies the pool
+            future.add_done_callback(lambda _: self._slots.release())
+            result = future.result(self.timeout)
+            outcome = 'ok'
+            return result
+        except FutureTimeout:
+            outcome = 'timeout'
+            raise HasherOverloaded(f'password {operation} not done within {self.timeout}s') from None
+        except BrokenProcessPool:
+            # Never fall back to hashing on the request thread; the next call gets a new pool
+            outcome = 'broken'
+            logger.warning('password hasher pool died; recreating it')
+            self._reset_pool()
+            raise HasherOverloaded('password hasher pool restarting') from None
+        finally:
+            PASSWORD_HASH_SECONDS.observe(time.perf_counter() - start, operation=operation, outcome=outcome)
+
+    def _reset_pool(self):
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    def hash(self, password):
+        """A new hash with the current parameters"""
+        return self._run('hash', generate_password_hash, password, self.method)
+
+    def verify(self, pwhash, password):
+        """True when password matches pwhash; raises HasherOverloaded when saturated"""
+        if '$' not in pwhash:
+            # Placeholder hashes (e.g. Google sign-ins) can never match; don't queue them
+            return False
+        return self._run('verify', check_password_hash, pwhash, password)
+
+    def needs_rehash(self, pwhash):
+        """True when pwhash was made with another algorithm or more than REHASH_TOLERANCE fewer iterations"""
+        algorithm, iterations = parse_method(pwhash)
+        current, target = parse_method(self.method)
+        if algorithm != current or iterations is None or target is None:
+            return pwhash.split('$', 1)[0] != self.method
+        return iterations < target * (1 - REHASH_TOLERANCE)
+
+    def close(self):
+        if self._pool is not None and self._pid == os.getpid():
+            self._pool.shutdown(wait=False, cancel_futures=True)
+        self._pool = None
+
+
+def init_app(app):
+    """Create app.extensions['password_hasher'] from the PASSWORD_HASH_* settings"""
+    hasher = PasswordHasher(
+        method=app.config['PASSWORD_HASH_METHOD'],
+        target_ms=app.config['PASSWORD_HASH_TARGET_MS'],
+        workers=app.config['PASSWORD_HASH_WORKERS'],
+        max_pending=app.config['PASSWORD_HASH_MAX_PENDING'],
+        timeout=app.config['PASSWORD_HASH_TIMEOUT']
+    )
+    logger.info('Password hashing with %s (%d workers)', hasher._method or 'calibrated iterations', hasher.workers)
+    app.extensions['password_hasher'] = hasher
+    return hasher
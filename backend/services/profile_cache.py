@@ -0,0 +1,76 @@
+"""
+Profile Cache - per-process LRU + TTL cache of user profiles
+Profiles ({id, name, email, created_at}) are looked up by id or email. Each
+worker process has its own cache, so entries expire after `ttl` seconds to
+bound how long a write made by another process can go unseen; writes in this
+process invalidate or refresh their entry directly.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+
+
+class ProfileCache:
+    def __init__(self, maxsize=1024, ttl=60.0, clock=time.monotonic):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._clock = clock
+        self._entries = OrderedDict()  # id -> (expires_at, profile)
+        self._ids_by_email = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, user_id):
+        """A copy of the cached profile for user_id, or None"""
+        with self._lock:
+            entry = self._entries.get(user_id)
+            if entry is None:
+                self.misses += 1
+                return None
+            if entry[0] <= self._clock():
+                self._drop(user_id)
+                self.misses += 1
+                return None
+            self._entries.move_to_end(user_id)
+            self.hits += 1
+            return dict(entry[1])
+
+    def get_by_email(self, email):
+        with self._lock:
+            user_id = self._ids_by_email.get(email)
+        if user_id is None:
+            with self._lock:
+                self.misses += 1
+            return None
+        return self.get(user_id)
+
+    def put(self, profile):
+        """Cache a profile dict (needs 'id' and 'email')"""
+        if self.maxsize <= 0 or self.ttl <= 0:
+            return
+        with self._lock:
+            self._drop(profile['id'])
+            self._entries[profile['id']] = (self._clock() + self.ttl, dict(profile))
+            self._ids_by_email[profile['email']] = profile['id']
+            while len(self._entries) > self.maxsize:
+                self._drop(next(iter(self._entries)))
+
+    def invalidate(self, user_id=None, email=None):
+        """Forget a user by id and/or email"""
+        with self._lock:
+            if email is not None and user_id is None:
+                user_id = self._ids_by_email.get(email)
+            if user_id is not None:
+                self._drop(user_id)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._ids_by_email.clear()
+
+    def _drop(self, user_id):
+        entry = self._entries.pop(user_id, None)
+        if entry is not None and self._ids_by_email.get(entry[1]['email']) == user_id:
+            del self._ids_by_email[entry[1]['email']]
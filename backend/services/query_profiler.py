@@ -0,0 +1,143 @@
+"""
+Query Profiler - slow-query log and query budgets
+Listens to statements executed through metrics.connect() and the other storage
+backends' instrumented cursors. Statements slower than a threshold are written,
+with their EXPLAIN QUERY PLAN (SQLite only), to a rotating JSON-lines log.
+capture_queries()/query_budget() record every statement on the current thread
+so scripts and CI checks can cap the queries a route may run.
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from logging.handlers import RotatingFileHandler
+
+from flask import has_request_context, request
+
+from . import metrics
+
+logger = logging.getLogger('web_inter_prep.slow_queries')
+logger.propagate = False
+
+_local = threading.local()
+_settings = {'threshold_ms': None}
+_EXPLAINABLE = ('SELECT', 'INSERT', 'UPDATE', 'DELETE', 'REPLACE', 'WITH')
+
+
+class QueryBudgetExceeded(AssertionError):
+    """Raised by query_budget() when a block runs more statements than allowed"""
+
+
+def parameters_shape(parameters, many=False):
+    """Describe bound parameters by type only, never by value"""
+    if many:
+        rows = parameters if isinstance(parameters, (list, tuple)) else []
+        first = parameters_shape(rows[0]) if rows else '()'
+        return f'{len(rows)}x{first}'
+    if isinstance(parameters, dict):
+        return '{' + ', '.join(f'{k}: {type(v).__name__}' for k, v in sorted(parameters.items())) + '}'
+    return '(' + ', '.join(type(v).__name__ for v in (parameters or ())) + ')'
+
+
+def _normalize_sql(sql):
+    return ' '.join(sql.split())
+
+
+def explain(conn, sql, parameters=()):
+    """Return EXPLAIN QUERY PLAN detail lines, or [] when the statement can't be explained"""
+    words = sql.split(None, 1)
+    if not words or words[0].upper() not in _EXPLAINABLE:
+        return []
+    if not isinstance(conn, sqlite3.Connection):
+        # EXPLAIN QUERY PLAN is SQLite-only; server databases have their own tooling
+        return []
+    try:
+        # Plain cursor so the EXPLAIN itself isn't recorded
+        cursor = sqlite3.Cursor(conn)
+        cursor.execute('EXPLAIN QUERY PLAN ' + sql, parameters)
+        return [row[-1] for row in cursor.fetchall()]
+    except sqlite3.Error:
+        return []
+
+
+def _on_query(conn, sql, parameters, elapsed, many):
+    captures = getattr(_local, 'captures', None)
+    if captures:
+        record = {
+            'sql': _normalize_sql(sql),
+            'params': parameters_shape(parameters, many),
+            'ms': round(elapsed * 1000, 3)
+        }
+        for capture in captures:
+            if capture['explain']:
+                record.setdefault('plan', explain(conn, sql, () if many else parameters))
+            capture['queries'].append(record)
+
+    threshold_ms = _settings['threshold_ms']
+    if threshold_ms is None or elapsed * 1000 < threshold_ms:
+        return
+    entry = {
+        'ts': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'ms': round(elapsed * 1000, 3),
+        'sql': _normalize_sql(sql),
+        'params': parameters_shape(parameters, many),
+        'endpoint': request.endpoint if has_request_context() else None,
+        'plan': explain(conn, sql, () if many else parameters)
+    }
+    logger.warning(json.dumps(entry))
+
+
+@contextmanager
+def capture_queries(explain_plans=False):
+    """Collect every statement run on this thread inside the block"""
+    capture = {'queries': [], 'explain': explain_plans}
+    captures = getattr(_local, 'captures', None)
+    if captures is None:
+        captures = _local.captures = []
+    captures.append(capture)
+    metrics.add_query_listener(_on_query)
+    try:
+        yield capture['queries']
+    finally:
+        captures.remove(capture)
+
+
+@contextmanager
+def query_budget(max_queries, label='block'):
+    """Fail with QueryBudgetExceeded if the block runs more than max_queries statements"""
+    with capture_queries() as queries:
+        yield queries
+    if len(queries) > max_queries:
+        listing = '\n'.join(f'  {q["sql"]} {q["params"]}' for q in queries)
+        raise QueryBudgetExceeded(
+            f'{label} ran {len(queries)} queries (budget {max_queries}):\n{listing}'
+        )
+
+
+def init_app(app, log_path=None, threshold_ms=None, max_bytes=5 * 1024 * 1024, backup_count=5):
+    """Enable the slow-query log for an app.
+
+    Defaults come from the SLOW_QUERY_MS and SLOW_QUERY_LOG config keys
+    (None means slow_queries.log in the instance folder).
+    """
+    if threshold_ms is None:
+        threshold_ms = app.config['SLOW_QUERY_MS']
+    if log_path is None:
+        log_path = app.config['SLOW_QUERY_LOG'] or os.path.join(app.instance_path, 'slow_queries.log')
+    try:
+        os.makedirs(os.path.dirname(os.path.abspath(log_path)), exist_ok=True)
+        if not any(getattr(h, 'baseFilename', None) == os.path.abspath(log_path) for h in logger.handlers):
+            handler = RotatingFileHandler(log_path, maxBytes=max_bytes, backupCount=backup_count)
+            handler.setFormatter(logging.Formatter('%(message)s'))
+            logger.addHandler(handler)
+        logger.setLevel(logging.WARNING)
+    except OSError as e:
+        # Read-only filesystems (e.g. serverless) fall back to stderr
+        app.logger.warning(f"Slow query log disabled: {e}")
+        logger.addHandler(logging.StreamHandler())
+    _settings['threshold_ms'] = threshold_ms
+    metrics.add_query_listener(_on_query)
@@ -0,0 +1,23 @@
+"""
+Question Bank - practice questions from backend/data/questions.json
+"""
+
+import json
+import logging
+import os
+
+logger = logging.getLogger(__name__)
+
+QUESTIONS_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data', 'questions.json')
+
+
+def load_questions(q_path=QUESTIONS_PATH):
+    try:
+        logger.debug('Loading questions from: %s', q_path)
+        with open(q_path, 'r') as f:
+            data = json.load(f)
+            logger.debug('Loaded %d questions', len(data['questions']))
+            return data['questions']
+    except Exception as e:
+        logger.error('Error loading questions: %s', e)
+        return []
@@ -0,0 +1,127 @@
+"""
+Roadmap Renderer - Gemini markdown to Bootstrap cards
+Single-pass, escaping renderer with incremental feed() support and an
+in-process cache keyed by the hash of the input text.
+"""
+
+import hashlib
+import re
+import threading
+from collections import OrderedDict
+from html import escape
+
+# Stage headings, optionally wrapped in markdown emphasis or prefixed by '#'
+HEADING_RE = re.compile(r'^(?:#+\s*)?(?:\*\*)?\s*(?:foundational|intermediate|advanced)', re.IGNORECASE)
+BULLET_RE = re.compile(r'^\*\s+(.*)$')
+_EMPHASIS_RE = re.compile(r'\*\*|^#+\s*')
+
+ROADMAP_PREFIX = (
+    '<div class="ai-roadmap">'
+    '<div class="alert alert-info mb-3"><i class="fas fa-wand-magic me-2"></i><strong>Generated with Gemini</strong></div>'
+)
+ROADMAP_SUFFIX = '</div>'
+DEFAULT_TITLE = 'Roadmap'
+
+
+def _clean(text):
+    """Drop markdown emphasis markers and escape for HTML"""
+    return escape(_EMPHASIS_RE.sub('', text).strip())
+
+
+class RoadmapRenderer:
+    """Incremental renderer: feed() text chunks, then close().
+
+    Each call returns the HTML that became final with that chunk, so callers
+    can stream cards to the client as soon as the next stage heading arrives.
+    """
+
+    def __init__(self):
+        self._pending = ''
+        self._title = DEFAULT_TITLE
+        self._body = []
+        self._in_ul = False
+        self._started = False
+
+    def feed(self, chunk):
+        """Consume a chunk of markdown. Returns newly completed HTML."""
+        out = []
+        if not self._started:
+            out.append(ROADMAP_PREFIX)
+            self._started = True
+        data = self._pending + chunk
+        lines = data.split('\n')
+        self._pending = lines.pop()
+        for ln in lines:
+            self._line(ln.strip(), out)
+        return ''.join(out)
+
+    def close(self):
+        """Flush buffered text and close the roadmap container."""
+        out = [] if self._started else [ROADMAP_PREFIX]
+        self._started = True
+        if self._pending:
+            self._line(self._pending.strip(), out)
+            self._pending = ''
+        self._flush(out)
+        out.append(ROADMAP_SUFFIX)
+        return ''.join(out)
+
+    def _line(self, ln, out):
+        if ln and HEADING_RE.match(ln) and not BULLET_RE.match(ln):
+            self._flush(out)
+            self._title = _clean(ln)
+            return
+        bullet = BULLET_RE.match(ln)
+        body = self._body
+        if bullet:
+            if not self._in_ul:
+                body.append('<ul class="mb-2">')
+                self._in_ul = True
+            body.append('<li>' + _clean(bullet.group(1)) + '</li>')
+            return
+        if self._in_ul:
+            body.append('</ul>')
+            self._in_ul = False
+        if ln:
+            body.append('<p class="mb-2">' + _clean(ln) + '</p>')
+
+    def _flush(self, out):
+        if self._in_ul:
+            self._body.append('</ul>')
+            self._in_ul = False
+        if not self._body:
+            return
+        out.append('<div class="stage-card card shadow-sm border-0 mb-3">')
+        out.append(f'  <div class="card-header bg-dark text-white fw-semibold">{self._title}</div>')
+        out.append('  <div class="card-body">')
+        out.extend(self._body)
+        out.append('</div></div>')
+        self._body = []
+
+
+_CACHE_SIZE = 256
+_cache = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+def render_roadmap(text):
+    """Render a full roadmap, reusing the cached HTML for identical input"""
+    key = hashlib.sha256(text.encode('utf-8')).digest()
+    with _cache_lock:
+        html = _cache.get(key)
+        if html is not None:
+            _cache.move_to_end(key)
+            return html
+    renderer = RoadmapRenderer()
+    html = renderer.feed(text) + renderer.close()
+    with _cache_lock:
+        _cache[key] = html
+        while len(_cache) > _CACHE_SIZE:
+            _cache.popitem(last=False)
+    return html
+
+
+def clear_cache():
+    """Drop all cached renders"""
+    with _cache_lock:
+        _cache.clear()
@@ -0,0 +1,50 @@
+"""
+Spaced Repetition - SM-2 scheduling for practice questions
+Each (user, question) pair carries a memory state: consecutive correct
+answers (`reps`), the current interval in days and an ease factor. A correct
+answer grows the interval (1 day, 6 days, then interval x ease); a wrong one
+starts the question over at 1 day and lowers its ease, so questions a user
+keeps missing come back more often than ones they know.
+
+Attempts are pass/fail, so they map to SM-2 grades CORRECT_GRADE and
+INCORRECT_GRADE. Pure functions only; models/review.py stores the state.
+"""
+
+from datetime import datetime, timedelta
+
+INITIAL_EASE = 2.5
+MIN_EASE = 1.3
+CORRECT_GRADE = 4
+INCORRECT_GRADE = 1
+# Intervals (days) after the first and second correct answer in a row
+FIRST_INTERVAL = 1.0
+SECOND_INTERVAL = 6.0
+MAX_INTERVAL = 365.0
+TIMESTAMP_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+
+def next_ease(ease, grade):
+    """SM-2 ease update for a 0-5 grade, floored at MIN_EASE"""
+    miss = 5 - grade
+    return max(MIN_EASE, ease + 0.1 - miss * (0.08 + miss * 0.02))
+
+
+def schedule(reps, interval, ease, correct):
+    """(reps, interval_days, ease) after one answer to a question in state (reps, interval, ease)"""
+    ease = next_ease(ease, CORRECT_GRADE if correct else INCORRECT_GRADE)
+    if not correct:
+        return 0, FIRST_INTERVAL, ease
+    reps += 1
+    if reps == 1:
+        interval = FIRST_INTERVAL
+    elif reps == 2:
+        interval = SECOND_INTERVAL
+    else:
+        interval = min(MAX_INTERVAL, round(interval * ease, 2))
+    return reps, interval, ease
+
+
+def due_at(reviewed_at, interval):
+    """UTC 'YYYY-MM-DD HH:MM:SS' when a question reviewed at `reviewed_at` is next due"""
+    reviewed = datetime.strptime(reviewed_at, TIMESTAMP_FORMAT)
+    return (reviewed + timedelta(days=interval)).strftime(TIMESTAMP_FORMAT)
@@ -3,13 +3,14 @@ User Service - Business Logic Layer
 Handles user-related business operations
 """
 
-from models.user import User
-from models.attempt import Attempt
+from ..models.user import User
+from ..models.attempt import Attempt
 
 class UserService:
-    def __init__(self):
-        self.user_model = User()
-        self.attempt_model = Attempt()
+    def __init__(self, db='interview_prep.db'):
+        # db: a storage.Database (e.g. db.database() inside the app) or a SQLite path
+        self.user_model = User(db)
+        self.attempt_model = Attempt(db)
     
     def register_user(self, name, email, password):
         """Register a new user with business logic validation"""
@@ -0,0 +1,224 @@
+"""
+Storage Base - pooled connections shared by every database backend
+Repositories write SQL once with ?-placeholders in the subset of SQLite that
+PostgreSQL also accepts; each backend translates it (sql()/ddl()) and knows how
+to return new row ids and track the schema version.
+
+A Database may have a read-only `replica`. fetchone/fetchall/scalar go to it
+inside a replica_reads() block; writes and transactions always use the primary.
+"""
+
+import os
+import queue
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+_replica_reads = ContextVar('replica_reads', default=False)
+
+
+@contextmanager
+def replica_reads(enabled=True):
+    """Route one-statement reads in this block to each database's replica, if it has one"""
+    token = _replica_reads.set(enabled)
+    try:
+        yield
+    finally:
+        _replica_reads.reset(token)
+
+
+class PoolTimeout(RuntimeError):
+    """No pooled connection became free within the pool timeout"""
+
+
+class ConnectionPool:
+    """Fixed-size LIFO pool; connections open lazily and are never shared across fork()"""
+
+    def __init__(self, open_connection, size=5, timeout=10.0):
+        self._open = open_connection
+        self.size = size
+        self.timeout = timeout
+        self._reset()
+
+    def _reset(self):
+        self._pid = os.getpid()
+        self._idle = queue.LifoQueue()
+        self._slots = threading.BoundedSemaphore(self.size)
+
+    def acquire(self):
+        if self._pid != os.getpid():
+            # gunicorn --preload: the parent's handles belong to the parent
+            self._reset()
+        if not self._slots.acquire(timeout=self.timeout):
+            raise PoolTimeout(f'No database connection free after {self.timeout}s (pool size {self.size})')
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+        try:
+            return self._open()
+        except BaseException:
+            self._slots.release()
+            raise
+
+    def release(self, conn, discard=False):
+        if self._pid != os.getpid():
+            # Checked out before a fork; the new pool never counted it
+            return
+        if discard:
+            try:
+                conn.close()
+            except Exception:
+                pass
+        else:
+            self._idle.put(conn)
+        self._slots.release()
+
+    def close(self):
+        """Close idle connections (checked-out ones close when released with discard)"""
+        while True:
+            try:
+                conn = self._idle.get_nowait()
+            except queue.Empty:
+                return
+            try:
+                conn.close()
+            except Exception:
+                pass
+
+
+class Database:
+    """A pooled database; subclasses open connections and translate SQL"""
+
+    dialect = None
+    integrity_errors = ()
+
+    def __init__(self, uri, pool_size=5, pool_timeout=10.0, readonly=False):
+        self.uri = uri
+        self.readonly = readonly
+        self.replica = None
+        self.pool = ConnectionPool(self._connect, size=pool_size, timeout=pool_timeout)
+        self._commit_listeners = []
+
+    def __repr__(self):
+        return f'<{type(self).__name__} {self.display_uri}>'
+
+    @property
+    def display_uri(self):
+        """URI with any password masked, for logs and CLI output"""
+        scheme, sep, rest = self.uri.partition('://')
+        creds, at, host = rest.rpartition('@')
+        if at and ':' in creds:
+            rest = creds.split(':', 1)[0] + ':***@' + host
+        return scheme + sep + rest
+
+    # --- backend hooks ---------------------------------------------------------
+
+    def _connect(self):
+        raise NotImplementedError
+
+    def sql(self, statement):
+        """Translate a repository statement to this backend's dialect"""
+        return statement
+
+    def ddl(self, statement):
+        """Translate a CREATE TABLE/INDEX statement to this backend's types"""
+        return statement
+
+    def insert(self, conn, statement, params=()):
+        """Run an INSERT and return the new row's id"""
+        raise NotImplementedError
+
+    def schema_version(self, conn):
+        raise NotImplementedError
+
+    def set_schema_version(self, conn, version):
+        raise NotImplementedError
+
+    # --- connections -----------------------------------------------------------
+
+    @contextmanager
+    def connection(self):
+        """Borrow a pooled connection; anything left uncommitted is rolled back on return"""
+        conn = self.pool.acquire()
+        healthy = True
+        try:
+            yield conn
+        finally:
+            try:
+                conn.rollback()
+            except Exception:
+                healthy = False
+            self.pool.release(conn, discard=not healthy)
+
+    @contextmanager
+    def transaction(self):
+        """Borrow a connection and commit when the block succeeds"""
+        with self.connection() as conn:
+            yield conn
+            conn.commit()
+        for listener in list(self._commit_listeners):
+            listener(self)
+
+    def add_commit_listener(self, listener):
+        """Call listener(database) after every committed transaction()"""
+        if listener not in self._commit_listeners:
+            self._commit_listeners.append(listener)
+
+    def reader(self):
+        """The database one-statement reads should use right now"""
+        if self.replica is not None and _replica_reads.get():
+            return self.replica
+        return self
+
+    def close(self):
+        self.pool.close()
+        if self.replica is not None:
+            self.replica.close()
+
+    # --- one-statement helpers ---------------------------------------------------
+
+    def execute(self, conn, statement, params=()):
+        cursor = conn.cursor()
+        try:
+            cursor.execute(self.sql(statement), params)
+        except Exception:
+            # The traceback keeps this cursor alive; if it were finalized later by the
+            # garbage collector on another thread, that thread would contend for a
+            # connection that is back in the pool and in use
+            cursor.close()
+            raise
+        return cursor
+
+    def executemany(self, conn, statement, rows):
+        cursor = conn.cursor()
+        try:
+            cursor.executemany(self.sql(statement), rows)
+        except Exception:
+            cursor.close()
+            raise
+        return cursor
+
+    def fetchone(self, statement, params=()):
+        db = self.reader()
+        with db.connection() as conn:
+            return db.execute(conn, statement, params).fetchone()
+
+    def fetchall(self, statement, params=()):
+        db = self.reader()
+        with db.connection() as conn:
+            return db.execute(conn, statement, params).fetchall()
+
+    def scalar(self, statement, params=()):
+        row = self.fetchone(statement, params)
+        return row[0] if row else None
+
+    def write(self, statement, params=()):
+        """Run one write statement in its own transaction; returns the rowcount"""
+        with self.transaction() as conn:
+            return self.execute(conn, statement, params).rowcount
+
+    def insert_one(self, statement, params=()):
+        """Run one INSERT in its own transaction; returns the new row's id"""
+        with self.transaction() as conn:
+            return self.insert(conn, statement, params)
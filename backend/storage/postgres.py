@@ -0,0 +1,112 @@
+"""
+PostgreSQL Backend - a server database shared by every instance
+Optional: needs psycopg 3 (`pip install "psycopg[binary]"`), imported on first
+connection. Connections are created with prepare_threshold=0 so every
+repository statement becomes a server-side prepared statement on first use
+and is reused for the life of the pooled connection.
+
+A replica DSN gets a second PostgresDatabase with readonly=True, whose
+sessions default to read-only transactions.
+
+Timestamps are stored as UTC 'YYYY-MM-DD HH:MM:SS' text, the same shape
+SQLite's CURRENT_TIMESTAMP produces, so routes and templates see identical
+values whichever backend is configured.
+"""
+
+import re
+import time
+from functools import lru_cache
+
+from ..services import metrics
+from .base import Database
+
+NOW_TEXT = "to_char(now() AT TIME ZONE 'UTC', 'YYYY-MM-DD HH24:MI:SS')"
+
+_psycopg = None
+_cursor_class = None
+
+
+def _driver():
+    global _psycopg, _cursor_class
+    if _psycopg is None:
+        try:
+            import psycopg
+        except ImportError as e:
+            raise RuntimeError('PostgreSQL storage needs psycopg 3: pip install "psycopg[binary]"') from e
+
+        class InstrumentedCursor(psycopg.Cursor):
+            """Feeds statement timings to metrics like metrics.connect() does for SQLite"""
+
+            def execute(self, query, params=None, **kwargs):
+                start = time.perf_counter()
+                try:
+                    return super().execute(query, params, **kwargs)
+                finally:
+                    metrics.record_query(self, str(query), params or (), time.perf_counter() - start)
+
+            def executemany(self, query, params_seq, **kwargs):
+                params_seq = list(params_seq)
+                start = time.perf_counter()
+                try:
+                    return super().executemany(query, params_seq, **kwargs)
+                finally:
+                    metrics.record_query(self, str(query), params_seq, time.perf_counter() - start, many=True)
+
+        _psycopg, _cursor_class = psycopg, InstrumentedCursor
+    return _psycopg
+
+
+@lru_cache(maxsize=512)
+def translate(statement):
+    """?-placeholders to %s and CURRENT_TIMESTAMP to UTC text, leaving string literals alone"""
+    parts = statement.replace('%', '%%').split("'")
+    for i in range(0, len(parts), 2):
+        parts[i] = parts[i].replace('?', '%s').replace('CURRENT_TIMESTAMP', NOW_TEXT)
+    return "'".join(parts)
+
+
+@lru_cache(maxsize=64)
+def translate_ddl(statement):
+    statement = statement.replace('INTEGER PRIMARY KEY AUTOINCREMENT',
+                                  'BIGINT GENERATED BY DEFAULT AS IDENTITY PRIMARY KEY')
+    statement = statement.replace('TIMESTAMP DEFAULT CURRENT_TIMESTAMP', f'TEXT DEFAULT {NOW_TEXT}')
+    statement = re.sub(r'(?<!\w)TIMESTAMP\b', 'TEXT', statement)
+    # Stored as 0/1 so `correct = 1` and SUM(correct) work as they do in SQLite
+    return statement.replace('BOOLEAN', 'SMALLINT')
+
+
+class PostgresDatabase(Database):
+    dialect = 'postgresql'
+
+    def __init__(self, uri, pool_size=5, pool_timeout=10.0, prepare_threshold=0, readonly=False):
+        self.prepare_threshold = prepare_threshold
+        super().__init__(uri, pool_size=pool_size, pool_timeout=pool_timeout, readonly=readonly)
+
+    @property
+    def integrity_errors(self):
+        return (_driver().IntegrityError,)
+
+    def _connect(self):
+        psycopg = _driver()
+        options = {'options': '-c default_transaction_read_only=on'} if self.readonly else {}
+        return psycopg.connect(self.uri, prepare_threshold=self.prepare_threshold,
+                               cursor_factory=_cursor_class, **options)
+
+    def sql(self, statement):
+        return translate(statement)
+
+    def ddl(self, statement):
+        return translate_ddl(statement)
+
+    def insert(self, conn, statement, params=()):
+        return self.execute(conn, statement.rstrip().rstrip(';') + ' RETURNING id', params).fetchone()[0]
+
+    def schema_version(self, conn):
+        self.execute(conn, 'CREATE TABLE IF NOT EXISTS schema_meta (version INTEGER NOT NULL)')
+        row = self.execute(conn, 'SELECT MAX(version) FROM schema_meta').fetchone()
+        return row[0] or 0
+
+    def set_schema_version(self, conn, version):
+        self.execute(conn, 'CREATE TABLE IF NOT EXISTS schema_meta (version INTEGER NOT NULL)')
+        self.execute(conn, 'DELETE FROM schema_meta')
+        self.execute(conn, 'INSERT INTO schema_meta (version) VALUES (?)', (int(version),))
@@ -0,0 +1,50 @@
+"""
+SQLite Backend - the default single-file database
+Pooled connections keep sqlite3's per-connection statement cache warm, so the
+repository SQL is compiled once per connection rather than once per request.
+
+With wal=True the file is switched to write-ahead logging so a read-only
+sibling (readonly=True, opened as file:...?mode=ro) can serve reads while a
+writer holds its lock; both see the same committed data.
+"""
+
+import sqlite3
+from urllib.parse import quote
+
+from ..services.metrics import connect
+from .base import Database
+
+
+class SQLiteDatabase(Database):
+    dialect = 'sqlite'
+    integrity_errors = (sqlite3.IntegrityError,)
+
+    def __init__(self, path, pool_size=5, pool_timeout=10.0, cached_statements=128, wal=False, readonly=False):
+        self.path = path
+        self.cached_statements = cached_statements
+        self.wal = wal
+        super().__init__(f'sqlite:///{path}', pool_size=pool_size, pool_timeout=pool_timeout, readonly=readonly)
+
+    def _connect(self):
+        # Pooled connections move between request threads, one at a time
+        if self.readonly:
+            return connect(f'file:{quote(self.path)}?mode=ro', uri=True,
+                           check_same_thread=False, cached_statements=self.cached_statements)
+        conn = connect(self.path, check_same_thread=False, cached_statements=self.cached_statements)
+        if self.wal:
+            conn.execute('PRAGMA journal_mode = WAL')
+        return conn
+
+    def read_only(self, pool_size=None):
+        """A read-only pool on the same file (needs wal=True here to avoid reader/writer blocking)"""
+        return SQLiteDatabase(self.path, pool_size=pool_size or self.pool.size, pool_timeout=self.pool.timeout,
+                              cached_statements=self.cached_statements, readonly=True)
+
+    def insert(self, conn, statement, params=()):
+        return self.execute(conn, statement, params).lastrowid
+
+    def schema_version(self, conn):
+        return conn.execute('PRAGMA user_version').fetchone()[0]
+
+    def set_schema_version(self, conn, version):
+        conn.execute(f'PRAGMA user_version = {int(version)}')
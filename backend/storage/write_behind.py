@@ -0,0 +1,162 @@
+"""
+Write-Behind Queue - group commit for high-volume inserts
+Callers add rows to a bounded in-process queue; one writer thread drains it
+and hands up to max_rows rows (or whatever arrived within max_delay seconds)
+to a flush function that writes them in one transaction. Many concurrent
+submits then share one commit/fsync instead of paying for one each.
+
+Durability per add(): wait=True blocks until the row's batch has committed
+(and re-raises its error); wait=False returns as soon as the row is queued.
+A full queue applies backpressure for put_timeout seconds, then the row is
+written inline; inline=True skips the queue altogether. close() (registered
+with atexit) flushes what is left.
+"""
+
+import atexit
+import logging
+import os
+import queue
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+_STOP = object()
+
+
+class _Ticket:
+    """Completion handle for one queued row (or a flush() barrier)"""
+
+    __slots__ = ('done', 'error')
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.error = None
+
+
+class WriteBehind:
+    def __init__(self, flush, max_rows=200, max_delay=0.005, max_queue=10000, wait=True,
+                 inline=False, put_timeout=1.0, commit_timeout=30.0, name='write-behind'):
+        self._flush = flush
+        self.max_rows = max_rows
+        self.max_delay = max_delay
+        self.max_queue = max_queue
+        self.wait = wait
+        self.inline = inline
+        self.put_timeout = put_timeout
+        self.commit_timeout = commit_timeout
+        self.name = name
+        self._lock = threading.Lock()
+        self._pid = None
+        self._thread = None
+        self._closed = False
+        self._registered = False
+
+    def _start(self):
+        # Started on first use, and again in a forked worker (the parent's thread does not survive fork)
+        if self._thread is not None and self._pid == os.getpid():
+            return
+        with self._lock:
+            if self._thread is not None and self._pid == os.getpid():
+                return
+            self._pid = os.getpid()
+            self._queue = queue.Queue(self.max_queue)
+            self._thread = threading.Thread(target=self._run, name=self.name, daemon=True)
+            self._thread.start()
+            if not self._registered:
+                atexit.register(self.close)
+                self._registered = True
+
+    # --- producers -------------------------------------------------------------
+
+    def add(self, row, wait=None):
+        """Queue one row; with wait (default: the queue's mode) return only once it is committed"""
+        wait = self.wait if wait is None else wait
+        if self.inline or self._closed:
+            self._flush([row])
+            return
+        self._start()
+        ticket = _Ticket() if wait else None
+        try:
+            self._queue.put((row, ticket), timeout=self.put_timeout)
+        except queue.Full:
+            logger.warning('%s queue full (%d rows); writing inline', self.name, self.max_queue)
+            self._flush([row])
+            return
+        if ticket is not None:
+            self._await(ticket)
+
+    def flush(self):
+        """Block until every row queued before this call is committed"""
+        if self._thread is None or self._pid != os.getpid() or not self._queue.unfinished_tasks:
+            return
+        barrier = _Ticket()
+        self._queue.put((None, barrier))
+        self._await(barrier)
+
+    def close(self):
+        """Flush outstanding rows and stop the writer thread"""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+        if self._thread is not None and self._pid == os.getpid():
+            self._queue.put((_STOP, None))
+            self._thread.join(self.commit_timeout)
+
+    def _await(self, ticket):
+        if not ticket.done.wait(self.commit_timeout):
+            raise TimeoutError(f'{self.name}: commit not confirmed within {self.commit_timeout}s')
+        if ticket.error is not None:
+            raise ticket.error
+
+    # --- writer thread -----------------------------------------------------------
+
+    def _run(self):
+        while True:
+            batch = [self._queue.get()]
+            deadline = time.monotonic() + self.max_delay
+            while len(batch) < self.max_rows and batch[-1][0] is not _STOP:
+                try:
+                    batch.append(self._queue.get_nowait())
+                    continue
+                except queue.Empty:
+                    pass
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+            stop = batch[-1][0] is _STOP
+            self._commit([item for item in batch if item[0] is not _STOP])
+            for _ in batch:
+                self._queue.task_done()
+            if stop:
+                return
+
+    def _commit(self, batch):
+        rows = [(row, ticket) for row, ticket in batch if row is not None]
+        try:
+            if rows:
+                self._flush([row for row, _ in rows])
+        except Exception as e:
+            if len(rows) == 1:
+                self._fail(rows[0][1], e)
+            else:
+                # One bad row must not take the rest of the batch with it
+                for row, ticket in rows:
+                    try:
+                        self._flush([row])
+                    except Exception as row_error:
+                        self._fail(ticket, row_error)
+        for _, ticket in batch:
+            if ticket is not None:
+                ticket.done.set()
+
+    def _fail(self, ticket, error):
+        if ticket is None:
+            logger.error('%s: dropped a row after a failed write', self.name, exc_info=error)
+        else:
+            ticket.error = error
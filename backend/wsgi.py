@@ -4,7 +4,13 @@ WSGI entry point for Web-Inter-Prep
 This file is used by Render to start the Flask application
 """
 
-from app import app
+import os
+import sys
+
+# backend/app.py is a package module (relative imports), so import it as backend.app
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backend.app import app
 
 if __name__ == "__main__":
     app.run()
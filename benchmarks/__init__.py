@@ -0,0 +1 @@
+# Benchmarks package: micro and load benchmarks for the backend
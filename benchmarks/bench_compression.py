@@ -0,0 +1,133 @@
+"""
+Response compression: CPU cost vs bytes saved
+Compresses response bodies the app actually sends (rendered /resources,
+/practice and /dashboard pages, resume and solution JSON, roadmap HTML) with
+gzip and, when installed, brotli at several levels, and reports time per
+body, compressed size and bytes saved per CPU millisecond. Then times a
+signed-in GET /practice (rendered every time, unlike the page-cached public
+pages) through the full app with CompressionMiddleware on and off.
+Finally checks that /assets revalidations still get 304 Not Modified
+through the middleware (exit 1 otherwise).
+
+Run from the repository root:
+    python -m benchmarks.bench_compression [--number 200]
+"""
+
+import argparse
+import gzip
+import json
+import os
+import sys
+import tempfile
+import timeit
+
+_workdir = tempfile.mkdtemp(prefix='bench-compression-')
+# Keep the app's slow-query log out of the instance folder
+os.environ.setdefault('SLOW_QUERY_LOG', os.path.join(_workdir, 'slow_queries.log'))
+
+from backend.factory import create_app  # noqa: E402
+from backend.services.compression import _brotli  # noqa: E402
+from backend.services.roadmap_renderer import RoadmapRenderer  # noqa: E402
+
+from .bench_hot_paths import _roadmap_text  # noqa: E402
+from .bench_json import _payloads  # noqa: E402
+
+
+def _app(compression):
+    return create_app({
+        'TESTING': True,
+        'DATABASE_PATH': os.path.join(_workdir, 'bench.db'),
+        'PASSWORD_HASH_WORKERS': 0,
+        'PASSWORD_HASH_METHOD': 'pbkdf2:sha256:1000',
+        'COMPRESSION': compression,
+    })
+
+
+def _signed_in(app):
+    client = app.test_client()
+    client.post('/register', data={'name': 'Bench', 'email': 'bench@example.com', 'password': 'bench-pass'})
+    client.post('/login', data={'email': 'bench@example.com', 'password': 'bench-pass'})
+    return client
+
+
+def _bodies():
+    client = _signed_in(_app(False))
+    bodies = {'resources.html': client.get('/resources').data}
+    bodies['practice.html'] = client.get('/practice').data
+    bodies['dashboard.html'] = client.get('/dashboard').data
+    payloads = _payloads()
+    bodies['resume.json'] = json.dumps(payloads['resume']).encode()
+    bodies['solution.json'] = json.dumps(payloads['solution']).encode()
+    renderer = RoadmapRenderer()
+    bodies['roadmap.html'] = (renderer.feed(_roadmap_text(200)) + renderer.close()).encode()
+    return bodies
+
+
+def _codecs():
+    codecs = [(f'gzip-{level}', lambda data, level=level: gzip.compress(data, level, mtime=0)) for level in (1, 6, 9)]
+    brotli = _brotli()
+    if brotli is not None:
+        codecs += [(f'br-{q}', lambda data, q=q: brotli.compress(data, quality=q)) for q in (1, 4, 11)]
+    return codecs
+
+
+def _revalidation_failures():
+    """/assets GETs repeated with the ETag just received that did not come back 304"""
+    client = _app(True).test_client()
+    manifest = client.application.extensions['assets']
+    asset = max(manifest.by_source.values(), key=lambda a: len(a.variants['identity']))
+    stem, ext = os.path.splitext(asset.source)
+    failures = []
+    # Current and previous-deploy (no-cache) fingerprints, each per encoding
+    for url in (f'/assets/{asset.url_path}', f'/assets/{stem}.0000000000{ext}'):
+        for accept in ('br, gzip', 'gzip', 'identity'):
+            first = client.get(url, headers={'Accept-Encoding': accept})
+            again = client.get(url, headers={'Accept-Encoding': accept, 'If-None-Match': first.headers['ETag']})
+            if again.status_code != 304:
+                failures.append(f'{url} ({accept}, {first.headers["ETag"]}): {again.status_code}')
+    return failures
+
+
+def _time(fn, number):
+    return min(timeit.repeat(fn, number=number, repeat=5)) / number
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--number', type=int, default=200, help='iterations per timing run')
+    args = parser.parse_args()
+
+    if _brotli() is None:
+        print('brotli not installed: gzip only (pip install brotli)')
+    print(f'{"body":<16} {"codec":<8} {"bytes":>8} {"out":>8} {"ratio":>6} {"us":>9} {"KB saved/cpu-ms":>16}')
+    for name, body in _bodies().items():
+        for codec, fn in _codecs():
+            seconds = _time(lambda: fn(body), args.number)
+            out = len(fn(body))
+            saved_per_ms = (len(body) - out) / 1024 / (seconds * 1000)
+            print(f'{name:<16} {codec:<8} {len(body):>8} {out:>8} {out / len(body):>6.2f} '
+                  f'{seconds * 1e6:>9.1f} {saved_per_ms:>16.1f}')
+
+    print()
+    print(f'{"GET /practice (signed in)":<28} {"us/request":>10} {"bytes":>8}')
+    for label, compression, headers in (
+        ('middleware off', False, {'Accept-Encoding': 'gzip'}),
+        ('middleware on, identity', True, {}),
+        ('middleware on, gzip', True, {'Accept-Encoding': 'gzip'}),
+    ):
+        client = _signed_in(_app(compression))
+        size = len(client.get('/practice', headers=headers).data)
+        seconds = _time(lambda: client.get('/practice', headers=headers), args.number)
+        print(f'{label:<28} {seconds * 1e6:>10.1f} {size:>8}')
+
+    print()
+    failures = _revalidation_failures()
+    for failure in failures:
+        print(f'/assets revalidation not 304: {failure}')
+    if failures:
+        sys.exit(1)
+    print('/assets revalidation: 304 through the middleware')
+
+
+if __name__ == '__main__':
+    main()
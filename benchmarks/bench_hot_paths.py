@@ -0,0 +1,211 @@
+"""
+Hot-path micro-benchmarks
+Times the helpers called on every dashboard, roadmap, AI-interview and
+mock-results request on synthetic inputs of increasing size, and fits the
+growth exponent (time ~ n^k) so a change from O(n) to O(n^2) shows up as k
+moving from ~1 to ~2. Results can be saved as a baseline and compared.
+
+Run from the repository root:
+    python -m benchmarks.bench_hot_paths [--sizes 10,100,1000,10000] [--save-baseline | --compare]
+"""
+
+import argparse
+import json
+import math
+import os
+import random
+import statistics
+import sys
+import tempfile
+import timeit
+from datetime import date, timedelta
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BASELINE_PATH = os.path.join(REPO_ROOT, 'benchmarks', 'baselines', 'hot_paths.json')
+DEFAULT_SIZES = (10, 100, 1000, 10000)
+
+_workdir = tempfile.mkdtemp(prefix='bench-hot-')
+# Keep the app's slow-query log out of the instance folder
+os.environ.setdefault('SLOW_QUERY_LOG', os.path.join(_workdir, 'slow_queries.log'))
+
+from backend.blueprints.ai_interview import fallback_evaluation  # noqa: E402
+from backend.blueprints.dashboard import compute_streak  # noqa: E402
+from backend.blueprints.mock import parse_sqlite_ts  # noqa: E402
+from backend.services import question_bank, roadmap_renderer  # noqa: E402
+
+
+# --- Input builders (n -> callable under test) ---------------------------------------
+
+def case_load_questions(n):
+    """load_questions() on a question bank of n entries"""
+    with open(question_bank.QUESTIONS_PATH, 'r') as f:
+        real = json.load(f)['questions']
+    bank = [dict(real[i % len(real)], id=i + 1) for i in range(n)]
+    path = os.path.join(_workdir, f'questions_{n}.json')
+    with open(path, 'w') as f:
+        json.dump({'questions': bank}, f)
+    return lambda: question_bank.load_questions(path)
+
+
+def case_streak(n):
+    """compute_streak() over n consecutive practice days (worst case: streak == n)"""
+    today = date(2026, 1, 1)
+    dates = [(today - timedelta(days=i)).isoformat() for i in range(n)]
+    return lambda: compute_streak(dates, today)
+
+
+def _roadmap_text(n):
+    levels = ['Foundational', 'Intermediate', 'Advanced']
+    lines = []
+    for i in range(n):
+        if i % 5 == 0:
+            lines.append(f'**{levels[(i // 5) % 3]}**')
+        lines.append(f'* Step {i}: build a **project** using <tools> & measure results')
+    return '\n'.join(lines)
+
+
+def case_roadmap_render(n):
+    """Markdown-to-HTML roadmap conversion of n bullet lines, cache bypassed"""
+    text = _roadmap_text(n)
+
+    def run():
+        renderer = roadmap_renderer.RoadmapRenderer()
+        renderer.feed(text)
+        return renderer.close()
+    return run
+
+
+def case_roadmap_cached(n):
+    """render_roadmap() of n bullet lines when the result is already cached"""
+    text = _roadmap_text(n)
+    roadmap_renderer.render_roadmap(text)
+    return lambda: roadmap_renderer.render_roadmap(text)
+
+
+def case_fallback_score(n):
+    """fallback_evaluation() on an n-character answer"""
+    answer = ('word ' * (n // 5 + 1))[:n]
+    return lambda: fallback_evaluation(answer)
+
+
+def case_parse_ts(n):
+    """parse_sqlite_ts() over n timestamps, 10% in ISO 8601 form"""
+    rng = random.Random(n)
+    stamps = []
+    for i in range(n):
+        ts = f'2026-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d} {rng.randint(0, 23):02d}:{rng.randint(0, 59):02d}:00'
+        stamps.append(ts.replace(' ', 'T') + 'Z' if i % 10 == 0 else ts)
+
+    def run():
+        for ts in stamps:
+            parse_sqlite_ts(ts)
+    return run
+
+
+CASES = {
+    'load_questions': case_load_questions,
+    'streak': case_streak,
+    'roadmap_render': case_roadmap_render,
+    'roadmap_cached': case_roadmap_cached,
+    'fallback_score': case_fallback_score,
+    'parse_sqlite_ts': case_parse_ts,
+}
+
+
+# --- Harness ---------------------------------------------------------------------------
+
+def measure(func, rounds=5, min_time=0.05):
+    """Median seconds per call over several auto-ranged rounds"""
+    timer = timeit.Timer(func)
+    number, _ = timer.autorange()
+    number = max(1, int(number * min_time / 0.2))
+    samples = [t / number for t in timer.repeat(repeat=rounds, number=number)]
+    return statistics.median(samples)
+
+
+def growth_exponent(sizes, seconds):
+    """Least-squares slope of log(time) against log(n)"""
+    xs = [math.log(n) for n in sizes]
+    ys = [math.log(max(t, 1e-12)) for t in seconds]
+    mx, my = statistics.fmean(xs), statistics.fmean(ys)
+    denom = sum((x - mx) ** 2 for x in xs)
+    return sum((x - mx) * (y - my) for x, y in zip(xs, ys)) / denom if denom else 0.0
+
+
+def run(case_names, sizes, rounds):
+    report = {}
+    for name in case_names:
+        timings = {}
+        for n in sizes:
+            timings[str(n)] = measure(CASES[name](n), rounds)
+        report[name] = {
+            'seconds': timings,
+            'exponent': round(growth_exponent(sizes, list(timings.values())), 2),
+        }
+    return report
+
+
+def _fmt(seconds):
+    if seconds < 1e-3:
+        return f'{seconds * 1e6:9.2f}us'
+    return f'{seconds * 1e3:9.2f}ms'
+
+
+def print_report(report, sizes):
+    header = f'{"case":<18}' + ''.join(f'{"n=" + str(n):>13}' for n in sizes) + '   growth'
+    print(header)
+    print('-' * len(header))
+    for name, result in report.items():
+        cells = ''.join(f'{_fmt(result["seconds"][str(n)]):>13}' for n in sizes)
+        print(f'{name:<18}{cells}   n^{result["exponent"]:.2f}')
+
+
+def compare_to_baseline(report, baseline, tolerance):
+    """Regression messages for timings slower than baseline * (1 + tolerance)"""
+    failures = []
+    for name, result in report.items():
+        for size, seconds in result['seconds'].items():
+            before = baseline.get(name, {}).get('seconds', {}).get(size)
+            if before and seconds > before * (1 + tolerance):
+                failures.append(f'{name} n={size}: {_fmt(seconds).strip()} vs baseline {_fmt(before).strip()}')
+    return failures
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--cases', default=','.join(CASES), help='comma-separated subset of: ' + ', '.join(CASES))
+    parser.add_argument('--sizes', default=','.join(map(str, DEFAULT_SIZES)))
+    parser.add_argument('--rounds', type=int, default=5)
+    parser.add_argument('--save-baseline', action='store_true', help=f'write results to {os.path.relpath(BASELINE_PATH, REPO_ROOT)}')
+    parser.add_argument('--compare', action='store_true', help='exit 1 when a timing regresses against the baseline')
+    parser.add_argument('--tolerance', type=float, default=0.5, help='allowed slowdown for --compare')
+    args = parser.parse_args()
+
+    case_names = [c.strip() for c in args.cases.split(',') if c.strip()]
+    unknown = [c for c in case_names if c not in CASES]
+    if unknown:
+        parser.error(f'unknown cases: {", ".join(unknown)}')
+    sizes = [int(s) for s in args.sizes.split(',')]
+
+    report = run(case_names, sizes, args.rounds)
+    print_report(report, sizes)
+
+    if args.save_baseline:
+        os.makedirs(os.path.dirname(BASELINE_PATH), exist_ok=True)
+        with open(BASELINE_PATH, 'w') as f:
+            json.dump(report, f, indent=2, sort_keys=True)
+        print(f'Baseline written to {BASELINE_PATH}')
+    if args.compare:
+        if not os.path.exists(BASELINE_PATH):
+            print(f'No baseline at {BASELINE_PATH}', file=sys.stderr)
+            return 1
+        with open(BASELINE_PATH, 'r') as f:
+            failures = compare_to_baseline(report, json.load(f), args.tolerance)
+        for failure in failures:
+            print(f'REGRESSION {failure}', file=sys.stderr)
+        return 1 if failures else 0
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
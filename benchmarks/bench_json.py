@@ -0,0 +1,72 @@
+"""
+JSON codec micro-benchmark
+Compares stdlib json against backend.services.json_codec on payloads shaped
+like the resume, solution and question-bank responses.
+
+Run from the repository root:
+    python -m benchmarks.bench_json [--number 2000]
+"""
+
+import argparse
+import json
+import os
+import timeit
+
+from backend.services import json_codec
+
+
+def _payloads():
+    base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    with open(os.path.join(base_dir, 'backend', 'data', 'questions.json'), 'r') as f:
+        questions = json.load(f)
+
+    bullets = ''.join(
+        f'<li>Delivered feature {i} reducing p95 latency by {i % 40 + 10}% for 2M users</li>'
+        for i in range(60)
+    )
+    resume = {
+        'ok': True,
+        'result': {
+            'improvements': ['Quantify impact', 'Tighten summary', 'Group skills by domain'],
+            'highlights': [f'Led migration {i} saving ${i * 1000}/month' for i in range(8)],
+            'html': ('<section><h5>Experience</h5><ul>' + bullets + '</ul></section>') * 5,
+        },
+    }
+    solution = {
+        'ok': True,
+        'solution': {
+            'approach': 'Sliding window over the array with a hash map of last positions.',
+            'timeComplexity': 'O(n)',
+            'spaceComplexity': 'O(min(n, k))',
+            'code': '\n'.join(f'    line_{i} = compute(nums[{i}], target)  # step {i}' for i in range(120)),
+            'explanation': 'We extend the window to the right and shrink it from the left. ' * 12,
+        },
+    }
+    return {'resume': resume, 'solution': solution, 'questions': questions}
+
+
+def _bench(fn, number):
+    return min(timeit.repeat(fn, number=number, repeat=5)) / number * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--number', type=int, default=2000, help='iterations per timing run')
+    args = parser.parse_args()
+
+    print(f'json_codec backend: {json_codec.BACKEND}')
+    print(f'{"payload":<10} {"op":<6} {"stdlib us":>10} {"codec us":>10} {"speedup":>8}')
+    for name, obj in _payloads().items():
+        encoded = json.dumps(obj)
+        rows = [
+            ('dumps', lambda: json.dumps(obj), lambda: json_codec.dumps(obj)),
+            ('loads', lambda: json.loads(encoded), lambda: json_codec.loads(encoded)),
+        ]
+        for op, stdlib_fn, codec_fn in rows:
+            stdlib_us = _bench(stdlib_fn, args.number)
+            codec_us = _bench(codec_fn, args.number)
+            print(f'{name:<10} {op:<6} {stdlib_us:>10.2f} {codec_us:>10.2f} {stdlib_us / codec_us:>7.1f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,128 @@
+"""
+Read latency under write load
+Seeds a SQLite file, then runs dashboard-style reads (Attempt.get_user_stats,
+recent attempts) from reader threads while writer threads keep inserting
+attempts. Compares reads on the primary pool in the default rollback journal
+against reads routed through replica_reads() to the WAL + mode=ro pool.
+
+Run from the repository root:
+    python -m benchmarks.bench_read_under_write [--users 200] [--attempts 20000] [--duration 5]
+"""
+
+import argparse
+import os
+import random
+import shutil
+import statistics
+import sys
+import tempfile
+import threading
+import time
+
+MODES = {
+    # name: create_database(read_pool_size=...)
+    'primary': 0,
+    'replica': 4,
+}
+
+
+def _percentile(values, pct):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))] if ordered else 0.0
+
+
+def run_mode(db_path, read_pool_size, users, duration, readers, writers, batch):
+    from backend import storage
+    from backend.models.attempt import Attempt
+
+    database = storage.create_database(f'sqlite:///{db_path}', pool_size=readers + writers,
+                                       read_pool_size=read_pool_size)
+    repo = Attempt(database)
+    stop = threading.Event()
+    latencies, writes, errors = [], [0], []
+    lock = threading.Lock()
+
+    def reader(seed):
+        rng = random.Random(seed)
+        mine = []
+        while not stop.is_set():
+            user_id = rng.randint(1, users)
+            start = time.perf_counter()
+            try:
+                with storage.replica_reads():
+                    repo.get_user_stats(user_id)
+                    repo.recent(user_id, limit=10)
+            except Exception as e:
+                errors.append(repr(e))
+                continue
+            mine.append(time.perf_counter() - start)
+        with lock:
+            latencies.extend(mine)
+
+    def writer(seed):
+        rng = random.Random(seed)
+        while not stop.is_set():
+            try:
+                with database.transaction() as conn:
+                    for _ in range(batch):
+                        database.execute(conn, 'INSERT INTO attempts (user_id, question_id, correct, user_answer) '
+                                               'VALUES (?, ?, ?, ?)',
+                                         (rng.randint(1, users), rng.randint(1, 50), rng.random() < 0.6, 'bench'))
+            except Exception as e:
+                errors.append(repr(e))
+                continue
+            with lock:
+                writes[0] += batch
+
+    threads = [threading.Thread(target=reader, args=(i,)) for i in range(readers)]
+    threads += [threading.Thread(target=writer, args=(1000 + i,)) for i in range(writers)]
+    for t in threads:
+        t.start()
+    time.sleep(duration)
+    stop.set()
+    for t in threads:
+        t.join()
+    database.close()
+    return {
+        'reads': len(latencies),
+        'writes': writes[0],
+        'errors': len(errors),
+        'p50_ms': _percentile(latencies, 50) * 1000,
+        'p95_ms': _percentile(latencies, 95) * 1000,
+        'p99_ms': _percentile(latencies, 99) * 1000,
+        'mean_ms': (statistics.mean(latencies) * 1000) if latencies else 0.0,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--users', type=int, default=200)
+    parser.add_argument('--attempts', type=int, default=20000)
+    parser.add_argument('--duration', type=float, default=5.0, help='seconds per mode')
+    parser.add_argument('--readers', type=int, default=4)
+    parser.add_argument('--writers', type=int, default=2)
+    parser.add_argument('--batch', type=int, default=50, help='inserts per write transaction')
+    args = parser.parse_args()
+
+    from benchmarks.synthetic_data import generate
+
+    workdir = tempfile.mkdtemp(prefix='read_under_write_')
+    try:
+        seed_path = os.path.join(workdir, 'seed.db')
+        generate(seed_path, users=args.users, attempts=args.attempts, verbose=False)
+        print(f'{"mode":<10} {"reads":>8} {"writes":>8} {"errors":>7} {"p50 ms":>8} {"p95 ms":>8} {"p99 ms":>8}')
+        for name, read_pool_size in MODES.items():
+            # A fresh copy each time: WAL mode persists in the file once set
+            db_path = os.path.join(workdir, f'{name}.db')
+            shutil.copyfile(seed_path, db_path)
+            result = run_mode(db_path, read_pool_size, args.users, args.duration,
+                              args.readers, args.writers, args.batch)
+            print(f'{name:<10} {result["reads"]:>8} {result["writes"]:>8} {result["errors"]:>7} '
+                  f'{result["p50_ms"]:>8.2f} {result["p95_ms"]:>8.2f} {result["p99_ms"]:>8.2f}')
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,111 @@
+"""
+Cold-start profile
+Starts fresh interpreters that import an entry point and serve one request,
+reporting the median import and first-request times plus the packages that
+dominate `python -X importtime`. Exits 1 when the median cold start (import
+plus first request) exceeds --budget-ms.
+
+Run from the repository root:
+    python -m benchmarks.bench_startup [--module backend.app] [--runs 5] [--budget-ms 200]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Imports the entry point, then serves GET / through the test client
+_CHILD = '''
+import json, sys, time
+sys.path.insert(0, {root!r})
+start = time.perf_counter()
+module = __import__({module!r}, fromlist=['app'])
+imported = time.perf_counter()
+app = getattr(module, {attr!r})
+status = app.test_client().get('/').status_code
+served = time.perf_counter()
+print(json.dumps({{'import_ms': (imported - start) * 1000, 'first_request_ms': (served - imported) * 1000,
+                   'status': status, 'gemini_sdk_loaded': 'google.generativeai' in sys.modules,
+                   'authlib_loaded': 'authlib' in sys.modules, 'requests_loaded': 'requests' in sys.modules}}))
+'''
+
+
+def _child_env(workdir):
+    env = dict(os.environ)
+    env.update(DATABASE_PATH=os.path.join(workdir, 'startup.db'),
+               SLOW_QUERY_LOG=os.path.join(workdir, 'slow_queries.log'),
+               PYTHONWARNINGS='ignore')
+    # Startup must not depend on the Gemini key being present
+    env.pop('GEMINI_API_KEY', None)
+    return env
+
+
+def time_cold_start(module, attr, env):
+    code = _CHILD.format(root=REPO_ROOT, module=module, attr=attr)
+    out = subprocess.run([sys.executable, '-c', code], env=env, cwd=REPO_ROOT,
+                         capture_output=True, text=True, check=True)
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def framework_floor(env):
+    """Milliseconds to import flask alone, the part no app change can remove"""
+    code = 'import time; t = time.perf_counter(); import flask; print((time.perf_counter() - t) * 1000)'
+    out = subprocess.run([sys.executable, '-c', code], env=env, capture_output=True, text=True, check=True)
+    return float(out.stdout.strip())
+
+
+def import_profile(module, env):
+    """Cumulative import microseconds grouped by top-level package"""
+    out = subprocess.run([sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+                         env=env, cwd=REPO_ROOT, capture_output=True, text=True, check=True)
+    totals = {}
+    for line in out.stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, _, name = line.split(':', 1)[1].split('|')
+        package = name.strip().split('.')[0]
+        totals[package] = totals.get(package, 0) + int(self_us)
+    return sorted(totals.items(), key=lambda item: item[1], reverse=True)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--module', default='backend.app', help='entry point module to import')
+    parser.add_argument('--attr', default='app', help='Flask app attribute on the module')
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--top', type=int, default=12, help='packages to list from the import profile')
+    parser.add_argument('--budget-ms', type=float, default=200.0, help='fail above this median cold start')
+    args = parser.parse_args()
+
+    env = _child_env(tempfile.mkdtemp(prefix='bench-startup-'))
+    runs = [time_cold_start(args.module, args.attr, env) for _ in range(args.runs)]
+    import_ms = statistics.median(r['import_ms'] for r in runs)
+    request_ms = statistics.median(r['first_request_ms'] for r in runs)
+    total_ms = statistics.median(r['import_ms'] + r['first_request_ms'] for r in runs)
+    floor_ms = statistics.median(framework_floor(env) for _ in range(args.runs))
+
+    print(f'{args.module}: import {import_ms:.1f}ms, first request {request_ms:.1f}ms '
+          f'(status {runs[-1]["status"]}), cold start {total_ms:.1f}ms over {args.runs} runs')
+    print(f'Framework floor (import flask): {floor_ms:.1f}ms')
+    print('Loaded at startup: ' + ', '.join(
+        f'{name}={"yes" if runs[-1][key] else "no"}'
+        for name, key in (('google.generativeai', 'gemini_sdk_loaded'), ('authlib', 'authlib_loaded'),
+                          ('requests', 'requests_loaded'))))
+
+    print(f'\n{"package":<28}{"import ms":>10}')
+    for package, micros in import_profile(args.module, env)[:args.top]:
+        print(f'{package:<28}{micros / 1000:>10.1f}')
+
+    if total_ms > args.budget_ms:
+        print(f'\nCold start {total_ms:.1f}ms exceeds budget {args.budget_ms:.0f}ms', file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,108 @@
+"""
+Per-route query budgets
+Runs the hot routes against a scratch SQLite database and fails (exit 1) when
+any of them executes more SQL statements than its budget, or when a statement
+plan does a full table scan. No Gemini calls are made.
+
+Run from the repository root:
+    python -m benchmarks.check_query_budgets [--attempts 200] [--explain]
+"""
+
+import argparse
+import os
+import re
+import sys
+import tempfile
+
+# Budgets are upper bounds on statements per request; lower them when a route gets cheaper.
+ROUTE_BUDGETS = {
+    ('GET', '/dashboard'): 5,
+    # the hot page, + the newest archived month (decides whether the archive can interleave)
+    ('GET', '/feedback'): 2,
+    ('POST', '/mock/end'): 4,
+    # the bank lookup of the batch's question ids, one executemany for the whole batch,
+    # read + upsert each for review_state and user_scores, the lifetime stats
+    ('POST', '/api/attempts/batch'): 7,
+    # at most one read of the user_scores rows changed since the last refresh
+    ('GET', '/api/leaderboard'): 1,
+    # the cache version (the user_scores row), + the attempt columns on a miss
+    ('GET', '/api/analytics'): 2,
+    # the due seek, + MIN(due_at) when nothing is due yet
+    ('GET', '/api/reviews/due'): 2,
+}
+
+# Requested once before measuring: their first request per worker loads an in-memory
+# index with a full read (once a day), which is not the per-request cost
+WARM_ROUTES = {('GET', '/api/leaderboard')}
+
+# Request bodies for routes that need one
+ROUTE_BODIES = {
+    ('POST', '/api/attempts/batch'): {'json': [{'question_id': i % 15 + 1, 'correct': i % 2 == 0} for i in range(50)]},
+}
+
+
+_ALIAS = re.compile(r'\b(?:FROM|JOIN)\s+(\w+)\s+(?:AS\s+)?(\w+)', re.IGNORECASE)
+
+
+def _full_scans(plan, sql=''):
+    # 'SCAN t USING [COVERING] INDEX ...' walks an index; a bare 'SCAN t' reads every row,
+    # unless t (or the view/subquery it aliases) is one the plan MATERIALIZEd or ran as a
+    # CO-ROUTINE (its rows came from the steps above)
+    materialized = {step.split()[1] for step in plan if step.startswith(('MATERIALIZE ', 'CO-ROUTINE '))}
+    aliases = {alias: name for name, alias in _ALIAS.findall(sql)}
+    return [step for step in plan
+            if step.startswith('SCAN ') and 'USING' not in step
+            and step.split()[1] not in materialized and aliases.get(step.split()[1]) not in materialized]
+
+
+def _seed(client, attempts):
+    client.post('/register', data={'name': 'Budget User', 'email': 'budget@example.com', 'password': 'budget-pass'})
+    client.post('/login', data={'email': 'budget@example.com', 'password': 'budget-pass'})
+    for i in range(attempts):
+        client.post('/submit-answer', json={'question_id': i % 15 + 1, 'correct': i % 3 == 0, 'user_answer': 'x'})
+    client.get('/mock')
+    client.post('/mock/submit', json={'question_id': 1, 'user_answer': 'a substantial answer'})
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--attempts', type=int, default=200, help='attempts seeded before measuring')
+    parser.add_argument('--explain', action='store_true', help='print the query plan of every statement')
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix='query-budgets-')
+    os.environ.setdefault('SLOW_QUERY_LOG', os.path.join(workdir, 'slow_queries.log'))
+
+    from backend.factory import create_app
+    from backend.services.query_profiler import capture_queries
+
+    app = create_app({'DATABASE_PATH': os.path.join(workdir, 'budgets.db')})
+
+    client = app.test_client()
+    _seed(client, args.attempts)
+
+    failures = 0
+    for (method, path), budget in ROUTE_BUDGETS.items():
+        if (method, path) in WARM_ROUTES:
+            client.open(path, method=method, **ROUTE_BODIES.get((method, path), {}))
+        with capture_queries(explain_plans=True) as queries:
+            response = client.open(path, method=method, **ROUTE_BODIES.get((method, path), {}))
+        scans = [q for q in queries if _full_scans(q.get('plan', []), q['sql'])]
+        status = 'ok'
+        if len(queries) > budget:
+            status = 'OVER BUDGET'
+        elif scans:
+            status = 'FULL SCAN'
+        if status != 'ok':
+            failures += 1
+        print(f'{method:<5} {path:<20} {response.status_code} queries={len(queries):<3} budget={budget:<3} '
+              f'full-scans={len(scans):<2} {status}')
+        for q in queries if (args.explain or status != 'ok') else []:
+            print(f'    {q["ms"]:>8.3f} ms  {q["sql"]}  {q["params"]}')
+            for step in q.get('plan', []):
+                print(f'                 plan: {step}')
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
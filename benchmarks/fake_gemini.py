@@ -0,0 +1,147 @@
+"""
+Fake Gemini server
+Answers generateContent requests with canned, prompt-appropriate payloads
+after a configurable delay, failing a configurable fraction of calls. Point
+the app at it with GEMINI_API_BASE=http://127.0.0.1:<port>.
+
+Run standalone:
+    python -m benchmarks.fake_gemini --port 8090 --latency-ms 400 --error-rate 0.02
+"""
+
+import argparse
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+ROADMAP_TEXT = '\n'.join([
+    '**Foundational**',
+    '* Master data structures and algorithms',
+    '* Build two CRUD services with tests',
+    '**Intermediate**',
+    '* Design REST APIs with pagination and caching',
+    '* Ship a project behind a load balancer',
+    '**Advanced**',
+    '* Lead a system design review',
+    '* Own on-call for a production service',
+])
+
+
+def _reply_for(prompt):
+    """Pick a canned model reply that matches what the route asked for"""
+    if 'Evaluate the candidate' in prompt:
+        return json.dumps({
+            'correctness': 2, 'clarity': 2, 'depth': 1, 'conciseness': 2, 'score_10': 7,
+            'verdict': 'Pass', 'strengths': ['Clear', 'Structured', 'Relevant'],
+            'improvements': ['Add metrics', 'Mention trade-offs', 'Give an example'],
+            'ideal_answer': 'A strong answer states the approach, trade-offs and an example.'
+        })
+    if 'career roadmap' in prompt:
+        return ROADMAP_TEXT
+    if 'DSA tutor' in prompt:
+        return json.dumps({
+            'approach': 'Hash map of complements.', 'timeComplexity': 'O(n)', 'spaceComplexity': 'O(n)',
+            'code': 'def two_sum(nums, target):\n    seen = {}\n    ...', 'explanation': 'Single pass.'
+        })
+    if 'resume' in prompt.lower() or 'ATS' in prompt:
+        return json.dumps({
+            'improvements': ['Quantify impact'], 'highlights': ['Cut p95 latency by 35%'],
+            'html': '<section><h5>Summary</h5><p>Backend engineer.</p></section>',
+            'ats_score': 78, 'recommendations': [], 'missing_keywords': [], 'formatting_tips': []
+        })
+    if 'question' in prompt:
+        return json.dumps({'question': 'How would you design a rate limiter?', 'topic': 'System Design'})
+    return 'OK'
+
+
+class FakeGeminiServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address, latency_ms=300.0, jitter_ms=100.0, error_rate=0.0, seed=None):
+        super().__init__(address, _Handler)
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.random = random.Random(seed)
+        self.calls = 0
+        self.errors = 0
+        self._lock = threading.Lock()
+
+    @property
+    def base_url(self):
+        host, port = self.server_address[:2]
+        return f'http://{host}:{port}'
+
+    def start(self):
+        """Serve on a daemon thread and return self"""
+        threading.Thread(target=self.serve_forever, daemon=True).start()
+        return self
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send(self, status, body):
+        data = json.dumps(body).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_POST(self):
+        server = self.server
+        length = int(self.headers.get('Content-Length') or 0)
+        raw = self.rfile.read(length) if length else b''
+        with server._lock:
+            server.calls += 1
+            delay = max(0.0, server.random.gauss(server.latency_ms, server.jitter_ms)) / 1000
+            fail = server.random.random() < server.error_rate
+            if fail:
+                server.errors += 1
+        time.sleep(delay)
+
+        if not self.path.endswith(':generateContent'):
+            self._send(404, {'error': {'code': 404, 'message': 'Not found'}})
+            return
+        if fail:
+            self._send(503, {'error': {'code': 503, 'message': 'Injected failure', 'status': 'UNAVAILABLE'}})
+            return
+        try:
+            payload = json.loads(raw or b'{}')
+            prompt = '\n'.join(
+                part.get('text', '')
+                for content in payload.get('contents', [])
+                for part in content.get('parts', [])
+            )
+        except ValueError:
+            self._send(400, {'error': {'code': 400, 'message': 'Invalid JSON payload'}})
+            return
+        self._send(200, {
+            'candidates': [{'content': {'role': 'model', 'parts': [{'text': _reply_for(prompt)}]}}]
+        })
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8090)
+    parser.add_argument('--latency-ms', type=float, default=300.0)
+    parser.add_argument('--jitter-ms', type=float, default=100.0)
+    parser.add_argument('--error-rate', type=float, default=0.0)
+    args = parser.parse_args()
+
+    server = FakeGeminiServer((args.host, args.port), args.latency_ms, args.jitter_ms, args.error_rate)
+    print(f'Fake Gemini listening on {server.base_url}')
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,298 @@
+"""
+Load test harness
+Seeds a scratch SQLite database, starts the app under gunicorn from one of the
+WSGI entry points, points it at a local fake Gemini server and drives
+realistic virtual-user scenarios. Reports throughput and p50/p95/p99 per
+route and can save or compare against a stored baseline.
+
+Run from the repository root (gunicorn must be installed):
+    python -m benchmarks.loadtest --target backend --users 50 --attempts 200 \\
+        --concurrency 16 --duration 30 --save-baseline
+    python -m benchmarks.loadtest --target backend --compare
+"""
+
+import argparse
+import http.cookiejar
+import json
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
+
+from benchmarks import synthetic_data
+from benchmarks.fake_gemini import FakeGeminiServer
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BASELINE_DIR = os.path.join(REPO_ROOT, 'benchmarks', 'baselines')
+
+# Entry points the harness can boot; see wsgi.py and backend/wsgi.py
+TARGETS = {
+    'root': 'wsgi:application',
+    'backend': 'backend.wsgi:app',
+}
+SCENARIO_WEIGHTS = {'practice': 5, 'dashboard': 3, 'ai_interview': 1}
+BENCH_PASSWORD = 'bench-password'
+
+
+def percentile(sorted_values, pct):
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, int(round(pct / 100.0 * len(sorted_values))))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+# --- Database seeding -------------------------------------------------------------
+
+def seed_database(db_path, users, attempts_per_user, seed=7):
+    """Seed realistic users, attempts and mock sessions; returns the login emails"""
+    totals = synthetic_data.generate(db_path, users, users * attempts_per_user,
+                                     password=BENCH_PASSWORD, seed=seed, verbose=False)
+    first = totals['first_user_id']
+    return [f'user{user_id}@synthetic.test' for user_id in range(first, first + users)]
+
+
+# --- HTTP client ----------------------------------------------------------------
+
+class _NoRedirect(urllib.request.HTTPRedirectHandler):
+    def redirect_request(self, req, fp, code, msg, headers, newurl):
+        return None
+
+
+class VirtualUser:
+    def __init__(self, base_url, email, recorder):
+        self.base_url = base_url
+        self.email = email
+        self.recorder = recorder
+        self.opener = urllib.request.build_opener(
+            urllib.request.HTTPCookieProcessor(http.cookiejar.CookieJar()), _NoRedirect()
+        )
+
+    def request(self, method, path, form=None, json_body=None, label=None):
+        headers = {}
+        data = None
+        if form is not None:
+            data = urllib.parse.urlencode(form).encode('utf-8')
+            headers['Content-Type'] = 'application/x-www-form-urlencoded'
+        elif json_body is not None:
+            data = json.dumps(json_body).encode('utf-8')
+            headers['Content-Type'] = 'application/json'
+        req = urllib.request.Request(self.base_url + path, data=data, headers=headers, method=method)
+        start = time.perf_counter()
+        body = b''
+        try:
+            with self.opener.open(req, timeout=60) as resp:
+                status = resp.status
+                body = resp.read()
+        except urllib.error.HTTPError as e:
+            status = e.code
+            body = e.read()
+        except (urllib.error.URLError, OSError):
+            status = 0
+        self.recorder.record(label or f'{method} {path}', time.perf_counter() - start, status)
+        try:
+            return status, json.loads(body) if body[:1] in (b'{', b'[') else None
+        except ValueError:
+            return status, None
+
+    # Scenarios
+
+    def login(self):
+        status, _ = self.request('POST', '/login', form={'email': self.email, 'password': BENCH_PASSWORD})
+        return status == 302
+
+    def practice(self, rng):
+        for _ in range(5):
+            self.request('POST', '/submit-answer', json_body={
+                'question_id': rng.randint(1, 15), 'correct': rng.random() < 0.6, 'user_answer': 'bench answer'
+            })
+
+    def dashboard(self, rng):
+        self.request('GET', '/dashboard')
+        self.request('GET', '/api/stats')
+
+    def ai_interview(self, rng):
+        rounds = 3
+        status, data = self.request('POST', '/api/ai-interview/start', json_body={'questionCount': rounds})
+        if status != 200 or not data:
+            return
+        question = data.get('question') or 'Tell me about yourself.'
+        for _ in range(rounds):
+            status, data = self.request('POST', '/api/ai-interview/answer', json_body={
+                'question': question, 'answer': 'I would use a token bucket per client with Redis.'
+            })
+            if status != 200 or not data or data.get('interview_complete'):
+                break
+            question = data.get('next_question') or question
+
+
+class Recorder:
+    def __init__(self):
+        self.samples = {}
+        self._lock = threading.Lock()
+
+    def record(self, label, elapsed, status):
+        with self._lock:
+            self.samples.setdefault(label, []).append((elapsed, status))
+
+    def summary(self, wall_seconds):
+        report = {}
+        for label, samples in sorted(self.samples.items()):
+            latencies = sorted(s[0] * 1000 for s in samples)
+            errors = sum(1 for s in samples if s[1] == 0 or s[1] >= 400)
+            report[label] = {
+                'count': len(samples),
+                'errors': errors,
+                'rps': round(len(samples) / wall_seconds, 2),
+                'p50_ms': round(percentile(latencies, 50), 2),
+                'p95_ms': round(percentile(latencies, 95), 2),
+                'p99_ms': round(percentile(latencies, 99), 2),
+            }
+        return report
+
+
+# --- Server lifecycle -----------------------------------------------------------
+
+def start_gunicorn(target, port, workers, threads, env):
+    cmd = [
+        sys.executable, '-m', 'gunicorn', '--bind', f'127.0.0.1:{port}',
+        '--workers', str(workers), '--threads', str(threads),
+        '--log-level', 'warning', TARGETS[target]
+    ]
+    proc = subprocess.Popen(cmd, cwd=REPO_ROOT, env=env)
+    deadline = time.time() + 30
+    while time.time() < deadline:
+        if proc.poll() is not None:
+            raise RuntimeError(f'gunicorn exited with code {proc.returncode}')
+        try:
+            with urllib.request.urlopen(f'http://127.0.0.1:{port}/', timeout=2):
+                return proc
+        except (urllib.error.URLError, OSError):
+            time.sleep(0.2)
+    proc.terminate()
+    raise RuntimeError('gunicorn did not become ready within 30s')
+
+
+def run_load(base_url, emails, concurrency, duration, seed):
+    recorder = Recorder()
+    deadline = time.time() + duration
+    scenarios = list(SCENARIO_WEIGHTS)
+    weights = [SCENARIO_WEIGHTS[s] for s in scenarios]
+
+    def worker(index):
+        rng = random.Random(seed + index)
+        user = VirtualUser(base_url, emails[index % len(emails)], recorder)
+        if not user.login():
+            return
+        while time.time() < deadline:
+            getattr(user, rng.choices(scenarios, weights)[0])(rng)
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(concurrency)]
+    start = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return recorder.summary(time.perf_counter() - start)
+
+
+def compare_to_baseline(report, baseline, tolerance):
+    """Return human-readable regressions where p95 grew beyond tolerance"""
+    regressions = []
+    for label, stats in report.items():
+        base = baseline.get('routes', {}).get(label)
+        if not base or not base.get('p95_ms'):
+            continue
+        if stats['p95_ms'] > base['p95_ms'] * (1 + tolerance):
+            regressions.append(f'{label}: p95 {stats["p95_ms"]}ms vs baseline {base["p95_ms"]}ms')
+        if stats['errors'] > base.get('errors', 0) * (1 + tolerance) + 1:
+            regressions.append(f'{label}: {stats["errors"]} errors vs baseline {base.get("errors", 0)}')
+    return regressions
+
+
+def print_report(target, report):
+    total = sum(r['count'] for r in report.values())
+    rps = sum(r['rps'] for r in report.values())
+    print(f'\nTarget {target} ({TARGETS[target]}): {total} requests, {rps:.1f} req/s')
+    print(f'{"route":<34} {"count":>7} {"err":>5} {"rps":>8} {"p50":>8} {"p95":>8} {"p99":>8}')
+    for label, r in report.items():
+        print(f'{label:<34} {r["count"]:>7} {r["errors"]:>5} {r["rps"]:>8.1f} '
+              f'{r["p50_ms"]:>8.1f} {r["p95_ms"]:>8.1f} {r["p99_ms"]:>8.1f}')
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--target', choices=sorted(TARGETS) + ['all'], default='backend')
+    parser.add_argument('--users', type=int, default=20, help='seeded user accounts')
+    parser.add_argument('--attempts', type=int, default=100, help='seeded attempts per user')
+    parser.add_argument('--concurrency', type=int, default=8, help='concurrent virtual users')
+    parser.add_argument('--duration', type=float, default=20.0, help='seconds of load per target')
+    parser.add_argument('--workers', type=int, default=2, help='gunicorn workers')
+    parser.add_argument('--threads', type=int, default=4, help='gunicorn threads per worker')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--gemini-latency-ms', type=float, default=300.0)
+    parser.add_argument('--gemini-jitter-ms', type=float, default=100.0)
+    parser.add_argument('--gemini-error-rate', type=float, default=0.0)
+    parser.add_argument('--seed', type=int, default=7)
+    parser.add_argument('--save-baseline', action='store_true', help='write results to benchmarks/baselines/')
+    parser.add_argument('--compare', action='store_true', help='fail if p95 regresses against the baseline')
+    parser.add_argument('--tolerance', type=float, default=0.25, help='allowed p95 growth for --compare')
+    parser.add_argument('--json', help='also write the raw report to this file')
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix='loadtest-')
+    db_path = os.path.join(workdir, 'loadtest.db')
+    os.environ.setdefault('GEMINI_API_KEY', 'loadtest-key')
+    emails = seed_database(db_path, args.users, args.attempts, args.seed)
+
+    gemini = FakeGeminiServer(('127.0.0.1', 0), args.gemini_latency_ms, args.gemini_jitter_ms,
+                              args.gemini_error_rate, seed=args.seed).start()
+    env = dict(os.environ, DATABASE_PATH=db_path, GEMINI_API_BASE=gemini.base_url,
+               SECRET_KEY='loadtest-secret', SLOW_QUERY_LOG=os.path.join(workdir, 'slow_queries.log'))
+
+    targets = sorted(TARGETS) if args.target == 'all' else [args.target]
+    results = {}
+    exit_code = 0
+    for target in targets:
+        proc = start_gunicorn(target, args.port, args.workers, args.threads, env)
+        try:
+            report = run_load(f'http://127.0.0.1:{args.port}', emails, args.concurrency, args.duration, args.seed)
+        finally:
+            proc.terminate()
+            proc.wait(timeout=15)
+        results[target] = report
+        print_report(target, report)
+
+        baseline_path = os.path.join(BASELINE_DIR, f'{target}.json')
+        if args.compare:
+            if not os.path.exists(baseline_path):
+                print(f'No baseline at {baseline_path}; run with --save-baseline first')
+                exit_code = 1
+            else:
+                with open(baseline_path) as f:
+                    regressions = compare_to_baseline(report, json.load(f), args.tolerance)
+                for line in regressions:
+                    print(f'REGRESSION {line}')
+                exit_code = exit_code or (1 if regressions else 0)
+        if args.save_baseline:
+            os.makedirs(BASELINE_DIR, exist_ok=True)
+            with open(baseline_path, 'w') as f:
+                json.dump({'config': vars(args), 'routes': report}, f, indent=2, sort_keys=True)
+            print(f'Baseline saved to {baseline_path}')
+
+    print(f'\nFake Gemini: {gemini.calls} calls, {gemini.errors} injected errors')
+    gemini.shutdown()
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+    return exit_code
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,231 @@
+"""
+Synthetic data generator
+Bulk-seeds a SQLite database with realistic users, attempts and mock sessions
+for scale-testing dashboard, feedback and mock/end:
+
+- attempts per user follow a power law (a few heavy users, a long tail)
+- practice days come in streak runs separated by gaps, some ending today
+- mock sessions group consecutive attempts; a share are AI interviews whose
+  attempts carry question_id 0 and a JSON evaluation blob like the live route
+
+Rows are streamed through executemany() in large transactions with
+synchronous=OFF and an in-memory journal; attempts indexes are rebuilt once
+at the end, then user_scores and review_state are computed for the new users.
+
+Run from the repository root:
+    python -m benchmarks.synthetic_data --db /tmp/scale.db --users 20000 --attempts 1000000
+"""
+
+import argparse
+import json
+import os
+import random
+import sqlite3
+import time
+from datetime import datetime, timedelta, timezone
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_PASSWORD = 'synthetic-password'
+BATCH_SIZE = 50000
+
+AI_QUESTIONS = [
+    'How would you design a rate limiter?',
+    'Explain the difference between SQL and NoSQL databases.',
+    'Tell me about a time you handled a production incident.',
+    'Design a URL shortening service.',
+]
+
+
+def _question_ids():
+    with open(os.path.join(REPO_ROOT, 'backend', 'data', 'questions.json'), 'r') as f:
+        return [q['id'] for q in json.load(f)['questions']]
+
+
+def power_law_counts(total, users, alpha, rng):
+    """Split total attempts over users with Zipf-like weights (rank ** -alpha)"""
+    weights = [1.0 / (rank ** alpha) for rank in range(1, users + 1)]
+    rng.shuffle(weights)
+    scale = total / sum(weights)
+    counts = [int(w * scale) for w in weights]
+    for i in rng.sample(range(users), total - sum(counts)):
+        counts[i] += 1
+    return counts
+
+
+def active_days(history_days, needed, rng, mean_streak=4.0, mean_gap=3.0, active_today=0.35):
+    """Day offsets (0 = today) on which a user practiced, built from streak runs and gaps.
+
+    Walks back from today and stops once `needed` days exist, so light users
+    look like recent sign-ups rather than sparse year-long histories.
+    """
+    days = []
+    offset = 0 if rng.random() < active_today else 1 + int(rng.expovariate(1 / mean_gap))
+    while offset < history_days and len(days) < needed:
+        run = 1 + int(rng.expovariate(1 / mean_streak))
+        days.extend(range(offset, min(offset + run, history_days)))
+        offset += run + 1 + int(rng.expovariate(1 / mean_gap))
+    return days or [0]
+
+
+def _ts(day, seconds):
+    # Callers stay within the day, so format the date part once per day
+    hours, rest = divmod(seconds, 3600)
+    return f'{_day_prefix(day)} {hours:02d}:{rest // 60:02d}:{rest % 60:02d}'
+
+
+_day_cache = {}
+
+
+def _day_prefix(day):
+    prefix = _day_cache.get(day)
+    if prefix is None:
+        prefix = _day_cache[day] = day.strftime('%Y-%m-%d')
+    return prefix
+
+
+def _ai_answer(question, correct, rng):
+    score = rng.randint(7, 10) if correct else rng.randint(2, 6)
+    return json.dumps({
+        'q': question,
+        'a': 'Synthetic candidate answer covering the main trade-offs.',
+        'feedback': {
+            'score_10': score,
+            'verdict': 'Pass' if score >= 7 else 'Improve',
+            'strengths': ['Structured', 'Relevant'],
+            'improvements': ['Add metrics'],
+        }
+    })
+
+
+def generate(db_path, users=1000, attempts=100000, history_days=365, alpha=1.1,
+             mock_ratio=0.15, ai_ratio=0.3, password=DEFAULT_PASSWORD, seed=1, verbose=True):
+    """Populate db_path; returns a dict of row counts and timings"""
+    started = time.perf_counter()
+    from werkzeug.security import generate_password_hash
+    from backend.db import backfill_trackers, init_db
+
+    init_db(db_path)
+    rng = random.Random(seed)
+    question_ids = _question_ids()
+    now = datetime.now(timezone.utc).replace(tzinfo=None, microsecond=0)
+    today = now.replace(hour=0, minute=0, second=0)
+    # Today's rows stop at the current time: future attempts would skew streaks and due dates
+    seconds_today = int((now - today).total_seconds())
+
+    conn = sqlite3.connect(db_path, isolation_level=None)
+    conn.execute('PRAGMA synchronous = OFF')
+    conn.execute('PRAGMA journal_mode = MEMORY')
+    conn.execute('PRAGMA cache_size = -200000')
+    # Rebuilding indexes once is far cheaper than maintaining them per row
+    conn.execute('DROP INDEX IF EXISTS idx_attempts_user_time')
+
+    first_user_id = (conn.execute('SELECT COALESCE(MAX(id), 0) FROM users').fetchone()[0]) + 1
+    next_session_id = (conn.execute('SELECT COALESCE(MAX(id), 0) FROM mock_sessions').fetchone()[0]) + 1
+    password_hash = generate_password_hash(password)
+
+    conn.execute('BEGIN')
+    conn.executemany(
+        'INSERT INTO users (id, name, email, password_hash, created_at) VALUES (?, ?, ?, ?, ?)',
+        ((first_user_id + i, f'Synthetic User {first_user_id + i}', f'user{first_user_id + i}@synthetic.test',
+          password_hash, _ts(today - timedelta(days=history_days), i % 86000)) for i in range(users))
+    )
+
+    attempt_sql = ('INSERT INTO attempts (user_id, question_id, correct, user_answer, mock_session_id, timestamp) '
+                   'VALUES (?, ?, ?, ?, ?, ?)')
+    session_sql = ('INSERT INTO mock_sessions (id, user_id, start_time, end_time, total_questions, correct_answers) '
+                   'VALUES (?, ?, ?, ?, ?, ?)')
+    attempt_rows, session_rows = [], []
+    totals = {'users': users, 'attempts': 0, 'mock_sessions': 0}
+
+    def flush():
+        conn.executemany(attempt_sql, attempt_rows)
+        conn.executemany(session_sql, session_rows)
+        totals['attempts'] += len(attempt_rows)
+        totals['mock_sessions'] += len(session_rows)
+        attempt_rows.clear()
+        session_rows.clear()
+
+    for index, count in enumerate(power_law_counts(attempts, users, alpha, rng)):
+        if not count:
+            continue
+        user_id = first_user_id + index
+        skill = rng.betavariate(5, 3)
+        practice_days = active_days(history_days, count, rng)
+        days = sorted(rng.choices(practice_days, k=count))
+        remaining = count
+        position = 0
+        while remaining:
+            day = today - timedelta(days=days[position])
+            latest = seconds_today if days[position] == 0 else 24 * 3600 - 1
+            # 08:00-22:00, or from midnight when today is still earlier than that
+            second = rng.randint(8 * 3600 if latest >= 8 * 3600 else 0, min(22 * 3600, latest))
+            if remaining >= 3 and rng.random() < mock_ratio:
+                size = min(remaining, rng.randint(3, 8))
+                ai = rng.random() < ai_ratio
+                session_id = next_session_id
+                next_session_id += 1
+                correct_total = 0
+                for k in range(size):
+                    correct = rng.random() < skill
+                    correct_total += correct
+                    if ai:
+                        question = rng.choice(AI_QUESTIONS)
+                        attempt_rows.append((user_id, 0, correct, _ai_answer(question, correct, rng),
+                                             session_id, _ts(day, min(second + k * 240, latest))))
+                    else:
+                        attempt_rows.append((user_id, rng.choice(question_ids), correct, 'mock answer',
+                                             session_id, _ts(day, min(second + k * 180, latest))))
+                session_rows.append((session_id, user_id, _ts(day, max(second - 30, 0)),
+                                     _ts(day, min(second + size * 240, latest)), size, correct_total))
+            else:
+                size = 1
+                attempt_rows.append((user_id, rng.choice(question_ids), rng.random() < skill,
+                                     'practice answer', None, _ts(day, second)))
+            remaining -= size
+            position += size
+            if len(attempt_rows) >= BATCH_SIZE:
+                flush()
+    flush()
+    conn.execute('COMMIT')
+
+    index_started = time.perf_counter()
+    init_db(db_path)  # recreates the dropped indexes
+    conn.close()
+    # The bulk insert bypassed the trackers, and init_db only backfills empty tables
+    backfill_trackers(db_path, first_user_id)
+    conn = sqlite3.connect(db_path, isolation_level=None)
+    conn.execute('ANALYZE')
+    conn.close()
+
+    totals['load_seconds'] = round(index_started - started, 2)
+    totals['index_seconds'] = round(time.perf_counter() - index_started, 2)
+    totals['first_user_id'] = first_user_id
+    totals['db_bytes'] = os.path.getsize(db_path)
+    if verbose:
+        rate = totals['attempts'] / max(totals['load_seconds'], 1e-9)
+        print(f'Seeded {totals["users"]} users, {totals["attempts"]} attempts, '
+              f'{totals["mock_sessions"]} mock sessions in {totals["load_seconds"]}s '
+              f'({rate:,.0f} attempts/s) + {totals["index_seconds"]}s indexing; '
+              f'{totals["db_bytes"] / 1e6:.1f} MB at {db_path}')
+    return totals
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--db', required=True, help='SQLite file to create or extend')
+    parser.add_argument('--users', type=int, default=1000)
+    parser.add_argument('--attempts', type=int, default=100000, help='total attempts across all users')
+    parser.add_argument('--days', type=int, default=365, help='history length in days')
+    parser.add_argument('--alpha', type=float, default=1.1, help='power-law exponent for attempts per user')
+    parser.add_argument('--mock-ratio', type=float, default=0.15, help='chance a practice block is a mock session')
+    parser.add_argument('--ai-ratio', type=float, default=0.3, help='share of mock sessions that are AI interviews')
+    parser.add_argument('--password', default=DEFAULT_PASSWORD, help='password for every synthetic user')
+    parser.add_argument('--seed', type=int, default=1)
+    args = parser.parse_args()
+
+    generate(args.db, args.users, args.attempts, args.days, args.alpha,
+             args.mock_ratio, args.ai_ratio, args.password, args.seed)
+
+
+if __name__ == '__main__':
+    main()
@@ -8,11 +8,20 @@ let currentQuestion = null;
 let timerInterval = null;
 let sessionStartTime = null;
 
+// Answers waiting to be sent to /api/attempts/batch (kept in localStorage across pages and offline),
+// one buffer per signed-in user: pendingAttempts:<user id> from <body data-user-id>
+const ATTEMPT_BUFFER_PREFIX = 'pendingAttempts';
+const ATTEMPT_SYNC_DELAY_MS = 2000;
+const ATTEMPT_SYNC_MAX = 500;
+let attemptSyncTimer = null;
+let attemptSyncInFlight = false;
+
 // Document ready function
 document.addEventListener('DOMContentLoaded', function() {
     initializeApp();
     initializeMoreDropdown();
     initializeScrollReveal();
+    initializeAttemptSync();
 });
 
 /**
@@ -253,36 +262,142 @@ function endMockInterview() {
 
 /**
  * Submit an answer for a question
+ * Answers are buffered and sent together, so a practice session (or one done
+ * offline) costs one request instead of one per question.
  */
 function submitAnswer(questionId, isCorrect, userAnswer = '') {
-    const data = {
+    queueAttempt(questionId, isCorrect, userAnswer);
+    if (navigator.onLine) {
+        showMessage('Answer saved!', 'success');
+    } else {
+        showMessage('You are offline. Your answer is saved and will sync when you reconnect.', 'info');
+    }
+}
+
+/**
+ * Buffered attempts
+ */
+function attemptBufferKey() {
+    const userId = document.body.dataset.userId;
+    return userId ? `${ATTEMPT_BUFFER_PREFIX}:${userId}` : null;
+}
+
+function loadPendingAttempts() {
+    const key = attemptBufferKey();
+    if (!key) {
+        return [];
+    }
+    try {
+        return JSON.parse(localStorage.getItem(key)) || [];
+    } catch (e) {
+        return [];
+    }
+}
+
+function savePendingAttempts(pending) {
+    const key = attemptBufferKey();
+    if (!key) {
+        return;
+    }
+    try {
+        if (pending.length) {
+            localStorage.setItem(key, JSON.stringify(pending));
+        } else {
+            localStorage.removeItem(key);
+        }
+    } catch (e) {
+        console.error('Could not store pending answers:', e);
+    }
+}
+
+function queueAttempt(questionId, isCorrect, userAnswer = '') {
+    const pending = loadPendingAttempts();
+    pending.push({
         question_id: questionId,
-        correct: isCorrect,
-        user_answer: userAnswer
-    };
-    
-    fetch('/submit-answer', {
+        correct: !!isCorrect,
+        user_answer: userAnswer,
+        answered_at: Date.now()
+    });
+    savePendingAttempts(pending);
+    scheduleAttemptSync();
+}
+
+function scheduleAttemptSync(delay = ATTEMPT_SYNC_DELAY_MS) {
+    clearTimeout(attemptSyncTimer);
+    attemptSyncTimer = setTimeout(syncAttempts, delay);
+}
+
+/**
+ * Send buffered attempts in one request; keeps them on network errors and
+ * drops a batch the server rejects as invalid or no longer accepts for this
+ * user (401, or a redirect to the login page)
+ */
+function syncAttempts() {
+    const batch = loadPendingAttempts().slice(0, ATTEMPT_SYNC_MAX);
+    if (!batch.length || attemptSyncInFlight || !navigator.onLine) {
+        return Promise.resolve();
+    }
+    attemptSyncInFlight = true;
+
+    return fetch('/api/attempts/batch', {
         method: 'POST',
         headers: {
             'Content-Type': 'application/json',
         },
-        body: JSON.stringify(data)
+        body: JSON.stringify({ attempts: batch })
     })
-    .then(response => response.json())
-    .then(data => {
+    .then(response => response.json().catch(() => ({})).then(data => ({
+        status: response.redirected ? 401 : response.status,
+        data: data
+    })))
+    .then(({ status, data }) => {
+        if (data.success || status === 400 || status === 401) {
+            // Answers queued while the request was in flight stay in the buffer
+            savePendingAttempts(loadPendingAttempts().slice(batch.length));
+        }
         if (data.success) {
-            showMessage('Answer submitted successfully!', 'success');
-            
-            // Update statistics if on dashboard
-            updateDashboardStats();
-        } else {
-            showMessage('Failed to submit answer. Please try again.', 'error');
+            applyStats(data.stats);
+            if (loadPendingAttempts().length) {
+                scheduleAttemptSync(0);
+            }
+        } else if (status === 400) {
+            console.error('Discarded invalid answers:', data.errors);
+        } else if (status === 401) {
+            // Never resend them under whoever signs in next
+            console.error('Discarded answers from an expired session');
         }
     })
     .catch(error => {
-        console.error('Error:', error);
-        showMessage('An error occurred. Please try again.', 'error');
+        console.error('Answer sync failed, will retry:', error);
+    })
+    .finally(() => {
+        attemptSyncInFlight = false;
+    });
+}
+
+/**
+ * Last chance to send buffered answers before signing out; the buffer is
+ * cleared either way
+ */
+function flushAttemptsOnLogout() {
+    const pending = loadPendingAttempts().slice(0, ATTEMPT_SYNC_MAX);
+    if (pending.length && navigator.sendBeacon) {
+        navigator.sendBeacon('/api/attempts/batch',
+            new Blob([JSON.stringify({ attempts: pending })], { type: 'application/json' }));
+    }
+    savePendingAttempts([]);
+}
+
+function initializeAttemptSync() {
+    // Buffer from before answers were kept per user: its owner is unknown, so it is never sent
+    localStorage.removeItem(ATTEMPT_BUFFER_PREFIX);
+    document.querySelectorAll('[data-logout]').forEach(link => {
+        link.addEventListener('click', flushAttemptsOnLogout);
     });
+    window.addEventListener('online', () => scheduleAttemptSync(0));
+    if (loadPendingAttempts().length) {
+        scheduleAttemptSync(0);
+    }
 }
 
 /**
@@ -291,27 +406,36 @@ function submitAnswer(questionId, isCorrect, userAnswer = '') {
 function updateDashboardStats() {
     fetch('/api/stats')
     .then(response => response.json())
-    .then(data => {
-        // Update stats on the page
-        const elements = {
-            'total-attempted': data.total_attempted,
-            'correct-answers': data.correct_answers,
-            'accuracy': data.accuracy + '%',
-            'weak-topics': data.weak_topics.length
-        };
-        
-        Object.keys(elements).forEach(id => {
-            const element = document.getElementById(id);
-            if (element) {
-                element.textContent = elements[id];
-            }
-        });
-    })
+    .then(applyStats)
     .catch(error => {
         console.error('Error updating stats:', error);
     });
 }
 
+/**
+ * Write stats (from /api/stats or a batch sync) into the page
+ */
+function applyStats(data) {
+    if (!data) {
+        return;
+    }
+    const elements = {
+        'total-attempted': data.total_attempted,
+        'correct-answers': data.correct_answers,
+        'accuracy': data.accuracy + '%'
+    };
+    if (data.weak_topics) {
+        elements['weak-topics'] = data.weak_topics.length;
+    }
+
+    Object.keys(elements).forEach(id => {
+        const element = document.getElementById(id);
+        if (element) {
+            element.textContent = elements[id];
+        }
+    });
+}
+
 /**
  * Show a message to the user
  */
@@ -0,0 +1,198 @@
+const CalendarUI = (() => {
+  let state = {
+    today: new Date(),
+    cursor: new Date(),
+    items: []
+  };
+
+  // DOM refs
+  const el = {
+    label: () => document.getElementById('calLabel'),
+    cells: () => document.getElementById('cells'),
+    drawer: () => document.getElementById('drawer'),
+    form: () => document.getElementById('form'),
+    id: () => document.getElementById('fId'),
+    title: () => document.getElementById('fTitle'),
+    type: () => document.getElementById('fType'),
+    date: () => document.getElementById('fDate'),
+    time: () => document.getElementById('fTime'),
+    dur: () => document.getElementById('fDur'),
+    notes: () => document.getElementById('fNotes'),
+    delBtn: () => document.getElementById('delBtn'),
+    statTotal: () => document.getElementById('statTotal'),
+    statMonth: () => document.getElementById('statMonth'),
+    statUpcoming: () => document.getElementById('statUpcoming'),
+    statDone: () => document.getElementById('statDone'),
+  };
+
+  // Storage
+  const load = () => {
+    const raw = localStorage.getItem('interviewCalendar');
+    if (raw) state.items = JSON.parse(raw);
+    if (!raw) {
+      state.items = [
+        {id:1,title:'Mock DS&A',type:'mock',date:todayStr(0),time:'14:00',duration:45,notes:'Arrays, DP'},
+        {id:2,title:'AI System Design',type:'ai',date:todayStr(3),time:'11:00',duration:40,notes:'Caching, queues'}
+      ];
+      save();
+    }
+  };
+  const save = () => localStorage.setItem('interviewCalendar', JSON.stringify(state.items));
+  const todayStr = (offsetDays=0) => {
+    const d = new Date(); d.setDate(d.getDate()+offsetDays);
+    return d.toISOString().split('T')[0];
+  };
+
+  // Helpers
+  const fmtDate = (y,m,day) => `${y}-${String(m+1).padStart(2,'0')}-${String(day).padStart(2,'0')}`;
+
+  // Render calendar grid
+  const render = () => {
+    const y = state.cursor.getFullYear();
+    const m = state.cursor.getMonth();
+    const monthNames = ["January","February","March","April","May","June","July","August","September","October","November","December"];
+    el.label().textContent = `${monthNames[m]} ${y}`;
+
+    const first = new Date(y,m,1);
+    const last = new Date(y,m+1,0);
+    const startOffset = first.getDay();
+    const totalDays = last.getDate();
+
+    const host = el.cells();
+    host.innerHTML = '';
+
+    for (let i=0;i<startOffset;i++) host.appendChild(cell(0,true));
+
+    for (let day=1; day<=totalDays; day++){
+      const dateStr = fmtDate(y,m,day);
+      const events = state.items.filter(it => it.date === dateStr);
+      host.appendChild(cell(day,false,events));
+    }
+
+    const need = 42 - host.children.length;
+    for (let i=0;i<need;i++) host.appendChild(cell(0,true));
+
+    updateStats();
+  };
+
+  // Build a day cell
+  const cell = (day, muted=false, events=[]) => {
+    const d = document.createElement('div');
+    d.className = 'cell' + (muted?' muted':'') + (events.length?' has':'');
+    if (!muted) {
+      const y = state.cursor.getFullYear(), m = state.cursor.getMonth();
+      const dateStr = fmtDate(y,m,day);
+      const header = document.createElement('div');
+      header.className = 'day';
+      header.textContent = day;
+      d.appendChild(header);
+
+      const now = new Date();
+      if (y===now.getFullYear() && m===now.getMonth() && day===now.getDate()) d.classList.add('today');
+
+      const maxRows = 3;
+      events.slice(0, maxRows).forEach(ev => {
+        const e = document.createElement('div');
+        e.className = `event ${ev.type}`;
+        e.textContent = `${ev.time} • ${ev.title}`;
+        e.title = `${ev.title} at ${ev.time}`;
+        e.addEventListener('click', (e2) => { e2.stopPropagation(); openDrawer(ev); });
+        d.appendChild(e);
+      });
+      if (events.length > maxRows) {
+        const more = document.createElement('div');
+        more.className = 'more';
+        more.textContent = `+${events.length - maxRows} more`;
+        more.addEventListener('click', (e2) => { e2.stopPropagation(); openDrawer({ date: dateStr }); });
+        d.appendChild(more);
+      }
+
+      d.addEventListener('click', () => openDrawer({ date: dateStr, time: '10:00', duration: 30, type: 'other' }));
+    }
+    return d;
+  };
+
+  // Stats
+  const updateStats = () => {
+    const y = state.cursor.getFullYear();
+    const m = state.cursor.getMonth();
+    const monthCnt = state.items.filter(it => {
+      const d = new Date(it.date);
+      return d.getFullYear()===y && d.getMonth()===m;
+    }).length;
+
+    const today = new Date().toISOString().split('T')[0];
+    const done = state.items.filter(it => it.date < today).length;
+    const upcoming = state.items.filter(it => it.date >= today).length;
+
+    el.statTotal().textContent = state.items.length;
+    el.statMonth().textContent = monthCnt;
+    el.statUpcoming().textContent = upcoming;
+    el.statDone().textContent = done;
+  };
+
+  // Drawer logic
+  const openDrawer = (obj) => {
+    el.form().reset();
+    el.id().value = obj.id || '';
+    el.title().value = obj.title || '';
+    el.type().value = obj.type || 'other';
+    el.date().value = obj.date || new Date().toISOString().split('T')[0];
+    el.time().value = obj.time || '10:00';
+    el.dur().value = obj.duration || 30;
+    el.notes().value = obj.notes || '';
+    el.delBtn().classList.toggle('d-none', !obj.id);
+
+    document.getElementById('drawerTitle').textContent = obj.id ? 'Edit interview' : 'Add interview';
+    el.drawer().classList.add('show');
+  };
+  const closeDrawer = () => el.drawer().classList.remove('show');
+
+  const saveItem = () => {
+    if (!el.form().checkValidity()) { el.form().reportValidity(); return; }
+    const item = {
+      id: el.id().value ? Number(el.id().value) : Date.now(),
+      title: el.title().value.trim(),
+      type: el.type().value,
+      date: el.date().value,
+      time: el.time().value,
+      duration: Number(el.dur().value || 30),
+      notes: el.notes().value.trim()
+    };
+    const idx = state.items.findIndex(i => i.id === item.id);
+    if (idx >= 0) state.items[idx] = item; else state.items.push(item);
+    save(); render(); closeDrawer();
+  };
+
+  const delItem = () => {
+    const id = Number(el.id().value);
+    state.items = state.items.filter(i => i.id !== id);
+    save(); render(); closeDrawer();
+  };
+
+  // Bindings
+  const bind = () => {
+    document.getElementById('prevBtn').addEventListener('click', () => { state.cursor.setMonth(state.cursor.getMonth()-1); render(); });
+    document.getElementById('nextBtn').addEventListener('click', () => { state.cursor.setMonth(state.cursor.getMonth()+1); render(); });
+    document.getElementById('todayBtn').addEventListener('click', () => { state.cursor = new Date(); render(); });
+    document.getElementById('addBtn').addEventListener('click', () => openDrawer({}));
+    document.getElementById('exportBtn').addEventListener('click', exportData);
+    document.getElementById('closeDrawer').addEventListener('click', closeDrawer);
+    document.getElementById('cancelBtn').addEventListener('click', closeDrawer);
+    document.getElementById('saveBtn').addEventListener('click', saveItem);
+    el.delBtn().addEventListener('click', delItem);
+  };
+
+  const exportData = () => {
+    const blob = new Blob([JSON.stringify(state.items,null,2)], {type:'application/json'});
+    const url = URL.createObjectURL(blob);
+    const a = document.createElement('a'); a.href = url; a.download = 'interview-calendar.json'; a.click();
+    URL.revokeObjectURL(url);
+  };
+
+  const init = () => { load(); bind(); render(); };
+
+  return { init };
+})();
+
+document.addEventListener('DOMContentLoaded', CalendarUI.init);
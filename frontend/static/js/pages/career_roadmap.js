@@ -0,0 +1,85 @@
+document.getElementById('roadmapForm').addEventListener('submit', function(e) {
+    e.preventDefault();
+    generateRoadmap();
+});
+
+function generateRoadmap() {
+    const jobRole = document.getElementById('jobRole').value;
+    const experience = document.getElementById('experience').value;
+    const targetCompany = document.getElementById('targetCompany').value;
+    const skills = document.getElementById('skills').value;
+    
+    if (!jobRole || !experience || !targetCompany || !skills) {
+        alert('Please fill in all fields');
+        return;
+    }
+    
+    // Show loading state
+    const submitBtn = document.querySelector('button[type="submit"]');
+    const originalText = submitBtn.innerHTML;
+    submitBtn.innerHTML = '<i class="fas fa-spinner fa-spin me-2"></i>Generating...';
+    submitBtn.disabled = true;
+    
+    // Call backend (Gemini)
+    fetch('/api/roadmap', {
+        method: 'POST',
+        headers: { 'Content-Type': 'application/json' },
+        body: JSON.stringify({
+            jobRole, experience, targetCompany, skills,
+            reuseShared: document.getElementById('reuseShared').checked
+        })
+    })
+    .then(r => r.json())
+    .then(data => {
+        if (data.error) {
+            alert(data.error);
+            return;
+        }
+        showRoadmap(data.html);
+        if (data.artifact_id && !data.cached) {
+            loadRoadmapHistory();
+        }
+    })
+    .catch(err => {
+        alert('Failed to generate roadmap. Please try again.');
+        console.error(err);
+    })
+    .finally(() => {
+        submitBtn.innerHTML = originalText;
+        submitBtn.disabled = false;
+    });
+}
+
+function showRoadmap(html) {
+    const roadmapOutput = document.getElementById('roadmapOutput');
+    const roadmapStages = document.getElementById('roadmapStages');
+    roadmapStages.innerHTML = html;
+    roadmapOutput.style.display = 'block';
+    roadmapOutput.scrollIntoView({ behavior: 'smooth' });
+}
+
+// Saved roadmaps are reloaded from the server store without calling Gemini
+function loadRoadmapHistory() {
+    fetch('/api/artifacts?kind=roadmap')
+        .then(r => r.ok ? r.json() : { artifacts: [] })
+        .then(data => {
+            const select = document.getElementById('roadmapHistory');
+            select.length = 1;
+            (data.artifacts || []).forEach(a => {
+                select.add(new Option(`${a.title} (${a.created_at})`, a.id));
+            });
+            document.getElementById('roadmapHistoryBox').style.display = select.length > 1 ? 'block' : 'none';
+        })
+        .catch(() => {});
+}
+
+document.getElementById('roadmapHistory').addEventListener('change', function() {
+    if (!this.value) return;
+    fetch(`/api/artifacts/${this.value}`)
+        .then(r => r.json())
+        .then(data => { if (data.payload) showRoadmap(data.payload.html); })
+        .catch(err => console.error(err));
+});
+
+loadRoadmapHistory();
+// Client-side generator removed in favor of server API
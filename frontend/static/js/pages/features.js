@@ -0,0 +1,7 @@
+function showComingSoon(feature) {
+    if (typeof showMessage === 'function') {
+        showMessage(`${feature} features are coming soon! Stay tuned for updates.`, 'info');
+    } else {
+        alert(`${feature} features are coming soon! Stay tuned for updates.`);
+    }
+}
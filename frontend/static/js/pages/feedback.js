@@ -0,0 +1,122 @@
+// Filter functionality
+document.addEventListener('DOMContentLoaded', function() {
+    const filterInputs = document.querySelectorAll('input[name="filter"], input[name="type-filter"]');
+    filterInputs.forEach(input => {
+        input.addEventListener('change', filterAttempts);
+    });
+});
+
+function filterAttempts() {
+    const correctFilter = document.querySelector('input[name="filter"]:checked').id;
+    const typeFilter = document.querySelector('input[name="type-filter"]:checked').id;
+    
+    const attempts = document.querySelectorAll('.attempt-card');
+    let visibleCount = 0;
+    
+    attempts.forEach(attempt => {
+        let show = true;
+        
+        // Filter by correctness
+        if (correctFilter === 'correct' && attempt.dataset.correct !== 'true') {
+            show = false;
+        } else if (correctFilter === 'incorrect' && attempt.dataset.correct !== 'false') {
+            show = false;
+        }
+        
+        // Filter by type
+        if (typeFilter !== 'all-types' && attempt.dataset.type !== typeFilter) {
+            show = false;
+        }
+        
+        if (show) {
+            attempt.style.display = 'block';
+            visibleCount++;
+        } else {
+            attempt.style.display = 'none';
+        }
+    });
+    
+    // Show/hide no results message
+    const noResults = document.getElementById('no-results');
+    if (visibleCount === 0) {
+        noResults.style.display = 'block';
+    } else {
+        noResults.style.display = 'none';
+    }
+}
+
+// Toggle collapsible content
+function toggleContent(elementId, button) {
+    const content = document.getElementById(elementId);
+    const icon = button.querySelector('i');
+    
+    if (content.classList.contains('expanded')) {
+        content.classList.remove('expanded');
+        icon.className = 'fas fa-chevron-down me-1';
+        button.innerHTML = '<i class="fas fa-chevron-down me-1"></i>Show full answer';
+    } else {
+        content.classList.add('expanded');
+        icon.className = 'fas fa-chevron-up me-1';
+        button.innerHTML = '<i class="fas fa-chevron-up me-1"></i>Show less';
+    }
+}
+
+// Copy answer to clipboard
+function copyAnswer(answer) {
+    // Clean up the answer text
+    const cleanAnswer = answer.replace(/\\'/g, "'").replace(/\\n/g, '\n');
+    
+    if (navigator.clipboard) {
+        navigator.clipboard.writeText(cleanAnswer).then(function() {
+            showMessage('Model answer copied to clipboard!', 'success');
+        }).catch(function(err) {
+            console.error('Could not copy text: ', err);
+            showMessage('Failed to copy to clipboard', 'error');
+        });
+    } else {
+        // Fallback for older browsers
+        const textArea = document.createElement('textarea');
+        textArea.value = cleanAnswer;
+        document.body.appendChild(textArea);
+        textArea.select();
+        try {
+            document.execCommand('copy');
+            showMessage('Model answer copied to clipboard!', 'success');
+        } catch (err) {
+            showMessage('Failed to copy to clipboard', 'error');
+        }
+        document.body.removeChild(textArea);
+    }
+}
+
+// Enhanced message display
+function showMessage(message, type = 'info') {
+    // Remove existing messages
+    const existingMessages = document.querySelectorAll('.floating-message');
+    existingMessages.forEach(msg => msg.remove());
+    
+    const alertClass = type === 'error' ? 'danger' : type;
+    const messageDiv = document.createElement('div');
+    messageDiv.className = `alert alert-${alertClass} floating-message`;
+    messageDiv.style.cssText = `
+        position: fixed;
+        top: 100px;
+        right: 20px;
+        z-index: 9999;
+        min-width: 300px;
+        box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);
+    `;
+    messageDiv.innerHTML = `
+        ${message}
+        <button type="button" class="btn-close" onclick="this.parentElement.remove()"></button>
+    `;
+    
+    document.body.appendChild(messageDiv);
+    
+    // Auto-dismiss after 3 seconds
+    setTimeout(() => {
+        if (messageDiv.parentNode) {
+            messageDiv.remove();
+        }
+    }, 3000);
+}
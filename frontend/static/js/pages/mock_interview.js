@@ -0,0 +1,348 @@
+
+console.log('mock_interview.html: script block included');
+document.addEventListener('DOMContentLoaded', function() {
+  console.log('mock_interview.html: DOMContentLoaded fired');
+});
+
+// Mock interview JavaScript
+let currentQuestion = null;
+let questionsAnswered = 0;
+let timeRemaining = 30 * 60; // 30 minutes in seconds
+let timerInterval = null;
+let sessionStartTime = new Date();
+
+// Initialize mock interview
+document.addEventListener('DOMContentLoaded', function() {
+    startMockInterview();
+});
+
+function startMockInterview() {
+    // Start timer
+    startTimer(30); // 30 minutes
+    
+    // Load first question
+    loadNextMockQuestion();
+}
+
+function startTimer(durationMinutes) {
+    timeRemaining = durationMinutes * 60;
+    const timerElement = document.getElementById('timer-display');
+    
+    timerInterval = setInterval(function() {
+        const minutes = Math.floor(timeRemaining / 60);
+        const seconds = timeRemaining % 60;
+        
+        timerElement.textContent = `${minutes.toString().padStart(2, '0')}:${seconds.toString().padStart(2, '0')}`;
+        
+        // Change color based on time remaining
+        if (timeRemaining <= 300) { // 5 minutes
+            timerElement.className = 'timer-display time-danger';
+        } else if (timeRemaining <= 600) { // 10 minutes
+            timerElement.className = 'timer-display time-warning';
+        } else {
+            timerElement.className = 'timer-display';
+        }
+        
+        if (timeRemaining <= 0) {
+            clearInterval(timerInterval);
+            endInterview();
+        }
+        
+        timeRemaining--;
+    }, 1000);
+}
+
+function loadNextMockQuestion() {
+  console.log('mock_interview.html: calling /mock/question');
+  fetch('/mock/question')
+    .then(async r => {
+      console.log('mock_interview.html: response status', r.status);
+      let data = null;
+      try { data = await r.json(); } catch (_) { data = null; }
+
+      if (r.ok && data && data.question) {
+        currentQuestion = data.question;
+        displayMockQuestion(data.question);
+      } else {
+        console.warn('mock_interview.html: falling back to local question');
+        const fallback = {
+          id: Date.now() % 1000,
+          type: 'technical',
+          difficulty: 'easy',
+          question: 'Describe the difference between REST and RPC. When would you choose one over the other?',
+          tags: ['apis', 'architecture']
+        };
+        currentQuestion = fallback;
+        displayMockQuestion(fallback);
+        showMessage('Using a fallback question due to a loading issue.', 'warning');
+      }
+
+      // Ensure UI switches out of loading state
+      document.getElementById('loading-state').style.display = 'none';
+      document.getElementById('interview-container').style.display = 'block';
+    })
+    .catch(err => {
+      console.error('mock_interview.html: fetch error', err);
+      const fallback = {
+        id: Date.now() % 1000,
+        type: 'technical',
+        difficulty: 'easy',
+        question: 'What is a closure in JavaScript and why is it useful?',
+        tags: ['javascript', 'functions']
+      };
+      currentQuestion = fallback;
+      displayMockQuestion(fallback);
+      document.getElementById('loading-state').style.display = 'none';
+      document.getElementById('interview-container').style.display = 'block';
+      showMessage('Network error. Showing a fallback question.', 'warning');
+    });
+}
+
+
+function displayMockQuestion(question) {
+    const questionDisplay = document.getElementById('question-display');
+    
+    const difficultyColors = {
+        'easy': 'success',
+        'medium': 'warning',
+        'hard': 'danger'
+    };
+    
+    const typeColors = {
+        'technical': 'primary',
+        'behavioral': 'success'
+    };
+    
+    const typeIcons = {
+        'technical': 'code',
+        'behavioral': 'comments'
+    };
+    
+    const questionHtml = `
+        <div class="question-header mb-4">
+            <div class="d-flex justify-content-between align-items-start mb-3">
+                <div class="d-flex gap-2">
+                    <span class="badge bg-${typeColors[question.type]} fs-6">
+                        <i class="fas fa-${typeIcons[question.type]} me-1"></i>
+                        ${question.type.charAt(0).toUpperCase() + question.type.slice(1)}
+                    </span>
+                    <span class="badge bg-${difficultyColors[question.difficulty]} fs-6">
+                        <i class="fas fa-signal me-1"></i>
+                        ${question.difficulty.charAt(0).toUpperCase() + question.difficulty.slice(1)}
+                    </span>
+                </div>
+                <small class="text-muted">Question #${question.id}</small>
+            </div>
+            
+            <h3 class="question-text">${question.question}</h3>
+            
+            ${question.tags ? `
+                <div class="mt-3">
+                    <small class="text-muted">Topics: </small>
+                    ${question.tags.map(tag => `<span class="badge bg-light text-dark me-1">${tag}</span>`).join('')}
+                </div>
+            ` : ''}
+        </div>
+    `;
+    
+    questionDisplay.innerHTML = questionHtml;
+    
+    // Clear previous answer
+    document.getElementById('user-answer').value = '';
+    document.getElementById('user-answer').focus();
+}
+
+function submitAnswer() {
+    if (!currentQuestion) return;
+    
+    const userAnswer = document.getElementById('user-answer').value.trim();
+    
+    if (userAnswer.length < 10) {
+        showMessage('Please provide a more detailed answer (at least 10 characters)', 'warning');
+        return;
+    }
+    
+    // Disable submit button to prevent double submission
+    const submitBtn = document.getElementById('submit-btn');
+    const skipBtn = document.getElementById('skip-btn');
+    submitBtn.disabled = true;
+    skipBtn.disabled = true;
+    submitBtn.innerHTML = '<i class="fas fa-spinner fa-spin me-2"></i>Submitting...';
+    
+    // Calculate time taken for this question
+    const timeTaken = 30 * 60 - timeRemaining;
+    
+    fetch('/mock/submit', {
+        method: 'POST',
+        headers: {
+            'Content-Type': 'application/json',
+        },
+        body: JSON.stringify({
+            question_id: currentQuestion.id,
+            user_answer: userAnswer,
+            time_taken: timeTaken
+        })
+    })
+    .then(response => response.json())
+    .then(data => {
+        if (data.success) {
+            questionsAnswered = data.questions_answered;
+            updateProgress();
+            
+            // Load next question after a brief delay
+            setTimeout(() => {
+                loadNextMockQuestion();
+                // Re-enable buttons
+                submitBtn.disabled = false;
+                skipBtn.disabled = false;
+                submitBtn.innerHTML = '<i class="fas fa-check me-2"></i>Submit & Next';
+            }, 1000);
+        } else {
+            showMessage('Failed to submit answer', 'error');
+            submitBtn.disabled = false;
+            skipBtn.disabled = false;
+            submitBtn.innerHTML = '<i class="fas fa-check me-2"></i>Submit & Next';
+        }
+    })
+    .catch(error => {
+        console.error('Error:', error);
+        showMessage('Error submitting answer', 'error');
+        submitBtn.disabled = false;
+        skipBtn.disabled = false;
+        submitBtn.innerHTML = '<i class="fas fa-check me-2"></i>Submit & Next';
+    });
+}
+
+function skipQuestion() {
+    if (!currentQuestion) return;
+    
+    // Submit empty answer
+    const submitBtn = document.getElementById('submit-btn');
+    const skipBtn = document.getElementById('skip-btn');
+    skipBtn.disabled = true;
+    submitBtn.disabled = true;
+    skipBtn.innerHTML = '<i class="fas fa-spinner fa-spin me-2"></i>Skipping...';
+    
+    fetch('/mock/submit', {
+        method: 'POST',
+        headers: {
+            'Content-Type': 'application/json',
+        },
+        body: JSON.stringify({
+            question_id: currentQuestion.id,
+            user_answer: '',
+            time_taken: 0
+        })
+    })
+    .then(response => response.json())
+    .then(data => {
+        if (data.success) {
+            questionsAnswered = data.questions_answered;
+            updateProgress();
+            loadNextMockQuestion();
+            
+            // Re-enable buttons
+            submitBtn.disabled = false;
+            skipBtn.disabled = false;
+            skipBtn.innerHTML = '<i class="fas fa-forward me-2"></i>Skip Question';
+        }
+    })
+    .catch(error => {
+        console.error('Error:', error);
+        showMessage('Error skipping question', 'error');
+        submitBtn.disabled = false;
+        skipBtn.disabled = false;
+        skipBtn.innerHTML = '<i class="fas fa-forward me-2"></i>Skip Question';
+    });
+}
+
+function updateProgress() {
+    document.getElementById('questions-answered').textContent = questionsAnswered;
+    
+    // Update progress bar (assume max 20 questions for 30 minutes)
+    const maxQuestions = 20;
+    const progressPercentage = Math.min((questionsAnswered / maxQuestions) * 100, 100);
+    document.getElementById('progress-bar').style.width = progressPercentage + '%';
+}
+
+function endInterview() {
+    if (confirm('Are you sure you want to end the interview? Your progress will be saved.')) {
+        clearInterval(timerInterval);
+        
+        // Show completion state
+        document.getElementById('interview-container').style.display = 'none';
+        document.getElementById('complete-state').style.display = 'block';
+        
+        // Submit final results
+        fetch('/mock/end', {
+            method: 'POST',
+            headers: {
+                'Content-Type': 'application/json',
+            }
+        })
+        .then(response => response.json())
+        .then(data => {
+            if (data.success) {
+                // Redirect to results page after a delay
+                setTimeout(() => {
+                    window.location.href = '/mock/results';
+                }, 2000);
+            }
+        })
+        .catch(error => {
+            console.error('Error:', error);
+            setTimeout(() => {
+                window.location.href = '/mock/results';
+            }, 2000);
+        });
+    }
+}
+
+// Keyboard shortcuts
+document.addEventListener('keydown', function(e) {
+    // Ctrl+Enter to submit
+    if (e.ctrlKey && e.key === 'Enter') {
+        submitAnswer();
+    }
+    
+    // Ctrl+S to skip (prevent default save)
+    if (e.ctrlKey && e.key === 's') {
+        e.preventDefault();
+        skipQuestion();
+    }
+});
+
+// Prevent leaving page accidentally
+window.addEventListener('beforeunload', function(e) {
+    if (timerInterval) {
+        e.preventDefault();
+        e.returnValue = '';
+        return '';
+    }
+});
+
+// Utility function to show messages
+function showMessage(message, type = 'info') {
+    const alertClass = type === 'error' ? 'alert-danger' : 
+                      type === 'warning' ? 'alert-warning' : 
+                      type === 'success' ? 'alert-success' : 'alert-info';
+    
+    const alertHtml = `
+        <div class="alert ${alertClass} alert-dismissible fade show" role="alert">
+            ${message}
+            <button type="button" class="btn-close" data-bs-dismiss="alert"></button>
+        </div>
+    `;
+    
+    // Insert at the top of the container
+    const container = document.querySelector('.container');
+    container.insertAdjacentHTML('afterbegin', alertHtml);
+    
+    // Auto-dismiss after 5 seconds
+    setTimeout(() => {
+        const alert = container.querySelector('.alert');
+        if (alert) {
+            alert.remove();
+        }
+    }, 5000);
+}
@@ -0,0 +1,52 @@
+// Score comes from the data-score attribute of this bundle's <script> tag
+const mockScore = Number(document.currentScript.dataset.score);
+
+// Add some interactive elements
+document.addEventListener('DOMContentLoaded', function() {
+    // Animate progress bar
+    const progressBar = document.querySelector('.progress-bar');
+    if (progressBar) {
+        const width = progressBar.style.width;
+        progressBar.style.width = '0%';
+        setTimeout(() => {
+            progressBar.style.transition = 'width 2s ease-in-out';
+            progressBar.style.width = width;
+        }, 500);
+    }
+    
+    // Add confetti effect for high scores
+    const score = mockScore;
+    if (score >= 80) {
+        // Simple confetti effect
+        setTimeout(() => {
+            for (let i = 0; i < 50; i++) {
+                createConfetti();
+            }
+        }, 1000);
+    }
+});
+
+function createConfetti() {
+    const confetti = document.createElement('div');
+    confetti.style.position = 'fixed';
+    confetti.style.width = '10px';
+    confetti.style.height = '10px';
+    confetti.style.backgroundColor = ['#ff0000', '#00ff00', '#0000ff', '#ffff00', '#ff00ff'][Math.floor(Math.random() * 5)];
+    confetti.style.left = Math.random() * window.innerWidth + 'px';
+    confetti.style.top = '-10px';
+    confetti.style.zIndex = '9999';
+    confetti.style.borderRadius = '50%';
+    document.body.appendChild(confetti);
+    
+    const animation = confetti.animate([
+        { transform: 'translateY(-10px) rotate(0deg)', opacity: 1 },
+        { transform: `translateY(${window.innerHeight + 10}px) rotate(360deg)`, opacity: 0 }
+    ], {
+        duration: 3000,
+        easing: 'cubic-bezier(0.25, 0.46, 0.45, 0.94)'
+    });
+    
+    animation.addEventListener('finish', () => {
+        confetti.remove();
+    });
+}
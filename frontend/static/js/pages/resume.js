@@ -0,0 +1,101 @@
+function showToast(title, msg){
+  const id='simpleToast'; let el=document.getElementById(id);
+  if(!el){ el=document.createElement('div'); el.id=id; el.style.position='fixed'; el.style.right='20px'; el.style.bottom='20px'; el.style.zIndex='1080'; document.body.appendChild(el); }
+  const item=document.createElement('div');
+  item.className='toast align-items-center text-bg-dark border-0 show';
+  item.role='alert'; item.style.minWidth='280px';
+  item.innerHTML=`<div class="d-flex"><div class="toast-body"><strong>${title}</strong><br>${msg}</div><button type="button" class="btn-close btn-close-white me-2 m-auto" data-bs-dismiss="toast"></button></div>`;
+  el.appendChild(item); setTimeout(()=>item.remove(),3000);
+}
+
+function parseJSON(id, fallback){ try{ const v=document.getElementById(id).value.trim(); return v?JSON.parse(v):fallback; }catch(e){ showToast("Parse error", id+": "+e.message); return fallback; } }
+
+document.getElementById('sampleBtn').addEventListener('click', ()=>{
+  document.getElementById('targetRole').value = "Backend Engineer";
+  document.getElementById('seniority').value = "Fresher";
+  document.getElementById('profile').value = JSON.stringify({name:"Ayush",email:"ayush@example.com",phone:"+91-9xxxx",location:"Delhi",linkedin:"https://linkedin.com/in/ayush",github:"https://github.com/ayush",summary:"CS undergrad focused on backend, cloud and ML-driven projects."}, null, 2);
+  document.getElementById('skills').value = JSON.stringify(["Python","Flask","FastAPI","PostgreSQL","Redis","Docker","AWS","GitHub Actions"], null, 2);
+  document.getElementById('experience').value = JSON.stringify([{company:"Finlatics",role:"Backend Intern",start:"06/2024",end:"08/2024",desc:"Implemented REST APIs and caching",impact:"Improved p95 by 35%"}], null, 2);
+  document.getElementById('projects').value = JSON.stringify([{name:"Microplastic Detection",tech:["YOLOv8","Flask"],desc:"Microscopy image CV pipeline",impact:"mAP@50 of 0.95 on test set",links:["https://github.com/..."]},{name:"Agri Yield Platform",tech:["React","Flask","LightGBM","BERT"],desc:"Multilingual advisory & yield prediction",impact:"Reduced input costs by 12% in pilots"}], null, 2);
+  document.getElementById('education').value = JSON.stringify([{degree:"B.Tech CSE",school:"XYZ University",year:"2027",score:"8.7 CGPA"}], null, 2);
+});
+
+document.getElementById('buildBtn').addEventListener('click', async ()=>{
+  const btn = document.getElementById('buildBtn');
+  const prev = btn.innerHTML; btn.disabled = true;
+  btn.innerHTML = '<i class="fas fa-spinner fa-spin me-2"></i>Building...';
+  try{
+    const body = {
+      target: document.getElementById('targetRole').value.trim() || "Software Engineer",
+      seniority: document.getElementById('seniority').value || "Fresher",
+      profile: parseJSON('profile', {}),
+      skills: parseJSON('skills', []),
+      experience: parseJSON('experience', []),
+      projects: parseJSON('projects', []),
+      education: parseJSON('education', [])
+    };
+    const res = await fetch('/api/gemini/resume', {
+      method:'POST', headers:{'Content-Type':'application/json'}, body: JSON.stringify(body)
+    });
+    const data = await res.json();
+    if(!data.ok) throw new Error(data.error || "Failed to build");
+    showResume(data.result);
+    if(data.cached) showToast("Loaded saved resume", "Same inputs as a previous build.");
+    else loadResumeHistory();
+  }catch(e){
+    console.error(e); showToast("Resume error", e.message);
+  }finally{
+    btn.innerHTML = prev; btn.disabled = false;
+  }
+});
+
+function showResume(result){
+  // Tips
+  const tipsBox = document.getElementById('tipsBox');
+  const tips = (result.improvements||[]).map(s=>`<li>${s}</li>`).join('');
+  tipsBox.classList.toggle('d-none', tips.length===0);
+  tipsBox.innerHTML = tips? `<ul class="mb-0">${tips}</ul>` : '';
+  // Highlights
+  const hi = (result.highlights||[]).map(s=>`<li>${s}</li>`).join('');
+  document.getElementById('highlights').innerHTML = hi? `<div class="alert alert-secondary"><div class="fw-semibold mb-1">Highlights</div><ul class="mb-0">${hi}</ul></div>` : '';
+  // HTML
+  document.getElementById('resumeHtml').innerHTML = result.html || "<p>No content</p>";
+}
+
+// Saved resumes are reloaded from the server store without calling Gemini
+async function loadResumeHistory(){
+  try{
+    const res = await fetch('/api/artifacts?kind=resume');
+    if(!res.ok) return;
+    const data = await res.json();
+    const select = document.getElementById('resumeHistory');
+    select.length = 1;
+    (data.artifacts||[]).forEach(a => select.add(new Option(`${a.title} (${a.created_at})`, a.id)));
+    document.getElementById('resumeHistoryBox').classList.toggle('d-none', select.length <= 1);
+  }catch(e){ console.error(e); }
+}
+
+document.getElementById('resumeHistory').addEventListener('change', async (e)=>{
+  if(!e.target.value) return;
+  try{
+    const res = await fetch(`/api/artifacts/${e.target.value}`);
+    const data = await res.json();
+    if(data.payload) showResume(data.payload);
+  }catch(err){ showToast("Resume error", err.message); }
+});
+
+loadResumeHistory();
+
+document.getElementById('copyBtn').addEventListener('click', ()=>{
+  const html = document.getElementById('resumeHtml').innerHTML || '';
+  navigator.clipboard.writeText(html).then(()=> showToast("Copied", "Resume HTML copied."));
+});
+
+document.getElementById('pdfBtn').addEventListener('click', ()=>{
+  const w = window.open('', '_blank');
+  const html = document.getElementById('resumeHtml').innerHTML || '';
+  w.document.write(`<html><head><title>Resume</title>
+    <style>body{font-family:Inter,system-ui,Arial;margin:24px} h5{margin:.25rem 0} section{margin-bottom:10px}</style>
+  </head><body>${html}</body></html>`);
+  w.document.close(); w.focus(); w.print();
+});